@@ -57,10 +57,32 @@ if os.path.exists(plugin_path):
         for plugin in plugins:
             packages.append("skydelsdx.plugins." + org + "." + plugin)
 
+# Compile the command serialization modules when Cython is available at build time,
+# e.g. "python3 -m pip install --no-build-isolation ." after installing Cython.
+# The extensions are optional: if they fail to build, the pure Python modules are used.
+# This block is part of the generated file, change the generator along with it.
+ext_modules = []
+try:
+    from Cython.Build import cythonize
+except ImportError:
+    pass
+else:
+    try:
+        ext_modules = cythonize(
+            ["skydelsdx/commandbase.py", "skydelsdx/commandfactory.py"],
+            compiler_directives={"language_level": 3, "annotation_typing": False},
+        )
+    except Exception as e:
+        print("Could not compile the command modules with Cython, using the pure Python modules: " + str(e))
+        ext_modules = []
+    for ext in ext_modules:
+        ext.optional = True
+
 setup(
     name="Skydel SDX",
     version="48",
     packages=packages,
+    ext_modules=ext_modules,
     license="Commercial License",
     long_description="Skydel python module for remote commands"
 )
\ No newline at end of file
@@ -2,12 +2,24 @@
 
 import socket
 import struct
-import time
 from typing import Optional
 
+_U8 = struct.Struct("<B")
+_U16 = struct.Struct("<H")
+_U32 = struct.Struct("<I")
+_I32 = struct.Struct("<i")
+_ECEF = struct.Struct("<ddd")
+_ATT = struct.Struct("<ddd")
+
 
 class Client:
-    def __init__(self, address: str, port: int, use_connection: bool) -> None:
+    def __init__(
+        self,
+        address: str,
+        port: int,
+        use_connection: bool,
+        buffer_size: Optional[int] = None,
+    ) -> None:
         # Create a TCP/IP socket
         self.sock = socket.socket(
             socket.AF_INET, socket.SOCK_STREAM if use_connection else socket.SOCK_DGRAM
@@ -15,14 +27,32 @@ class Client:
         self.server_address = (address, port)
         self.port = port
         self.address = address
+        self.use_connection = use_connection
 
         if use_connection:
+            # Don't let Nagle hold back small command packets
+            self.sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+            if buffer_size is not None:
+                # Must be set before connecting to be used for the TCP window scale
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, buffer_size)
+                self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, buffer_size)
             # Connect the socket to the port where the server is listening
             self.sock.connect(self.server_address)
 
-    def __del__(self) -> None:
-        time.sleep(0.5)
-        self.sock.close()
+    def __enter__(self) -> "Client":
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def close(self) -> None:
+        try:
+            if self.use_connection:
+                self.sock.shutdown(socket.SHUT_RDWR)
+        except OSError:
+            pass  # The server already closed the connection
+        finally:
+            self.sock.close()
 
     def getPort(self) -> int:
         return self.port
@@ -33,34 +63,30 @@ class Client:
     def setTimeout(self, time: Optional[float]):
         self.sock.settimeout(time)
 
-    def _getPacket(self, size: int) -> bytes:
-        packet = self.sock.recv(size)
-        while len(packet) != size:
-            chunk = self.sock.recv(size - len(packet))
-            if len(chunk) == 0:
+    def _getPacketView(self, size: int) -> memoryview:
+        view = memoryview(bytearray(size))
+        received = 0
+        while received < size:
+            count = self.sock.recv_into(view[received:])
+            if count == 0:
                 raise Exception("Server closed connection.")
-            packet = packet + chunk
-        return packet
+            received += count
+        return view
+
+    def _getPacket(self, size: int) -> bytes:
+        return self._getPacketView(size).tobytes()
 
     def _msgId2Packet(self, msgId) -> bytes:
-        return struct.pack("<B", msgId)
+        return _U8.pack(msgId)
 
     def _dynamicType2Packet(self, dynamicType) -> bytes:
-        return struct.pack("<B", dynamicType)
+        return _U8.pack(dynamicType)
 
     def _ecef2Packet(self, triplet) -> bytes:
-        return (
-            struct.pack("<d", triplet.x)
-            + struct.pack("<d", triplet.y)
-            + struct.pack("<d", triplet.z)
-        )
+        return _ECEF.pack(triplet.x, triplet.y, triplet.z)
 
     def _angle2Packet(self, triplet) -> bytes:
-        return (
-            struct.pack("<d", triplet.yaw)
-            + struct.pack("<d", triplet.pitch)
-            + struct.pack("<d", triplet.roll)
-        )
+        return _ATT.pack(triplet.yaw, triplet.pitch, triplet.roll)
 
     def _getPacketMsgId(self) -> int:
-        return struct.unpack("<B", self._getPacket(1))[0]
+        return _U8.unpack(self._getPacket(1))[0]
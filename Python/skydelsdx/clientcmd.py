@@ -1,11 +1,19 @@
 #!/usr/bin/env python3
 
+import socket
 import struct
+from typing import List, Optional, Tuple
 
-from .client import Client
+from .client import _I32, _U8, _U16, _U32, Client
 from .commandfactory import *
 from .commands import *
 
+# Message size (which counts the message id) followed by the message id
+_HEADER = struct.Struct("<HB")
+_MAX_MESSAGE_SIZE = 0xFFFF
+# sendmsg is not available on Windows
+_HAS_SENDMSG = hasattr(socket.socket, "sendmsg")
+
 
 class MsgId:
     Command = 0
@@ -13,52 +21,73 @@ class MsgId:
     ApiVersion = 2
 
 
-class ClientCmd(Client):
-    def __init__(self, address: str, port: int) -> None:
-        Client.__init__(self, address, port, True)
+_API_VERSION_REQUEST = _U8.pack(MsgId.ApiVersion) + _U32.pack(ApiVersion)
+# Packets of other types tolerated before the server answers the version request
+_API_VERSION_MAX_SKIPPED = 16
+
 
-    def _getPacketSize(self) -> int:
-        return struct.unpack("<H", self._getPacket(2))[0]
+class ClientCmd(Client):
+    def __init__(
+        self, address: str, port: int, buffer_size: Optional[int] = None
+    ) -> None:
+        Client.__init__(self, address, port, True, buffer_size)
+
+    def _readHeader(self) -> Tuple[int, int]:
+        return _HEADER.unpack(self._getPacket(_HEADER.size))
+
+    def _sendBuffers(self, buffers: List[bytes]) -> None:
+        if not _HAS_SENDMSG:
+            self.sock.sendall(b"".join(buffers))
+            return
+
+        # Gather the buffers in a single syscall without copying them
+        sent = self.sock.sendmsg(buffers)
+        for buffer in buffers:
+            if sent >= len(buffer):
+                sent -= len(buffer)
+            else:
+                self.sock.sendall(memoryview(buffer)[sent:])
+                sent = 0
 
     def _sendMessage(self, message: bytes) -> None:
-        packet = struct.pack("<H", len(message)) + message
-        self.sock.sendall(packet)
+        if len(message) > _MAX_MESSAGE_SIZE:
+            raise Exception(
+                "Message of %d bytes exceeds the maximum size of %d bytes."
+                % (len(message), _MAX_MESSAGE_SIZE)
+            )
+        self._sendBuffers([_U16.pack(len(message)), message])
 
     def getServerApiVersion(self) -> int:
-        message = self._msgId2Packet(MsgId.ApiVersion) + struct.pack("<I", ApiVersion)
-        self._sendMessage(message)
+        self._sendMessage(_API_VERSION_REQUEST)
 
-        while 1 == 1:
-            msgSize = self._getPacketSize()
-            msgId = self._getPacketMsgId()
+        for _ in range(_API_VERSION_MAX_SKIPPED + 1):
+            msgSize, msgId = self._readHeader()
+            packet = self._getPacket(msgSize - 1)
 
             if msgId == MsgId.ApiVersion:
-                return struct.unpack("<I", self._getPacket(4))[0]
-            else:
-                self._getPacket(msgSize - 1)
+                return _U32.unpack_from(packet, 0)[0]
 
-        assert False, "Unreachable code"
+        raise Exception("Server did not answer the API version request.")
 
     def sendCommand(self, cmd: CommandBase) -> None:
-        json_str = cmd.toJson()
-
-        message = (self._msgId2Packet(MsgId.Command)) + (json_str + "\0").encode(
-            "UTF-8"
-        )
-        self._sendMessage(message)
+        json_bytes = cmd.toJsonBytes()
+        msgSize = len(json_bytes) + 2  # message id and null terminator
+        if msgSize > _MAX_MESSAGE_SIZE:
+            raise Exception(
+                "%s command of %d bytes exceeds the maximum size of %d bytes."
+                % (cmd.getName(), msgSize, _MAX_MESSAGE_SIZE)
+            )
+        header = _HEADER.pack(msgSize, MsgId.Command)
+        self._sendBuffers([header, json_bytes, b"\0"])
 
     def waitCommand(self, cmd: CommandBase) -> CommandResult:
-        while 1 == 1:
-            msgSize = self._getPacketSize()
-            msgId = self._getPacketMsgId()
+        while True:
+            msgSize, msgId = self._readHeader()
+            packet = self._getPacketView(msgSize - 1)  # other packets are skipped
 
             if msgId == MsgId.Result:
-                msg_json_len = struct.unpack("<i", self._getPacket(4))[0]
-                msg_json = self._getPacket(msg_json_len)[:-1]
+                msg_json_len = _I32.unpack_from(packet, 0)[0]
+                msg_json = packet[_I32.size : _I32.size + msg_json_len - 1]
                 result = createCommandResult(msg_json)
                 if cmd.getUuid() == result.getRelatedCommand().getUuid():
                     return result
-            else:
-                self._getPacket(msgSize - 1)  # skip the packet
-
-        assert False, "Unreachable code"
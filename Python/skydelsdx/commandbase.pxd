@@ -0,0 +1,7 @@
+# Declarations applied when commandbase.py is compiled with Cython (see setup.py).
+# The module stays plain Python; without Cython these declarations are unused.
+
+cpdef object obj_hook(dict d)
+cdef object _hookObjects(object value)
+cpdef object loadJson(object jsonStr)
+cdef str _newUuid()
@@ -2,10 +2,18 @@
 
 import datetime
 import json
-import uuid
+import logging
+import os
 from enum import IntFlag
 from typing import Any, Optional, Union
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+_log = logging.getLogger(__name__)
+
 
 class ExecutePermission(IntFlag):
     EXECUTE_IF_IDLE = 1 << 1
@@ -13,21 +21,32 @@ class ExecutePermission(IntFlag):
     EXECUTE_IF_NO_CONFIG = 1 << 3
 
 
+def _encodeDatetime(o: datetime.datetime) -> dict:
+    return {
+        "Spec": "UTC",
+        "Year": o.year,
+        "Month": o.month,
+        "Day": o.day,
+        "Hour": o.hour,
+        "Minute": o.minute,
+        "Second": o.second,
+    }
+
+
+def _encodeDate(o: datetime.date) -> dict:
+    return {"Year": o.year, "Month": o.month, "Day": o.day}
+
+
 class Encoder(json.JSONEncoder):
 
     def default(self, o):
-        if isinstance(o, datetime.datetime):
-            return {
-                "Spec": "UTC",
-                "Year": o.year,
-                "Month": o.month,
-                "Day": o.day,
-                "Hour": o.hour,
-                "Minute": o.minute,
-                "Second": o.second,
-            }
+        encode = _ENCODERS.get(type(o))
+        if encode is not None:
+            return encode(o)
+        elif isinstance(o, datetime.datetime):
+            return _encodeDatetime(o)
         elif isinstance(o, datetime.date):
-            return {"Year": o.year, "Month": o.month, "Day": o.day}
+            return _encodeDate(o)
         elif isinstance(o, CommandBase):
             return o.values
         elif hasattr(o, "__dict__"):
@@ -37,6 +56,9 @@ class Encoder(json.JSONEncoder):
 
 
 class MakeObj:
+    # Values live in the instance __dict__; only the weakref slot is dropped
+    __slots__ = ("__dict__",)
+
     def __init__(self, dict: dict) -> None:
         self.__dict__ = dict
 
@@ -67,16 +89,70 @@ class MakeObj:
         return self.__dict__.items()
 
 
+# Encoders for the exact types most often found in command values
+_ENCODERS = {
+    datetime.datetime: _encodeDatetime,
+    datetime.date: _encodeDate,
+    MakeObj: lambda o: o.__dict__,
+}
+
+
 def obj_hook(d: dict) -> Union[datetime.datetime, datetime.date, MakeObj]:
-    if all(field in d for field in ["Year", "Month", "Day"]):
-        if all(field in d for field in ["Spec", "Hour", "Minute", "Second"]):
+    if "Year" in d and "Month" in d and "Day" in d:
+        if "Spec" in d and "Hour" in d and "Minute" in d and "Second" in d:
             return datetime.datetime(
                 d["Year"], d["Month"], d["Day"], d["Hour"], d["Minute"], d["Second"]
             )
         else:
             return datetime.date(d["Year"], d["Month"], d["Day"])
     else:
-        return MakeObj(d)
+        # Wrap the dict in place without going through MakeObj.__init__
+        obj = MakeObj.__new__(MakeObj)
+        obj.__dict__ = d
+        return obj
+
+
+def _hookObjects(value: Any) -> Any:
+    # Apply obj_hook bottom-up, like json.loads(object_hook=...) does
+    if type(value) is dict:
+        for key, item in value.items():
+            itemType = type(item)
+            if itemType is dict or itemType is list:
+                value[key] = _hookObjects(item)
+        return obj_hook(value)
+    for index, item in enumerate(value):
+        itemType = type(item)
+        if itemType is dict or itemType is list:
+            value[index] = _hookObjects(item)
+    return value
+
+
+def loadJson(jsonStr: str) -> Any:
+    if orjson is None:
+        return json.loads(jsonStr, object_hook=obj_hook)
+    value = orjson.loads(jsonStr)
+    if type(value) is dict or type(value) is list:
+        value = _hookObjects(value)
+    return value
+
+
+if orjson is not None:
+    _ORJSON_DEFAULT = Encoder().default
+    _ORJSON_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_SERIALIZE_NUMPY
+    )
+
+
+_UUID_VARIANT = {digit: "89ab"[int(digit, 16) & 3] for digit in "0123456789abcdef"}
+
+
+def _newUuid() -> str:
+    # Random (version 4) UUID formatted like "{xxxxxxxx-xxxx-4xxx-yxxx-xxxxxxxxxxxx}"
+    h = os.urandom(16).hex()
+    variant = _UUID_VARIANT[h[16]]
+    return f"{{{h[:8]}-{h[8:12]}-4{h[13:16]}-{variant}{h[17:20]}-{h[20:]}}}"
 
 
 class CommandBase:
@@ -84,22 +160,38 @@ class CommandBase:
     CmdUuidKey = "CmdUuid"
     CmdTimestampKey = "CmdTimestamp"
     CmdTargetId = "CmdTargetId"
+    EXECUTE_PERMISSION: int = int(ExecutePermission.EXECUTE_IF_IDLE)
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # Subclasses that still override executePermission() (plugins, older
+        # generated commands) keep their permission; those overrides don't use self
+        if (
+            "executePermission" in cls.__dict__
+            and "EXECUTE_PERMISSION" not in cls.__dict__
+        ):
+            cls.EXECUTE_PERMISSION = cls.executePermission(None)
+        # Store plain ints so permission checks don't go through IntFlag operators
+        cls.EXECUTE_PERMISSION = int(cls.EXECUTE_PERMISSION)
 
     def __init__(
         self, cmd_name: Optional[str] = None, target_id: Optional[str] = None
     ) -> None:
-        self.values = {}
         if cmd_name:
-            self.values[CommandBase.CmdNameKey] = cmd_name
-            self.values[CommandBase.CmdUuidKey] = "{" + uuid.uuid1().urn[9:] + "}"
+            self.values = {
+                CommandBase.CmdNameKey: cmd_name,
+                CommandBase.CmdUuidKey: _newUuid(),
+            }
+        else:
+            self.values = {}
         if target_id:
             self.values[CommandBase.CmdTargetId] = target_id
 
     def executePermission(self) -> "ExecutePermission":
-        return ExecutePermission.EXECUTE_IF_IDLE
+        return ExecutePermission(self.EXECUTE_PERMISSION)
 
     def hasExecutePermission(self, flags: int) -> bool:
-        return (self.executePermission() & flags) == flags
+        return (self.EXECUTE_PERMISSION & flags) == flags
 
     def setTimestamp(self, timestamp):
         self.values[CommandBase.CmdTimestampKey] = timestamp
@@ -117,20 +209,27 @@ class CommandBase:
         return self.values[CommandBase.CmdUuidKey]
 
     def parse(self, jsonStr: str) -> None:
-        print("Parsing", jsonStr)
-        self.values = json.loads(jsonStr, object_hook=obj_hook)
+        _log.debug("Parsing %s", jsonStr)
+        self.values = loadJson(jsonStr)
 
     def toJson(self) -> str:
+        if orjson is not None:
+            return self.toJsonBytes().decode("UTF-8")
         return json.dumps(self.values, cls=Encoder)
 
+    def toJsonBytes(self) -> bytes:
+        if orjson is not None:
+            return orjson.dumps(
+                self.values, default=_ORJSON_DEFAULT, option=_ORJSON_OPTIONS
+            )
+        return json.dumps(self.values, cls=Encoder).encode("UTF-8")
+
     def toString(self) -> str:
-        if len(self.values) == 2:
-            return self.getName() + "()"
-        cmdStr = self.getName() + "("
-        for key, value in self.values.items():
-            if key != CommandBase.CmdNameKey and key != CommandBase.CmdUuidKey:
-                cmdStr += key + ": " + str(value) + ", "
-        return cmdStr[:-2] + ")"
+        skip = (CommandBase.CmdNameKey, CommandBase.CmdUuidKey)
+        parts = [
+            f"{key}: {value}" for key, value in self.values.items() if key not in skip
+        ]
+        return f"{self.getName()}({', '.join(parts)})"
 
     def deprecated(self) -> Optional[str]:
         return None
@@ -0,0 +1,5 @@
+# Declarations applied when commandfactory.py is compiled with Cython (see setup.py).
+# The module stays plain Python; without Cython these declarations are unused.
+
+cpdef object createCommand(object jsonStr)
+cpdef object createCommandResult(object jsonStr)
@@ -1,20 +1,22 @@
 #!/usr/bin/env python3
 
-import json
+import logging
+from functools import lru_cache
 from typing import Any, Union, cast
 
-from .commandbase import CommandBase, obj_hook
+from .commandbase import CommandBase, loadJson
 from .commandresult import CommandResult
 
-
-class Empty:
-    pass
+_log = logging.getLogger(__name__)
 
 
+# Command classes never change once loaded, so name lookups are cached
+@lru_cache(maxsize=1024)
 def classFromName(className: str) -> Any:
     return getattr(getattr(__import__("skydelsdx"), "commands"), className)
 
 
+@lru_cache(maxsize=1024)
 def targetClassFromName(className: str, targetId: str) -> Any:
     attribute = getattr(__import__("skydelsdx"), "plugins")
     for module in targetId.split("."):
@@ -24,25 +26,22 @@ def targetClassFromName(className: str, targetId: str) -> Any:
 
 def createCommand(jsonStr: str) -> CommandBase:
     try:
-        values = json.loads(jsonStr, object_hook=obj_hook)
+        values = loadJson(jsonStr)
     except Exception:
-        print("Failed to parse json {}".format(jsonStr))
+        _log.error("Failed to parse json %s", jsonStr)
         raise
     class_name = values[CommandBase.CmdNameKey]
     if CommandBase.CmdTargetId in values:
         MyClass = targetClassFromName(class_name, values[CommandBase.CmdTargetId])
     else:
         MyClass = classFromName(class_name)
-    command: Union[Empty, CommandBase] = Empty()
-    command.__class__ = MyClass
-    command = cast(CommandBase, command)
+    command: CommandBase = MyClass.__new__(MyClass)
     command.values = values
     return command
 
 
-def createCommandResult(jsonStr: bytes) -> CommandResult:
-    type(jsonStr)
-    commandResult = createCommand(jsonStr.decode("UTF-8"))
+def createCommandResult(jsonStr: Union[bytes, memoryview]) -> CommandResult:
+    commandResult = createCommand(str(jsonStr, "UTF-8"))
     commandResult = cast(CommandResult, commandResult)
     relatedCmdJson = commandResult.values[CommandResult.RelatedCommandKey]
     commandResult.setRelatedCommand(createCommand(relatedCmdJson))
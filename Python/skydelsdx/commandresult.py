@@ -38,14 +38,12 @@ class CommandResult(CommandBase):
         return self.command
 
     def toString(self) -> str:
-        if len(self.values) == 2:
-            return self.getName() + "()"
-        cmdStr = self.getName() + "("
-        for key, value in self.values.items():
-            if (
-                key != CommandBase.CmdNameKey
-                and key != CommandBase.CmdUuidKey
-                and key != CommandResult.RelatedCommandKey
-            ):
-                cmdStr += key + ": " + str(value) + ", "
-        return cmdStr[:-2] + ")"
+        skip = (
+            CommandBase.CmdNameKey,
+            CommandBase.CmdUuidKey,
+            CommandResult.RelatedCommandKey,
+        )
+        parts = [
+            f"{key}: {value}" for key, value in self.values.items() if key not in skip
+        ]
+        return f"{self.getName()}({', '.join(parts)})"
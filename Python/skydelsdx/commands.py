@@ -102,36 +102,33 @@ class FailureResult(CommandResult):
 class UndoCmd(CommandBase):
     """Undo the last command like Ctrl+Z in the UI."""
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "UndoCmd")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 class RedoCmd(CommandBase):
     """Redo the last undone command like Ctrl+Shift+Z in the UI."""
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "RedoCmd")
 
-    def executePermission(self)-> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 class GetDataFolder(CommandBase):
     """Get Skydel's Data Folder. The user can changed it in the GUI's Preferences."""
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_IDLE
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self)->None:
         CommandBase.__init__(self, "GetDataFolder")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_IDLE
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 class DataFolderResult(CommandResult):
     """Result of GetDataFolder."""
@@ -159,16 +156,15 @@ class DataFolderResult(CommandResult):
 class GetVersion(CommandBase):
     """Get Skydel version."""
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_IDLE
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetVersion")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_IDLE
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 class VersionResult(CommandResult):
     """Result of GetVersion."""
@@ -197,12 +193,11 @@ class VersionResult(CommandResult):
 class GetSimulationElapsedTime(CommandBase):
     """Get simulation elapsed time in milliseconds."""
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetSimulationElapsedTime")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
 
 class SimulationElapsedTimeResult(CommandResult):
     """Result of GetSimulationElapsedTime."""
@@ -231,6 +226,10 @@ class SimulationElapsedTimeResult(CommandResult):
 class New(CommandBase):
     """Create a new configuration."""
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, discardCurrentConfig: bool, loadDefaultConfig: Optional[bool]=None) -> None:
         """
         Parameters
@@ -244,11 +243,6 @@ class New(CommandBase):
         self.setDiscardCurrentConfig(discardCurrentConfig)
         self.setLoadDefaultConfig(loadDefaultConfig)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def discardCurrentConfig(self) -> bool:
         return self.get("DiscardCurrentConfig")
 
@@ -265,6 +259,8 @@ class New(CommandBase):
 class SaveAs(CommandBase):
     """Save configuration with new name."""
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, path: str, overwrite: bool) -> None:
         """
         Parameters
@@ -278,9 +274,6 @@ class SaveAs(CommandBase):
         self.setPath(path)
         self.setOverwrite(overwrite)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def path(self) -> str:
         return self.get("Path")
 
@@ -298,16 +291,19 @@ class SaveAs(CommandBase):
 class Save(CommandBase):
     """Save configuration."""
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "Save")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 class Open(CommandBase):
     """Open configuration."""
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, path: str, discardCurrentConfig: bool) -> None:
         """
         Parameters
@@ -321,11 +317,6 @@ class Open(CommandBase):
         self.setPath(path)
         self.setDiscardCurrentConfig(discardCurrentConfig)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def path(self) -> str:
         return self.get("Path")
 
@@ -342,90 +333,82 @@ class Open(CommandBase):
 class SetDefaultConfiguration(CommandBase):
     """Set current configuration as default configuration."""
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "SetDefaultConfiguration")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 class ResetDefaultConfiguration(CommandBase):
     """Reset the default configuration."""
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "ResetDefaultConfiguration")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 class ClearAutomatePage(CommandBase):
     """Clear automate page."""
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "ClearAutomatePage")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 
 class Start(CommandBase):
     """Start the simulation. Simulation may or may not start depending on the current state of the simulator."""
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "Start")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
 
 class Arm(CommandBase):
     """Arm the simulation. Simulation may or may not arm depending on the current state of the simulator."""
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "Arm")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 
 class Pause(CommandBase):
     """Pause vehicle motion during simulation."""
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "Pause")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
 
 
 class Resume(CommandBase):
     """Resume vehicle motion during simulation."""
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "Resume")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
 
 
 class Stop(CommandBase):
     """Stop the simulation."""
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "Stop")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
 
 #
 # Quit/Exit Skydel. Simulation must be stopped to be able to quit Skydel
@@ -438,15 +421,14 @@ class Stop(CommandBase):
 
 class Quit(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, forceQuit):
         CommandBase.__init__(self, "Quit")
         self.setForceQuit(forceQuit)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def forceQuit(self):
         return self.get("ForceQuit")
 
@@ -458,22 +440,20 @@ class Quit(CommandBase):
 class LockGUI(CommandBase):
     """Prevent GUI updates while modify the configuration. Use UnlockGUI when done with configuration modifications."""
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "LockGUI")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 class UnlockGUI(CommandBase):
     """Resume GUI updates and force one update immediately."""
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "UnlockGUI")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Enable (or disable) RF output for specified satellite. Use SV ID 0 to enabled/disable all satellites.
@@ -488,17 +468,16 @@ class UnlockGUI(CommandBase):
 
 class EnableRFOutputForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, system, svId, enabled):
         CommandBase.__init__(self, "EnableRFOutputForSV")
         self.setSystem(system)
         self.setSvId(svId)
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def system(self):
         return self.get("System")
 
@@ -530,14 +509,13 @@ class EnableRFOutputForSV(CommandBase):
 
 class IsRFOutputEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId):
         CommandBase.__init__(self, "IsRFOutputEnabled")
         self.setSystem(system)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -604,16 +582,15 @@ class IsRFOutputEnabledResult(CommandResult):
 
 class EnableRFOutputForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, system, enabled):
         CommandBase.__init__(self, "EnableRFOutputForEachSV")
         self.setSystem(system)
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def system(self):
         return self.get("System")
 
@@ -638,13 +615,12 @@ class EnableRFOutputForEachSV(CommandBase):
 
 class IsRFOutputEnabledForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system):
         CommandBase.__init__(self, "IsRFOutputEnabledForEachSV")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -702,17 +678,16 @@ class IsRFOutputEnabledForEachSVResult(CommandResult):
 
 class EnableSignalForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, signal, svId, enabled):
         CommandBase.__init__(self, "EnableSignalForSV")
         self.setSignal(signal)
         self.setSvId(svId)
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signal(self):
         return self.get("Signal")
 
@@ -748,14 +723,13 @@ class EnableSignalForSV(CommandBase):
 
 class IsSignalEnabledForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal, svId):
         CommandBase.__init__(self, "IsSignalEnabledForSV")
         self.setSignal(signal)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -826,16 +800,15 @@ class IsSignalEnabledForSVResult(CommandResult):
 
 class GetEnabledSignalsForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, system, svId):
         CommandBase.__init__(self, "GetEnabledSignalsForSV")
         self.setSystem(system)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def system(self):
         return self.get("System")
 
@@ -906,16 +879,15 @@ class GetEnabledSignalsForSVResult(CommandResult):
 
 class EnableSignalForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, signal, enabled):
         CommandBase.__init__(self, "EnableSignalForEachSV")
         self.setSignal(signal)
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signal(self):
         return self.get("Signal")
 
@@ -944,13 +916,12 @@ class EnableSignalForEachSV(CommandBase):
 
 class IsSignalEnabledForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal):
         CommandBase.__init__(self, "IsSignalEnabledForEachSV")
         self.setSignal(signal)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -1008,17 +979,16 @@ class IsSignalEnabledForEachSVResult(CommandResult):
 
 class EnablePYCodeForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, signal, svId, enabled):
         CommandBase.__init__(self, "EnablePYCodeForSV")
         self.setSignal(signal)
         self.setSvId(svId)
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signal(self):
         return self.get("Signal")
 
@@ -1050,14 +1020,13 @@ class EnablePYCodeForSV(CommandBase):
 
 class IsPYCodeEnabledForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal, svId):
         CommandBase.__init__(self, "IsPYCodeEnabledForSV")
         self.setSignal(signal)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -1124,16 +1093,15 @@ class IsPYCodeEnabledForSVResult(CommandResult):
 
 class EnablePYCodeForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, signal, enabled):
         CommandBase.__init__(self, "EnablePYCodeForEachSV")
         self.setSignal(signal)
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signal(self):
         return self.get("Signal")
 
@@ -1158,13 +1126,12 @@ class EnablePYCodeForEachSV(CommandBase):
 
 class IsPYCodeEnabledForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal):
         CommandBase.__init__(self, "IsPYCodeEnabledForEachSV")
         self.setSignal(signal)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -1226,6 +1193,8 @@ class IsPYCodeEnabledForEachSVResult(CommandResult):
 
 class SetManualPowerOffsetForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self, system, svId, signalPowerOffsetDict, isRelativePowerOffset):
         CommandBase.__init__(self, "SetManualPowerOffsetForSV")
         self.setSystem(system)
@@ -1233,9 +1202,6 @@ class SetManualPowerOffsetForSV(CommandBase):
         self.setSignalPowerOffsetDict(signalPowerOffsetDict)
         self.setIsRelativePowerOffset(isRelativePowerOffset)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
     def system(self):
         return self.get("System")
 
@@ -1281,15 +1247,14 @@ class SetManualPowerOffsetForSV(CommandBase):
 
 class GetManualPowerOffsetForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self, system, svId, signalArray):
         CommandBase.__init__(self, "GetManualPowerOffsetForSV")
         self.setSystem(system)
         self.setSvId(svId)
         self.setSignalArray(signalArray)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
     def system(self):
         return self.get("System")
 
@@ -1368,13 +1333,12 @@ class GetManualPowerOffsetForSVResult(CommandResult):
 
 class ResetManualPowerOffsets(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self, system):
         CommandBase.__init__(self, "ResetManualPowerOffsets")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
     def system(self):
         return self.get("System")
 
@@ -1395,13 +1359,12 @@ class ResetManualPowerOffsets(CommandBase):
 
 class ResetAllSatPower(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self, system):
         CommandBase.__init__(self, "ResetAllSatPower")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
     def system(self):
         return self.get("System")
 
@@ -1454,15 +1417,14 @@ class SignalPower:
 
 class GetAllPowerForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self, system, svId, signalArray):
         CommandBase.__init__(self, "GetAllPowerForSV")
         self.setSystem(system)
         self.setSvId(svId)
         self.setSignalArray(signalArray)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
     def system(self):
         return self.get("System")
 
@@ -1564,13 +1526,12 @@ class GetAllPowerForSVResult(CommandResult):
 
 class SetSignalFilterAssignation(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signalFilterDict):
         CommandBase.__init__(self, "SetSignalFilterAssignation")
         self.setSignalFilterDict(signalFilterDict)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signalFilterDict(self):
         return self.get("SignalFilterDict")
 
@@ -1596,13 +1557,12 @@ class SetSignalFilterAssignation(CommandBase):
 
 class GetSignalFilterAssignation(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signalArray):
         CommandBase.__init__(self, "GetSignalFilterAssignation")
         self.setSignalArray(signalArray)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -1654,16 +1614,15 @@ class GetSignalFilterAssignationResult(CommandResult):
 
 class ExportPerformanceDataToCSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, path, overwriting):
         CommandBase.__init__(self, "ExportPerformanceDataToCSV")
         self.setPath(path)
         self.setOverwriting(overwriting)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def path(self):
         return self.get("Path")
 
@@ -1689,16 +1648,15 @@ class ExportPerformanceDataToCSV(CommandBase):
 
 class ExportHilGraphDataToCSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, path, overwriting):
         CommandBase.__init__(self, "ExportHilGraphDataToCSV")
         self.setPath(path)
         self.setOverwriting(overwriting)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def path(self):
         return self.get("Path")
 
@@ -1725,14 +1683,13 @@ class ExportHilGraphDataToCSV(CommandBase):
 
 class SetPropagationDelay(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, enabled):
         CommandBase.__init__(self, "SetPropagationDelay")
         self.setSystem(system)
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -1757,13 +1714,12 @@ class SetPropagationDelay(CommandBase):
 
 class IsPropagationDelayEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system):
         CommandBase.__init__(self, "IsPropagationDelayEnabled")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -1817,15 +1773,14 @@ class IsPropagationDelayEnabledResult(CommandResult):
 
 class SetSatMotionFixed(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, isFixed):
         CommandBase.__init__(self, "SetSatMotionFixed")
         self.setSystem(system)
         self.setSvId(svId)
         self.setIsFixed(isFixed)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -1857,14 +1812,13 @@ class SetSatMotionFixed(CommandBase):
 
 class IsSatMotionFixed(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId):
         CommandBase.__init__(self, "IsSatMotionFixed")
         self.setSystem(system)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -1935,14 +1889,13 @@ class IsSatMotionFixedResult(CommandResult):
 
 class SetIonoAlpha(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, index, val):
         CommandBase.__init__(self, "SetIonoAlpha")
         self.setIndex(index)
         self.setVal(val)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def index(self):
         return self.get("Index")
 
@@ -1971,13 +1924,12 @@ class SetIonoAlpha(CommandBase):
 
 class GetIonoAlpha(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, index):
         CommandBase.__init__(self, "GetIonoAlpha")
         self.setIndex(index)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def index(self):
         return self.get("Index")
 
@@ -2034,14 +1986,13 @@ class GetIonoAlphaResult(CommandResult):
 
 class SetIonoBeta(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, index, val):
         CommandBase.__init__(self, "SetIonoBeta")
         self.setIndex(index)
         self.setVal(val)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def index(self):
         return self.get("Index")
 
@@ -2070,13 +2021,12 @@ class SetIonoBeta(CommandBase):
 
 class GetIonoBeta(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, index):
         CommandBase.__init__(self, "GetIonoBeta")
         self.setIndex(index)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def index(self):
         return self.get("Index")
 
@@ -2129,14 +2079,13 @@ class GetIonoBetaResult(CommandResult):
 
 class SetIonoBdgimAlpha(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, index, val):
         CommandBase.__init__(self, "SetIonoBdgimAlpha")
         self.setIndex(index)
         self.setVal(val)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def index(self):
         return self.get("Index")
 
@@ -2161,13 +2110,12 @@ class SetIonoBdgimAlpha(CommandBase):
 
 class GetIonoBdgimAlpha(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, index):
         CommandBase.__init__(self, "GetIonoBdgimAlpha")
         self.setIndex(index)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def index(self):
         return self.get("Index")
 
@@ -2220,14 +2168,13 @@ class GetIonoBdgimAlphaResult(CommandResult):
 
 class SetEffectiveIonisationLevelCoefficient(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, index, val):
         CommandBase.__init__(self, "SetEffectiveIonisationLevelCoefficient")
         self.setIndex(index)
         self.setVal(val)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def index(self):
         return self.get("Index")
 
@@ -2252,13 +2199,12 @@ class SetEffectiveIonisationLevelCoefficient(CommandBase):
 
 class GetEffectiveIonisationLevelCoefficient(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, index):
         CommandBase.__init__(self, "GetEffectiveIonisationLevelCoefficient")
         self.setIndex(index)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def index(self):
         return self.get("Index")
 
@@ -2310,13 +2256,12 @@ class GetEffectiveIonisationLevelCoefficientResult(CommandResult):
 
 class SetIonoModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, model):
         CommandBase.__init__(self, "SetIonoModel")
         self.setModel(model)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def model(self):
         return self.get("Model")
 
@@ -2332,12 +2277,11 @@ class SetIonoModel(CommandBase):
 
 class GetIonoModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetIonoModel")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetIonoModel.
@@ -2375,13 +2319,12 @@ class GetIonoModelResult(CommandResult):
 
 class SetTropoModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, model):
         CommandBase.__init__(self, "SetTropoModel")
         self.setModel(model)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def model(self):
         return self.get("Model")
 
@@ -2397,12 +2340,11 @@ class SetTropoModel(CommandBase):
 
 class GetTropoModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetTropoModel")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetTropoModel.
@@ -2440,13 +2382,12 @@ class GetTropoModelResult(CommandResult):
 
 class SetStartTimeMode(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, mode):
         CommandBase.__init__(self, "SetStartTimeMode")
         self.setMode(mode)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def mode(self):
         return self.get("Mode")
 
@@ -2462,12 +2403,11 @@ class SetStartTimeMode(CommandBase):
 
 class GetStartTimeMode(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetStartTimeMode")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetStartTimeMode.
@@ -2510,6 +2450,12 @@ class GetStartTimeModeResult(CommandResult):
 
 class ConnectSerialPortReceiver(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+        | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         port,
@@ -2527,13 +2473,6 @@ class ConnectSerialPortReceiver(CommandBase):
         self.setStopBits(stopBits)
         self.setFlowControl(flowControl)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-            | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def port(self):
         return self.get("Port")
 
@@ -2579,16 +2518,15 @@ class ConnectSerialPortReceiver(CommandBase):
 
 class DisconnectSerialPortReceiver(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+        | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "DisconnectSerialPortReceiver")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-            | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
 
 #
 # Set the connection parameters to the GPS Receiver from which the simulator will get the simulation start time.
@@ -2606,6 +2544,8 @@ class DisconnectSerialPortReceiver(CommandBase):
 
 class SetGpsTimingReceiver(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(
         self,
         port,
@@ -2623,9 +2563,6 @@ class SetGpsTimingReceiver(CommandBase):
         self.setStopBits(stopBits)
         self.setFlowControl(flowControl)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def port(self):
         return self.get("Port")
 
@@ -2671,12 +2608,11 @@ class SetGpsTimingReceiver(CommandBase):
 
 class GetGpsTimingReceiver(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetGpsTimingReceiver")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetGpsTimingReceiver.
@@ -2763,14 +2699,13 @@ class GetGpsTimingReceiverResult(CommandResult):
 
 class SetNtpServer(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, address, port=None):
         CommandBase.__init__(self, "SetNtpServer")
         self.setAddress(address)
         self.setPort(port)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def address(self):
         return self.get("Address")
 
@@ -2792,12 +2727,11 @@ class SetNtpServer(CommandBase):
 
 class GetNtpServer(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetNtpServer")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetNtpServer.
@@ -2843,13 +2777,12 @@ class GetNtpServerResult(CommandResult):
 
 class EnableNtpClient(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "EnableNtpClient")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -2865,12 +2798,11 @@ class EnableNtpClient(CommandBase):
 
 class IsNtpClientEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsNtpClientEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsNtpClientEnabled.
@@ -2909,13 +2841,12 @@ class IsNtpClientEnabledResult(CommandResult):
 
 class SetStartTimeOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, offset):
         CommandBase.__init__(self, "SetStartTimeOffset")
         self.setOffset(offset)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def offset(self):
         return self.get("Offset")
 
@@ -2932,12 +2863,11 @@ class SetStartTimeOffset(CommandBase):
 
 class GetStartTimeOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetStartTimeOffset")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetStartTimeOffset.
@@ -2975,13 +2905,12 @@ class GetStartTimeOffsetResult(CommandResult):
 
 class SetLeapSecond(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, leapSecond):
         CommandBase.__init__(self, "SetLeapSecond")
         self.setLeapSecond(leapSecond)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def leapSecond(self):
         return self.get("LeapSecond")
 
@@ -3000,13 +2929,12 @@ class SetLeapSecond(CommandBase):
 
 class SetGpsStartTime(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, start):
         CommandBase.__init__(self, "SetGpsStartTime")
         self.setStart(start)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def start(self):
         return self.get("Start")
 
@@ -3022,14 +2950,13 @@ class SetGpsStartTime(CommandBase):
 
 class GetGpsStartTime(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetGpsStartTime")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
 
 #
 # Result of GetGpsStartTime.
@@ -3075,13 +3002,12 @@ class GetGpsStartTimeResult(CommandResult):
 
 class SetDuration(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, second):
         CommandBase.__init__(self, "SetDuration")
         self.setSecond(second)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def second(self):
         return self.get("Second")
 
@@ -3097,12 +3023,11 @@ class SetDuration(CommandBase):
 
 class GetDuration(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetDuration")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetDuration.
@@ -3140,13 +3065,12 @@ class GetDurationResult(CommandResult):
 
 class EnableLogRaw(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "EnableLogRaw")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -3162,12 +3086,11 @@ class EnableLogRaw(CommandBase):
 
 class IsLogRawEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsLogRawEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsLogRawEnabled.
@@ -3207,15 +3130,14 @@ class IsLogRawEnabledResult(CommandResult):
 
 class EnableLogDownlink(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled, beforeEncoding=None, afterEncoding=None):
         CommandBase.__init__(self, "EnableLogDownlink")
         self.setEnabled(enabled)
         self.setBeforeEncoding(beforeEncoding)
         self.setAfterEncoding(afterEncoding)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -3243,12 +3165,11 @@ class EnableLogDownlink(CommandBase):
 
 class IsLogDownlinkEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsLogDownlinkEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsLogDownlinkEnabled.
@@ -3302,13 +3223,12 @@ class IsLogDownlinkEnabledResult(CommandResult):
 
 class EnableLogRinex(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "EnableLogRinex")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -3324,12 +3244,11 @@ class EnableLogRinex(CommandBase):
 
 class IsLogRinexEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsLogRinexEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsLogRinexEnabled.
@@ -3367,13 +3286,12 @@ class IsLogRinexEnabledResult(CommandResult):
 
 class EnableLogHILInput(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "EnableLogHILInput")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -3389,12 +3307,11 @@ class EnableLogHILInput(CommandBase):
 
 class IsLogHILInputEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsLogHILInputEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsLogHILInputEnabled.
@@ -3432,13 +3349,12 @@ class IsLogHILInputEnabledResult(CommandResult):
 
 class SetLogRawRate(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, rate):
         CommandBase.__init__(self, "SetLogRawRate")
         self.setRate(rate)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def rate(self):
         return self.get("Rate")
 
@@ -3454,12 +3370,11 @@ class SetLogRawRate(CommandBase):
 
 class GetLogRawRate(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetLogRawRate")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetLogRawRate.
@@ -3499,14 +3414,13 @@ class LogRawRateResult(CommandResult):
 
 class EnableLogNmea(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled, serialPortEnabled=None):
         CommandBase.__init__(self, "EnableLogNmea")
         self.setEnabled(enabled)
         self.setSerialPortEnabled(serialPortEnabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -3529,12 +3443,11 @@ class EnableLogNmea(CommandBase):
 
 class IsLogNmeaEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsLogNmeaEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsLogNmeaEnabled.
@@ -3580,13 +3493,12 @@ class IsLogNmeaEnabledResult(CommandResult):
 
 class SetLogNmeaRate(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, rate):
         CommandBase.__init__(self, "SetLogNmeaRate")
         self.setRate(rate)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def rate(self):
         return self.get("Rate")
 
@@ -3602,12 +3514,11 @@ class SetLogNmeaRate(CommandBase):
 
 class GetLogNmeaRate(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetLogNmeaRate")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetLogNmeaRate.
@@ -3645,13 +3556,12 @@ class LogNmeaRateResult(CommandResult):
 
 class SetNmeaLoggerSerialPortDelay(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, delay):
         CommandBase.__init__(self, "SetNmeaLoggerSerialPortDelay")
         self.setDelay(delay)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def delay(self):
         return self.get("Delay")
 
@@ -3667,12 +3577,11 @@ class SetNmeaLoggerSerialPortDelay(CommandBase):
 
 class GetNmeaLoggerSerialPortDelay(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetNmeaLoggerSerialPortDelay")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetNmeaLoggerSerialPortDelay.
@@ -3710,15 +3619,14 @@ class GetNmeaLoggerSerialPortDelayResult(CommandResult):
 
 class SetNmeaLoggerSentences(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, sentences):
         CommandBase.__init__(self, "SetNmeaLoggerSentences")
         self.setSentences(sentences)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def sentences(self):
         return self.get("Sentences")
 
@@ -3734,12 +3642,11 @@ class SetNmeaLoggerSentences(CommandBase):
 
 class GetNmeaLoggerSentences(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetNmeaLoggerSentences")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetNmeaLoggerSentences.
@@ -3778,13 +3685,12 @@ class GetNmeaLoggerSentencesResult(CommandResult):
 
 class EnableMainInstanceSync(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "EnableMainInstanceSync")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -3806,13 +3712,12 @@ class EnableMainInstanceSync(CommandBase):
 
 class EnableMasterPps(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "EnableMasterPps")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -3828,14 +3733,13 @@ class EnableMasterPps(CommandBase):
 
 class GetMainInstanceStatus(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetMainInstanceStatus")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Result of GetMainInstanceStatus.
@@ -3890,13 +3794,12 @@ class GetMainInstanceStatusResult(CommandResult):
 
 class EnableWorkerInstanceSync(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "EnableWorkerInstanceSync")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -3918,13 +3821,12 @@ class EnableWorkerInstanceSync(CommandBase):
 
 class EnableSlavePps(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "EnableSlavePps")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -3940,14 +3842,13 @@ class EnableSlavePps(CommandBase):
 
 class GetWorkerInstanceStatus(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetWorkerInstanceStatus")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Result of GetWorkerInstanceStatus.
@@ -4011,15 +3912,14 @@ class GetWorkerInstanceStatusResult(CommandResult):
 
 class SetLeapSecondFuture(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled, seconds, date):
         CommandBase.__init__(self, "SetLeapSecondFuture")
         self.setEnabled(enabled)
         self.setSeconds(seconds)
         self.setDate(date)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -4047,12 +3947,11 @@ class SetLeapSecondFuture(CommandBase):
 
 class GetLeapSecondFuture(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetLeapSecondFuture")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetLeapSecondFuture.
@@ -4106,13 +4005,12 @@ class GetLeapSecondFutureResult(CommandResult):
 
 class EnableSignalStrengthModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "EnableSignalStrengthModel")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -4128,12 +4026,11 @@ class EnableSignalStrengthModel(CommandBase):
 
 class IsSignalStrengthModelEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsSignalStrengthModelEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsSignalStrengthModelEnabled.
@@ -4171,13 +4068,12 @@ class IsSignalStrengthModelEnabledResult(CommandResult):
 
 class EnableElevationMaskBelow(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "EnableElevationMaskBelow")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -4193,12 +4089,11 @@ class EnableElevationMaskBelow(CommandBase):
 
 class IsElevationMaskBelowEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsElevationMaskBelowEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsElevationMaskBelowEnabled.
@@ -4236,13 +4131,12 @@ class IsElevationMaskBelowEnabledResult(CommandResult):
 
 class EnableElevationMaskAbove(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "EnableElevationMaskAbove")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -4258,12 +4152,11 @@ class EnableElevationMaskAbove(CommandBase):
 
 class IsElevationMaskAboveEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsElevationMaskAboveEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsElevationMaskAboveEnabled.
@@ -4301,13 +4194,12 @@ class IsElevationMaskAboveEnabledResult(CommandResult):
 
 class SetElevationMaskBelow(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, angle):
         CommandBase.__init__(self, "SetElevationMaskBelow")
         self.setAngle(angle)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def angle(self):
         return self.get("Angle")
 
@@ -4323,12 +4215,11 @@ class SetElevationMaskBelow(CommandBase):
 
 class GetElevationMaskBelow(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetElevationMaskBelow")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetElevationMaskBelow.
@@ -4366,13 +4257,12 @@ class GetElevationMaskBelowResult(CommandResult):
 
 class SetElevationMaskAbove(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, angle):
         CommandBase.__init__(self, "SetElevationMaskAbove")
         self.setAngle(angle)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def angle(self):
         return self.get("Angle")
 
@@ -4388,12 +4278,11 @@ class SetElevationMaskAbove(CommandBase):
 
 class GetElevationMaskAbove(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetElevationMaskAbove")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetElevationMaskAbove.
@@ -4433,15 +4322,14 @@ class GetElevationMaskAboveResult(CommandResult):
 
 class SetIssueOfData(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, clock, ephemeris, overrideRinex=None):
         CommandBase.__init__(self, "SetIssueOfData")
         self.setClock(clock)
         self.setEphemeris(ephemeris)
         self.setOverrideRinex(overrideRinex)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def clock(self):
         return self.get("Clock")
 
@@ -4469,12 +4357,11 @@ class SetIssueOfData(CommandBase):
 
 class GetIssueOfData(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetIssueOfData")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetIssueOfData.
@@ -4530,15 +4417,14 @@ class GetIssueOfDataResult(CommandResult):
 
 class SetIssueOfDataGalileo(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, navigation, almanac, overrideRinex=None):
         CommandBase.__init__(self, "SetIssueOfDataGalileo")
         self.setNavigation(navigation)
         self.setAlmanac(almanac)
         self.setOverrideRinex(overrideRinex)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def navigation(self):
         return self.get("Navigation")
 
@@ -4566,12 +4452,11 @@ class SetIssueOfDataGalileo(CommandBase):
 
 class GetIssueOfDataGalileo(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetIssueOfDataGalileo")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetIssueOfDataGalileo.
@@ -4627,15 +4512,14 @@ class GetIssueOfDataGalileoResult(CommandResult):
 
 class SetAgeOfDataBeiDou(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, clock, ephemeris, overrideRinex=None):
         CommandBase.__init__(self, "SetAgeOfDataBeiDou")
         self.setClock(clock)
         self.setEphemeris(ephemeris)
         self.setOverrideRinex(overrideRinex)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def clock(self):
         return self.get("Clock")
 
@@ -4663,12 +4547,11 @@ class SetAgeOfDataBeiDou(CommandBase):
 
 class GetAgeOfDataBeiDou(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetAgeOfDataBeiDou")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetAgeOfDataBeiDou.
@@ -4723,14 +4606,13 @@ class GetAgeOfDataBeiDouResult(CommandResult):
 
 class SetIssueOfDataBeiDou(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, clock, ephemeris):
         CommandBase.__init__(self, "SetIssueOfDataBeiDou")
         self.setClock(clock)
         self.setEphemeris(ephemeris)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def clock(self):
         return self.get("Clock")
 
@@ -4752,12 +4634,11 @@ class SetIssueOfDataBeiDou(CommandBase):
 
 class GetIssueOfDataBeiDou(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetIssueOfDataBeiDou")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetIssueOfDataBeiDou.
@@ -4805,15 +4686,14 @@ class GetIssueOfDataBeiDouResult(CommandResult):
 
 class SetIssueOfDataQzss(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, clock, ephemeris, overrideRinex=None):
         CommandBase.__init__(self, "SetIssueOfDataQzss")
         self.setClock(clock)
         self.setEphemeris(ephemeris)
         self.setOverrideRinex(overrideRinex)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def clock(self):
         return self.get("Clock")
 
@@ -4841,12 +4721,11 @@ class SetIssueOfDataQzss(CommandBase):
 
 class GetIssueOfDataQzss(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetIssueOfDataQzss")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetIssueOfDataQzss.
@@ -4901,14 +4780,13 @@ class GetIssueOfDataQzssResult(CommandResult):
 
 class SetIssueOfDataNavIC(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, ephemerisAndClock, overrideRinex=None):
         CommandBase.__init__(self, "SetIssueOfDataNavIC")
         self.setEphemerisAndClock(ephemerisAndClock)
         self.setOverrideRinex(overrideRinex)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def ephemerisAndClock(self):
         return self.get("EphemerisAndClock")
 
@@ -4930,12 +4808,11 @@ class SetIssueOfDataNavIC(CommandBase):
 
 class GetIssueOfDataNavIC(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetIssueOfDataNavIC")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetIssueOfDataNavIC.
@@ -4983,17 +4860,16 @@ class GetIssueOfDataNavICResult(CommandResult):
 
 class SetGpsConfigurationCodeForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, svId, svConfig, dataSetName=None):
         CommandBase.__init__(self, "SetGpsConfigurationCodeForSV")
         self.setSvId(svId)
         self.setSvConfig(svConfig)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -5025,14 +4901,13 @@ class SetGpsConfigurationCodeForSV(CommandBase):
 
 class GetGpsConfigurationCodeForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetGpsConfigurationCodeForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -5099,16 +4974,15 @@ class GetGpsConfigurationCodeForSVResult(CommandResult):
 
 class SetGpsConfigurationForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, svConfigs, dataSetName=None):
         CommandBase.__init__(self, "SetGpsConfigurationForEachSV")
         self.setSvConfigs(svConfigs)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def svConfigs(self):
         return self.get("SvConfigs")
 
@@ -5136,16 +5010,15 @@ class SetGpsConfigurationForEachSV(CommandBase):
 
 class SetGpsSVConfigurationForAllSat(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, svConfigs, dataSetName=None):
         CommandBase.__init__(self, "SetGpsSVConfigurationForAllSat")
         self.setSvConfigs(svConfigs)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def svConfigs(self):
         return self.get("SvConfigs")
 
@@ -5170,13 +5043,12 @@ class SetGpsSVConfigurationForAllSat(CommandBase):
 
 class GetGpsConfigurationForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, dataSetName=None):
         CommandBase.__init__(self, "GetGpsConfigurationForEachSV")
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def dataSetName(self):
         return self.get("DataSetName")
 
@@ -5197,13 +5069,12 @@ class GetGpsConfigurationForEachSV(CommandBase):
 
 class GetGpsSVConfigurationForAllSat(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, dataSetName=None):
         CommandBase.__init__(self, "GetGpsSVConfigurationForAllSat")
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def dataSetName(self):
         return self.get("DataSetName")
 
@@ -5257,17 +5128,16 @@ class GetGpsConfigurationForEachSVResult(CommandResult):
 
 class SetGpsDataHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetGpsDataHealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -5299,14 +5169,13 @@ class SetGpsDataHealthForSV(CommandBase):
 
 class GetGpsDataHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetGpsDataHealthForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -5374,17 +5243,16 @@ class GetGpsDataHealthForSVResult(CommandResult):
 
 class SetGpsSignalHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetGpsSignalHealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -5416,14 +5284,13 @@ class SetGpsSignalHealthForSV(CommandBase):
 
 class GetGpsSignalHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetGpsSignalHealthForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -5492,6 +5359,10 @@ class GetGpsSignalHealthForSVResult(CommandResult):
 
 class SetGalileoDataHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, component, health, dataSetName=None):
         CommandBase.__init__(self, "SetGalileoDataHealthForSV")
         self.setSvId(svId)
@@ -5499,11 +5370,6 @@ class SetGalileoDataHealthForSV(CommandBase):
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -5542,15 +5408,14 @@ class SetGalileoDataHealthForSV(CommandBase):
 
 class GetGalileoDataHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, component, dataSetName=None):
         CommandBase.__init__(self, "GetGalileoDataHealthForSV")
         self.setSvId(svId)
         self.setComponent(component)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -5633,6 +5498,10 @@ class GetGalileoDataHealthForSVResult(CommandResult):
 
 class SetGalileoSignalHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, component, health, dataSetName=None):
         CommandBase.__init__(self, "SetGalileoSignalHealthForSV")
         self.setSvId(svId)
@@ -5640,11 +5509,6 @@ class SetGalileoSignalHealthForSV(CommandBase):
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -5683,15 +5547,14 @@ class SetGalileoSignalHealthForSV(CommandBase):
 
 class GetGalileoSignalHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, component, dataSetName=None):
         CommandBase.__init__(self, "GetGalileoSignalHealthForSV")
         self.setSvId(svId)
         self.setComponent(component)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -5773,17 +5636,16 @@ class GetGalileoSignalHealthForSVResult(CommandResult):
 
 class SetGpsL1HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetGpsL1HealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -5815,14 +5677,13 @@ class SetGpsL1HealthForSV(CommandBase):
 
 class GetGpsL1HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetGpsL1HealthForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -5890,17 +5751,16 @@ class GetGpsL1HealthForSVResult(CommandResult):
 
 class SetGpsL2HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetGpsL2HealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -5932,14 +5792,13 @@ class SetGpsL2HealthForSV(CommandBase):
 
 class GetGpsL2HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetGpsL2HealthForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -6007,17 +5866,16 @@ class GetGpsL2HealthForSVResult(CommandResult):
 
 class SetGpsL5HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetGpsL5HealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -6049,14 +5907,13 @@ class SetGpsL5HealthForSV(CommandBase):
 
 class GetGpsL5HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetGpsL5HealthForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -6124,17 +5981,16 @@ class GetGpsL5HealthForSVResult(CommandResult):
 
 class SetGpsL1cHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetGpsL1cHealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -6166,14 +6022,13 @@ class SetGpsL1cHealthForSV(CommandBase):
 
 class GetGpsL1cHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetGpsL1cHealthForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -6241,17 +6096,16 @@ class GetGpsL1cHealthForSVResult(CommandResult):
 
 class SetGpsAntiSpoofingFlagForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, antiSpoofing, dataSetName=None):
         CommandBase.__init__(self, "SetGpsAntiSpoofingFlagForSV")
         self.setSvId(svId)
         self.setAntiSpoofing(antiSpoofing)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -6283,14 +6137,13 @@ class SetGpsAntiSpoofingFlagForSV(CommandBase):
 
 class GetGpsAntiSpoofingFlagForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetGpsAntiSpoofingFlagForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -6358,17 +6211,16 @@ class GetGpsAntiSpoofingFlagForSVResult(CommandResult):
 
 class SetGpsNavAlertFlagForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, alert, dataSetName=None):
         CommandBase.__init__(self, "SetGpsNavAlertFlagForSV")
         self.setSvId(svId)
         self.setAlert(alert)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -6400,14 +6252,13 @@ class SetGpsNavAlertFlagForSV(CommandBase):
 
 class GetGpsNavAlertFlagForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetGpsNavAlertFlagForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -6475,17 +6326,16 @@ class GetGpsNavAlertFlagForSVResult(CommandResult):
 
 class SetGpsCNavAlertFlagToSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, alert, dataSetName=None):
         CommandBase.__init__(self, "SetGpsCNavAlertFlagToSV")
         self.setSvId(svId)
         self.setAlert(alert)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -6517,14 +6367,13 @@ class SetGpsCNavAlertFlagToSV(CommandBase):
 
 class GetGpsCNavAlertFlagToSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetGpsCNavAlertFlagToSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -6592,17 +6441,16 @@ class GetGpsCNavAlertFlagToSVResult(CommandResult):
 
 class SetBeiDouHealthInfoForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetBeiDouHealthInfoForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -6634,14 +6482,13 @@ class SetBeiDouHealthInfoForSV(CommandBase):
 
 class GetBeiDouHealthInfoForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetBeiDouHealthInfoForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -6709,17 +6556,16 @@ class GetBeiDouHealthInfoForSVResult(CommandResult):
 
 class SetBeiDouAutonomousHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetBeiDouAutonomousHealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -6751,14 +6597,13 @@ class SetBeiDouAutonomousHealthForSV(CommandBase):
 
 class GetBeiDouAutonomousHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetBeiDouAutonomousHealthForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -6826,17 +6671,16 @@ class GetBeiDouAutonomousHealthForSVResult(CommandResult):
 
 class SetBeiDouCNavHealthInfoForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetBeiDouCNavHealthInfoForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -6868,14 +6712,13 @@ class SetBeiDouCNavHealthInfoForSV(CommandBase):
 
 class GetBeiDouCNavHealthInfoForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetBeiDouCNavHealthInfoForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -6943,17 +6786,16 @@ class GetBeiDouCNavHealthInfoForSVResult(CommandResult):
 
 class SetBeiDouHealthStatusForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetBeiDouHealthStatusForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -6985,14 +6827,13 @@ class SetBeiDouHealthStatusForSV(CommandBase):
 
 class GetBeiDouHealthStatusForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetBeiDouHealthStatusForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -7059,16 +6900,15 @@ class GetBeiDouHealthStatusForSVResult(CommandResult):
 
 class SetGlonassEphemerisHealthFlagForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health):
         CommandBase.__init__(self, "SetGlonassEphemerisHealthFlagForSV")
         self.setSvId(svId)
         self.setHealth(health)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -7093,13 +6933,12 @@ class SetGlonassEphemerisHealthFlagForSV(CommandBase):
 
 class GetGlonassEphemerisHealthFlagForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId):
         CommandBase.__init__(self, "GetGlonassEphemerisHealthFlagForSV")
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -7152,16 +6991,15 @@ class GetGlonassEphemerisHealthFlagForSVResult(CommandResult):
 
 class SetGlonassAlmanacUnhealthyFlagForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health):
         CommandBase.__init__(self, "SetGlonassAlmanacUnhealthyFlagForSV")
         self.setSvId(svId)
         self.setHealth(health)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -7186,13 +7024,12 @@ class SetGlonassAlmanacUnhealthyFlagForSV(CommandBase):
 
 class GetGlonassAlmanacUnhealthyFlagForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId):
         CommandBase.__init__(self, "GetGlonassAlmanacUnhealthyFlagForSV")
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -7246,17 +7083,16 @@ class GetGlonassAlmanacUnhealthyFlagForSVResult(CommandResult):
 
 class SetQzssL1DataHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetQzssL1DataHealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -7291,17 +7127,16 @@ class SetQzssL1DataHealthForSV(CommandBase):
 
 class SetQzssSatelliteL1DataHealth(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetQzssSatelliteL1DataHealth")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -7333,14 +7168,13 @@ class SetQzssSatelliteL1DataHealth(CommandBase):
 
 class GetQzssL1DataHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetQzssL1DataHealthForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -7368,14 +7202,13 @@ class GetQzssL1DataHealthForSV(CommandBase):
 
 class GetQzssSatelliteL1DataHealth(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetQzssSatelliteL1DataHealth")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -7443,17 +7276,16 @@ class GetQzssL1DataHealthForSVResult(CommandResult):
 
 class SetQzssL1HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetQzssL1HealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -7488,17 +7320,16 @@ class SetQzssL1HealthForSV(CommandBase):
 
 class SetQzssSatelliteL1Health(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetQzssSatelliteL1Health")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -7530,14 +7361,13 @@ class SetQzssSatelliteL1Health(CommandBase):
 
 class GetQzssL1HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetQzssL1HealthForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -7565,14 +7395,13 @@ class GetQzssL1HealthForSV(CommandBase):
 
 class GetQzssSatelliteL1Health(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetQzssSatelliteL1Health")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -7640,17 +7469,16 @@ class GetQzssL1HealthForSVResult(CommandResult):
 
 class SetQzssL2HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetQzssL2HealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -7685,17 +7513,16 @@ class SetQzssL2HealthForSV(CommandBase):
 
 class SetQzssSatelliteL2Health(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetQzssSatelliteL2Health")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -7727,14 +7554,13 @@ class SetQzssSatelliteL2Health(CommandBase):
 
 class GetQzssL2HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetQzssL2HealthForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -7762,14 +7588,13 @@ class GetQzssL2HealthForSV(CommandBase):
 
 class GetQzssSatelliteL2Health(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetQzssSatelliteL2Health")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -7837,17 +7662,16 @@ class GetQzssL2HealthForSVResult(CommandResult):
 
 class SetQzssL5HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetQzssL5HealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -7882,17 +7706,16 @@ class SetQzssL5HealthForSV(CommandBase):
 
 class SetQzssSatelliteL5Health(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetQzssSatelliteL5Health")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -7924,14 +7747,13 @@ class SetQzssSatelliteL5Health(CommandBase):
 
 class GetQzssL5HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetQzssL5HealthForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -7959,14 +7781,13 @@ class GetQzssL5HealthForSV(CommandBase):
 
 class GetQzssSatelliteL5Health(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetQzssSatelliteL5Health")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -8034,17 +7855,16 @@ class GetQzssL5HealthForSVResult(CommandResult):
 
 class SetQzssL1cHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetQzssL1cHealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -8079,17 +7899,16 @@ class SetQzssL1cHealthForSV(CommandBase):
 
 class SetQzssSatelliteL1cHealth(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetQzssSatelliteL1cHealth")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -8121,14 +7940,13 @@ class SetQzssSatelliteL1cHealth(CommandBase):
 
 class GetQzssL1cHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetQzssL1cHealthForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -8156,14 +7974,13 @@ class GetQzssL1cHealthForSV(CommandBase):
 
 class GetQzssSatelliteL1cHealth(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetQzssSatelliteL1cHealth")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -8231,17 +8048,16 @@ class GetQzssL1cHealthForSVResult(CommandResult):
 
 class SetQzssL6HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetQzssL6HealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -8273,14 +8089,13 @@ class SetQzssL6HealthForSV(CommandBase):
 
 class GetQzssL6HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetQzssL6HealthForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -8348,17 +8163,16 @@ class GetQzssL6HealthForSVResult(CommandResult):
 
 class SetQzssNavAlertFlagForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, alert, dataSetName=None):
         CommandBase.__init__(self, "SetQzssNavAlertFlagForSV")
         self.setSvId(svId)
         self.setAlert(alert)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -8393,17 +8207,16 @@ class SetQzssNavAlertFlagForSV(CommandBase):
 
 class SetQzssSatelliteNavAlertFlag(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, alert, dataSetName=None):
         CommandBase.__init__(self, "SetQzssSatelliteNavAlertFlag")
         self.setSvId(svId)
         self.setAlert(alert)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -8435,14 +8248,13 @@ class SetQzssSatelliteNavAlertFlag(CommandBase):
 
 class GetQzssNavAlertFlagForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetQzssNavAlertFlagForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -8470,14 +8282,13 @@ class GetQzssNavAlertFlagForSV(CommandBase):
 
 class GetQzssSatelliteNavAlertFlag(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetQzssSatelliteNavAlertFlag")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -8545,17 +8356,16 @@ class GetQzssNavAlertFlagForSVResult(CommandResult):
 
 class SetNavICL1HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetNavICL1HealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -8587,14 +8397,13 @@ class SetNavICL1HealthForSV(CommandBase):
 
 class GetNavICL1HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetNavICL1HealthForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -8662,17 +8471,16 @@ class GetNavICL1HealthForSVResult(CommandResult):
 
 class SetNavICL5HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetNavICL5HealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -8707,17 +8515,16 @@ class SetNavICL5HealthForSV(CommandBase):
 
 class SetNavICSatelliteL5Health(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetNavICSatelliteL5Health")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -8749,14 +8556,13 @@ class SetNavICSatelliteL5Health(CommandBase):
 
 class GetNavICL5HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetNavICL5HealthForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -8784,14 +8590,13 @@ class GetNavICL5HealthForSV(CommandBase):
 
 class GetNavICSatelliteL5Health(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetNavICSatelliteL5Health")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -8859,17 +8664,16 @@ class GetNavICL5HealthForSVResult(CommandResult):
 
 class SetNavICSHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetNavICSHealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -8901,14 +8705,13 @@ class SetNavICSHealthForSV(CommandBase):
 
 class GetNavICSHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetNavICSHealthForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -8976,17 +8779,16 @@ class GetNavICSHealthForSVResult(CommandResult):
 
 class SetNavICNavAlertFlagForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, alert, dataSetName=None):
         CommandBase.__init__(self, "SetNavICNavAlertFlagForSV")
         self.setSvId(svId)
         self.setAlert(alert)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -9021,17 +8823,16 @@ class SetNavICNavAlertFlagForSV(CommandBase):
 
 class SetNavICSatelliteNavAlertFlag(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, alert, dataSetName=None):
         CommandBase.__init__(self, "SetNavICSatelliteNavAlertFlag")
         self.setSvId(svId)
         self.setAlert(alert)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -9063,14 +8864,13 @@ class SetNavICSatelliteNavAlertFlag(CommandBase):
 
 class GetNavICNavAlertFlagForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetNavICNavAlertFlagForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -9098,14 +8898,13 @@ class GetNavICNavAlertFlagForSV(CommandBase):
 
 class GetNavICSatelliteNavAlertFlag(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetNavICSatelliteNavAlertFlag")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -9173,17 +8972,16 @@ class GetNavICNavAlertFlagForSVResult(CommandResult):
 
 class SetPulsarX1HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetPulsarX1HealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -9215,14 +9013,13 @@ class SetPulsarX1HealthForSV(CommandBase):
 
 class GetPulsarX1HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetPulsarX1HealthForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -9290,17 +9087,16 @@ class GetPulsarX1HealthForSVResult(CommandResult):
 
 class SetPulsarX5HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetPulsarX5HealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -9332,14 +9128,13 @@ class SetPulsarX5HealthForSV(CommandBase):
 
 class GetPulsarX5HealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetPulsarX5HealthForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -9407,17 +9202,16 @@ class GetPulsarX5HealthForSVResult(CommandResult):
 
 class SetPulsarX1AccuracyIntegrityForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetPulsarX1AccuracyIntegrityForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -9449,14 +9243,13 @@ class SetPulsarX1AccuracyIntegrityForSV(CommandBase):
 
 class GetPulsarX1AccuracyIntegrityForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetPulsarX1AccuracyIntegrityForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -9524,17 +9317,16 @@ class GetPulsarX1AccuracyIntegrityForSVResult(CommandResult):
 
 class SetPulsarX5AccuracyIntegrityForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health, dataSetName=None):
         CommandBase.__init__(self, "SetPulsarX5AccuracyIntegrityForSV")
         self.setSvId(svId)
         self.setHealth(health)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -9566,14 +9358,13 @@ class SetPulsarX5AccuracyIntegrityForSV(CommandBase):
 
 class GetPulsarX5AccuracyIntegrityForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, dataSetName=None):
         CommandBase.__init__(self, "GetPulsarX5AccuracyIntegrityForSV")
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -9639,15 +9430,14 @@ class GetPulsarX5AccuracyIntegrityForSVResult(CommandResult):
 
 class SetGlobalPowerOffset(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, offset):
         CommandBase.__init__(self, "SetGlobalPowerOffset")
         self.setOffset(offset)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def offset(self):
         return self.get("Offset")
 
@@ -9668,15 +9458,14 @@ class SetGlobalPowerOffset(CommandBase):
 
 class SetPowerGlobalOffset(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, offset):
         CommandBase.__init__(self, "SetPowerGlobalOffset")
         self.setOffset(offset)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def offset(self):
         return self.get("Offset")
 
@@ -9692,12 +9481,11 @@ class SetPowerGlobalOffset(CommandBase):
 
 class GetGlobalPowerOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetGlobalPowerOffset")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Please note the command GetPowerGlobalOffset is deprecated since 21.7. You may use GetGlobalPowerOffset.
@@ -9709,12 +9497,11 @@ class GetGlobalPowerOffset(CommandBase):
 
 class GetPowerGlobalOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetPowerGlobalOffset")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetGlobalPowerOffset.
@@ -9757,16 +9544,15 @@ class GetGlobalPowerOffsetResult(CommandResult):
 
 class SetSignalPowerOffset(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, signal, offset):
         CommandBase.__init__(self, "SetSignalPowerOffset")
         self.setSignal(signal)
         self.setOffset(offset)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signal(self):
         return self.get("Signal")
 
@@ -9798,16 +9584,15 @@ class SetSignalPowerOffset(CommandBase):
 
 class SetPowerOffset(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, signal, offset):
         CommandBase.__init__(self, "SetPowerOffset")
         self.setSignal(signal)
         self.setOffset(offset)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signal(self):
         return self.get("Signal")
 
@@ -9836,13 +9621,12 @@ class SetPowerOffset(CommandBase):
 
 class GetSignalPowerOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal):
         CommandBase.__init__(self, "GetSignalPowerOffset")
         self.setSignal(signal)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -9867,13 +9651,12 @@ class GetSignalPowerOffset(CommandBase):
 
 class GetPowerOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal):
         CommandBase.__init__(self, "GetPowerOffset")
         self.setSignal(signal)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -9930,16 +9713,15 @@ class GetSignalPowerOffsetResult(CommandResult):
 
 class SetPowerSbasOffset(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, serviceProvider, offset):
         CommandBase.__init__(self, "SetPowerSbasOffset")
         self.setServiceProvider(serviceProvider)
         self.setOffset(offset)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def serviceProvider(self):
         return self.get("ServiceProvider")
 
@@ -9964,13 +9746,12 @@ class SetPowerSbasOffset(CommandBase):
 
 class GetPowerSbasOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, serviceProvider):
         CommandBase.__init__(self, "GetPowerSbasOffset")
         self.setServiceProvider(serviceProvider)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def serviceProvider(self):
         return self.get("ServiceProvider")
 
@@ -10028,6 +9809,8 @@ class GetPowerSbasOffsetResult(CommandResult):
 
 class SetModulationTarget(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, type, path, address, clockIsExternal, id):
         CommandBase.__init__(self, "SetModulationTarget")
         self.setType(type)
@@ -10036,9 +9819,6 @@ class SetModulationTarget(CommandBase):
         self.setClockIsExternal(clockIsExternal)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def type(self):
         return self.get("Type")
 
@@ -10083,13 +9863,12 @@ class SetModulationTarget(CommandBase):
 
 class GetModulationTarget(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetModulationTarget")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -10167,15 +9946,14 @@ class GetModulationTargetResult(CommandResult):
 
 class SetGpu(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, gpuIdx, output, id):
         CommandBase.__init__(self, "SetGpu")
         self.setGpuIdx(gpuIdx)
         self.setOutput(output)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def gpuIdx(self):
         return self.get("GpuIdx")
 
@@ -10207,14 +9985,13 @@ class SetGpu(CommandBase):
 
 class GetGpu(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, output, id):
         CommandBase.__init__(self, "GetGpu")
         self.setOutput(output)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def output(self):
         return self.get("Output")
 
@@ -10277,12 +10054,11 @@ class GetGpuResult(CommandResult):
 
 class GetAllModulationTargets(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetAllModulationTargets")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetAllModulationTargets.
@@ -10320,13 +10096,12 @@ class GetAllModulationTargetsResult(CommandResult):
 
 class RemoveModulationTarget(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "RemoveModulationTarget")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -10342,12 +10117,11 @@ class RemoveModulationTarget(CommandBase):
 
 class RemoveAllModulationTargets(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "RemoveAllModulationTargets")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Change the modulation target name. The name is only used for display purpose.
@@ -10361,14 +10135,13 @@ class RemoveAllModulationTargets(CommandBase):
 
 class ChangeModulationTargetName(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, targetName, id):
         CommandBase.__init__(self, "ChangeModulationTargetName")
         self.setTargetName(targetName)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def targetName(self):
         return self.get("TargetName")
 
@@ -10403,6 +10176,8 @@ class ChangeModulationTargetName(CommandBase):
 
 class ChangeModulationTargetSignals(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(
         self,
         output,
@@ -10426,9 +10201,6 @@ class ChangeModulationTargetSignals(CommandBase):
         self.setId(id)
         self.setCentralFrequency(centralFrequency)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def output(self):
         return self.get("Output")
 
@@ -10498,14 +10270,13 @@ class ChangeModulationTargetSignals(CommandBase):
 
 class GetModulationTargetSignals(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, output, id):
         CommandBase.__init__(self, "GetModulationTargetSignals")
         self.setOutput(output)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def output(self):
         return self.get("Output")
 
@@ -10640,6 +10411,8 @@ class GetModulationTargetSignalsResult(CommandResult):
 
 class ChangeModulationTargetInterference(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(
         self, output, minRate, maxRate, group, centralFreq, gain, id, signal=None
     ):
@@ -10653,9 +10426,6 @@ class ChangeModulationTargetInterference(CommandBase):
         self.setId(id)
         self.setSignal(signal)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def output(self):
         return self.get("Output")
 
@@ -10720,14 +10490,13 @@ class ChangeModulationTargetInterference(CommandBase):
 
 class GetModulationTargetInterferences(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, output, id):
         CommandBase.__init__(self, "GetModulationTargetInterferences")
         self.setOutput(output)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def output(self):
         return self.get("Output")
 
@@ -10836,16 +10605,15 @@ class GetModulationTargetInterferencesResult(CommandResult):
 
 class SetRfGain(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, output, gain):
         CommandBase.__init__(self, "SetRfGain")
         self.setOutput(output)
         self.setGain(gain)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def output(self):
         return self.get("Output")
 
@@ -10873,6 +10641,8 @@ class SetRfGain(CommandBase):
 
 class ImportConstellationParameters(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, path, rollover=None, dataSetName=None):
         CommandBase.__init__(self, "ImportConstellationParameters")
         self.setSystem(system)
@@ -10880,9 +10650,6 @@ class ImportConstellationParameters(CommandBase):
         self.setRollover(rollover)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -10920,14 +10687,13 @@ class ImportConstellationParameters(CommandBase):
 
 class ImportIonoParameters(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, path, type=None):
         CommandBase.__init__(self, "ImportIonoParameters")
         self.setPath(path)
         self.setType(type)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def path(self):
         return self.get("Path")
 
@@ -10952,13 +10718,12 @@ class ImportIonoParameters(CommandBase):
 
 class ImportMODIPFile(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, path):
         CommandBase.__init__(self, "ImportMODIPFile")
         self.setPath(path)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def path(self):
         return self.get("Path")
 
@@ -10977,13 +10742,12 @@ class ImportMODIPFile(CommandBase):
 
 class ImportCCIRFilesFromDirectory(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, path):
         CommandBase.__init__(self, "ImportCCIRFilesFromDirectory")
         self.setPath(path)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def path(self):
         return self.get("Path")
 
@@ -11002,13 +10766,12 @@ class ImportCCIRFilesFromDirectory(CommandBase):
 
 class ImportGlonassAlmanac(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, path):
         CommandBase.__init__(self, "ImportGlonassAlmanac")
         self.setPath(path)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def path(self):
         return self.get("Path")
 
@@ -11027,13 +10790,12 @@ class ImportGlonassAlmanac(CommandBase):
 
 class ImportNmeaTrack(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, path):
         CommandBase.__init__(self, "ImportNmeaTrack")
         self.setPath(path)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def path(self):
         return self.get("Path")
 
@@ -11049,12 +10811,11 @@ class ImportNmeaTrack(CommandBase):
 
 class ClearVehiculeTrajectory(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "ClearVehiculeTrajectory")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Set the default vehicle antenna model.
@@ -11067,13 +10828,12 @@ class ClearVehiculeTrajectory(CommandBase):
 
 class SetDefaultVehicleAntennaModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, name):
         CommandBase.__init__(self, "SetDefaultVehicleAntennaModel")
         self.setName(name)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def name(self):
         return self.get("Name")
 
@@ -11089,12 +10849,11 @@ class SetDefaultVehicleAntennaModel(CommandBase):
 
 class GetDefaultVehicleAntennaModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetDefaultVehicleAntennaModel")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetDefaultVehicleAntennaModel.
@@ -11129,12 +10888,11 @@ class GetDefaultVehicleAntennaModelResult(CommandResult):
 
 class GetAllVehicleAntennaNames(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetAllVehicleAntennaNames")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetAllVehicleAntennaNames.
@@ -11175,6 +10933,8 @@ class GetAllVehicleAntennaNamesResult(CommandResult):
 
 class SetVehicleAntennaGain(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, gain, type, band, name=None):
         CommandBase.__init__(self, "SetVehicleAntennaGain")
         self.setGain(gain)
@@ -11182,9 +10942,6 @@ class SetVehicleAntennaGain(CommandBase):
         self.setBand(band)
         self.setName(name)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def gain(self):
         return self.get("Gain")
 
@@ -11222,14 +10979,13 @@ class SetVehicleAntennaGain(CommandBase):
 
 class GetVehicleAntennaGain(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, band, name=None):
         CommandBase.__init__(self, "GetVehicleAntennaGain")
         self.setBand(band)
         self.setName(name)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def band(self):
         return self.get("Band")
 
@@ -11306,6 +11062,8 @@ class GetVehicleAntennaGainResult(CommandResult):
 
 class SetVehicleAntennaPhaseOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, phaseOffset, type, band, name=None):
         CommandBase.__init__(self, "SetVehicleAntennaPhaseOffset")
         self.setPhaseOffset(phaseOffset)
@@ -11313,9 +11071,6 @@ class SetVehicleAntennaPhaseOffset(CommandBase):
         self.setBand(band)
         self.setName(name)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def phaseOffset(self):
         return self.get("PhaseOffset")
 
@@ -11353,14 +11108,13 @@ class SetVehicleAntennaPhaseOffset(CommandBase):
 
 class GetVehicleAntennaPhaseOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, band, name=None):
         CommandBase.__init__(self, "GetVehicleAntennaPhaseOffset")
         self.setBand(band)
         self.setName(name)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def band(self):
         return self.get("Band")
 
@@ -11437,6 +11191,8 @@ class GetVehicleAntennaPhaseOffsetResult(CommandResult):
 
 class SetVehicleAntennaGainCSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, filePath, type, band, name=None):
         CommandBase.__init__(self, "SetVehicleAntennaGainCSV")
         self.setFilePath(filePath)
@@ -11444,9 +11200,6 @@ class SetVehicleAntennaGainCSV(CommandBase):
         self.setBand(band)
         self.setName(name)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def filePath(self):
         return self.get("FilePath")
 
@@ -11487,6 +11240,8 @@ class SetVehicleAntennaGainCSV(CommandBase):
 
 class SetVehicleAntennaPhaseOffsetCSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, filePath, fileFormat, type, band, name=None):
         CommandBase.__init__(self, "SetVehicleAntennaPhaseOffsetCSV")
         self.setFilePath(filePath)
@@ -11495,9 +11250,6 @@ class SetVehicleAntennaPhaseOffsetCSV(CommandBase):
         self.setBand(band)
         self.setName(name)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def filePath(self):
         return self.get("FilePath")
 
@@ -11542,15 +11294,14 @@ class SetVehicleAntennaPhaseOffsetCSV(CommandBase):
 
 class AddVehicleGainPatternOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, band, offset, antennaName=None):
         CommandBase.__init__(self, "AddVehicleGainPatternOffset")
         self.setBand(band)
         self.setOffset(offset)
         self.setAntennaName(antennaName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def band(self):
         return self.get("Band")
 
@@ -11582,14 +11333,13 @@ class AddVehicleGainPatternOffset(CommandBase):
 
 class GetVehicleGainPatternOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, band, antennaName=None):
         CommandBase.__init__(self, "GetVehicleGainPatternOffset")
         self.setBand(band)
         self.setAntennaName(antennaName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def band(self):
         return self.get("Band")
 
@@ -11657,15 +11407,14 @@ class GetVehicleGainPatternOffsetResult(CommandResult):
 
 class AddVehiclePhasePatternOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, band, offset, antennaName=None):
         CommandBase.__init__(self, "AddVehiclePhasePatternOffset")
         self.setBand(band)
         self.setOffset(offset)
         self.setAntennaName(antennaName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def band(self):
         return self.get("Band")
 
@@ -11697,14 +11446,13 @@ class AddVehiclePhasePatternOffset(CommandBase):
 
 class GetVehiclePhasePatternOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, band, antennaName=None):
         CommandBase.__init__(self, "GetVehiclePhasePatternOffset")
         self.setBand(band)
         self.setAntennaName(antennaName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def band(self):
         return self.get("Band")
 
@@ -11794,6 +11542,8 @@ class AntennaPatternFileType:
 
 class SetVehicleAntennaOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, x, y, z, yaw, pitch, roll, name=None):
         CommandBase.__init__(self, "SetVehicleAntennaOffset")
         self.setX(x)
@@ -11804,9 +11554,6 @@ class SetVehicleAntennaOffset(CommandBase):
         self.setRoll(roll)
         self.setName(name)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def x(self):
         return self.get("X")
 
@@ -11861,13 +11608,12 @@ class SetVehicleAntennaOffset(CommandBase):
 
 class GetVehicleAntennaOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, name=None):
         CommandBase.__init__(self, "GetVehicleAntennaOffset")
         self.setName(name)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def name(self):
         return self.get("Name")
 
@@ -11959,13 +11705,12 @@ class GetVehicleAntennaOffsetResult(CommandResult):
 
 class AddEmptyVehicleAntennaModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, name):
         CommandBase.__init__(self, "AddEmptyVehicleAntennaModel")
         self.setName(name)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def name(self):
         return self.get("Name")
 
@@ -11984,13 +11729,12 @@ class AddEmptyVehicleAntennaModel(CommandBase):
 
 class DeleteVehicleAntennaModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, name):
         CommandBase.__init__(self, "DeleteVehicleAntennaModel")
         self.setName(name)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def name(self):
         return self.get("Name")
 
@@ -12010,14 +11754,13 @@ class DeleteVehicleAntennaModel(CommandBase):
 
 class RenameVehicleAntennaModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, name, newName):
         CommandBase.__init__(self, "RenameVehicleAntennaModel")
         self.setName(name)
         self.setNewName(newName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def name(self):
         return self.get("Name")
 
@@ -12043,14 +11786,13 @@ class RenameVehicleAntennaModel(CommandBase):
 
 class CopyVehicleAntennaModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, name, copyName):
         CommandBase.__init__(self, "CopyVehicleAntennaModel")
         self.setName(name)
         self.setCopyName(copyName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def name(self):
         return self.get("Name")
 
@@ -12075,13 +11817,12 @@ class CopyVehicleAntennaModel(CommandBase):
 
 class GetVehicleAntennaModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, name):
         CommandBase.__init__(self, "GetVehicleAntennaModel")
         self.setName(name)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def name(self):
         return self.get("Name")
 
@@ -12506,13 +12247,12 @@ class GetVehicleAntennaModelResult(CommandResult):
 
 class ImportVehicleAntennaModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, filePath):
         CommandBase.__init__(self, "ImportVehicleAntennaModel")
         self.setFilePath(filePath)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def filePath(self):
         return self.get("FilePath")
 
@@ -12533,15 +12273,14 @@ class ImportVehicleAntennaModel(CommandBase):
 
 class ExportVehicleAntennaModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, antennaName, filePath, overwriting):
         CommandBase.__init__(self, "ExportVehicleAntennaModel")
         self.setAntennaName(antennaName)
         self.setFilePath(filePath)
         self.setOverwriting(overwriting)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def antennaName(self):
         return self.get("AntennaName")
 
@@ -12574,15 +12313,14 @@ class ExportVehicleAntennaModel(CommandBase):
 
 class SetAntennaChange(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, startTime, antenna, id):
         CommandBase.__init__(self, "SetAntennaChange")
         self.setStartTime(startTime)
         self.setAntenna(antenna)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def startTime(self):
         return self.get("StartTime")
 
@@ -12613,13 +12351,12 @@ class SetAntennaChange(CommandBase):
 
 class GetAntennaChange(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetAntennaChange")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -12679,13 +12416,12 @@ class GetAntennaChangeResult(CommandResult):
 
 class RemoveAntennaChange(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "RemoveAntennaChange")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -12701,12 +12437,11 @@ class RemoveAntennaChange(CommandBase):
 
 class ClearAllAntennaChanges(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "ClearAllAntennaChanges")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Set WF antenna offset and orientation relative to body frame.
@@ -12730,6 +12465,8 @@ class ClearAllAntennaChanges(CommandBase):
 
 class SetWFAntennaOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, x, y, z, yaw, pitch, roll):
         CommandBase.__init__(self, "SetWFAntennaOffset")
         self.setX(x)
@@ -12739,9 +12476,6 @@ class SetWFAntennaOffset(CommandBase):
         self.setPitch(pitch)
         self.setRoll(roll)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def x(self):
         return self.get("X")
 
@@ -12787,12 +12521,11 @@ class SetWFAntennaOffset(CommandBase):
 
 class GetWFAntennaOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetWFAntennaOffset")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetWFAntennaOffset.
@@ -12870,13 +12603,12 @@ class GetWFAntennaOffsetResult(CommandResult):
 
 class GetAllSVAntennaNames(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system):
         CommandBase.__init__(self, "GetAllSVAntennaNames")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -12931,6 +12663,8 @@ class GetAllSVAntennaNamesResult(CommandResult):
 
 class AddSVGainPatternOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, band, system, offset, antennaName=None):
         CommandBase.__init__(self, "AddSVGainPatternOffset")
         self.setBand(band)
@@ -12938,9 +12672,6 @@ class AddSVGainPatternOffset(CommandBase):
         self.setOffset(offset)
         self.setAntennaName(antennaName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def band(self):
         return self.get("Band")
 
@@ -12979,15 +12710,14 @@ class AddSVGainPatternOffset(CommandBase):
 
 class GetSVGainPatternOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, band, system, antennaName=None):
         CommandBase.__init__(self, "GetSVGainPatternOffset")
         self.setBand(band)
         self.setSystem(system)
         self.setAntennaName(antennaName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def band(self):
         return self.get("Band")
 
@@ -13070,6 +12800,8 @@ class GetSVGainPatternOffsetResult(CommandResult):
 
 class AddSVPhasePatternOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, band, system, offset, antennaName=None):
         CommandBase.__init__(self, "AddSVPhasePatternOffset")
         self.setBand(band)
@@ -13077,9 +12809,6 @@ class AddSVPhasePatternOffset(CommandBase):
         self.setOffset(offset)
         self.setAntennaName(antennaName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def band(self):
         return self.get("Band")
 
@@ -13118,15 +12847,14 @@ class AddSVPhasePatternOffset(CommandBase):
 
 class GetSVPhasePatternOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, band, system, antennaName=None):
         CommandBase.__init__(self, "GetSVPhasePatternOffset")
         self.setBand(band)
         self.setSystem(system)
         self.setAntennaName(antennaName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def band(self):
         return self.get("Band")
 
@@ -13210,6 +12938,8 @@ class GetSVPhasePatternOffsetResult(CommandResult):
 
 class SetSVAntennaGain(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, gain, type, band, system, name=None):
         CommandBase.__init__(self, "SetSVAntennaGain")
         self.setGain(gain)
@@ -13218,9 +12948,6 @@ class SetSVAntennaGain(CommandBase):
         self.setSystem(system)
         self.setName(name)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def gain(self):
         return self.get("Gain")
 
@@ -13265,15 +12992,14 @@ class SetSVAntennaGain(CommandBase):
 
 class GetSVAntennaGain(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, band, system, name=None):
         CommandBase.__init__(self, "GetSVAntennaGain")
         self.setBand(band)
         self.setSystem(system)
         self.setName(name)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def band(self):
         return self.get("Band")
 
@@ -13365,6 +13091,8 @@ class GetSVAntennaGainResult(CommandResult):
 
 class SetSVAntennaPhaseOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, phaseOffset, type, band, system, name=None):
         CommandBase.__init__(self, "SetSVAntennaPhaseOffset")
         self.setPhaseOffset(phaseOffset)
@@ -13373,9 +13101,6 @@ class SetSVAntennaPhaseOffset(CommandBase):
         self.setSystem(system)
         self.setName(name)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def phaseOffset(self):
         return self.get("PhaseOffset")
 
@@ -13420,15 +13145,14 @@ class SetSVAntennaPhaseOffset(CommandBase):
 
 class GetSVAntennaPhaseOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, band, system, name=None):
         CommandBase.__init__(self, "GetSVAntennaPhaseOffset")
         self.setBand(band)
         self.setSystem(system)
         self.setName(name)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def band(self):
         return self.get("Band")
 
@@ -13520,6 +13244,8 @@ class GetSVAntennaPhaseOffsetResult(CommandResult):
 
 class SetSVAntennaGainCSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, filePath, type, band, system, name=None):
         CommandBase.__init__(self, "SetSVAntennaGainCSV")
         self.setFilePath(filePath)
@@ -13528,9 +13254,6 @@ class SetSVAntennaGainCSV(CommandBase):
         self.setSystem(system)
         self.setName(name)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def filePath(self):
         return self.get("FilePath")
 
@@ -13578,6 +13301,8 @@ class SetSVAntennaGainCSV(CommandBase):
 
 class SetSVAntennaPhaseOffsetCSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, filePath, fileFormat, type, band, system, name=None):
         CommandBase.__init__(self, "SetSVAntennaPhaseOffsetCSV")
         self.setFilePath(filePath)
@@ -13587,9 +13312,6 @@ class SetSVAntennaPhaseOffsetCSV(CommandBase):
         self.setSystem(system)
         self.setName(name)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def filePath(self):
         return self.get("FilePath")
 
@@ -13639,14 +13361,13 @@ class SetSVAntennaPhaseOffsetCSV(CommandBase):
 
 class AddEmptySVAntennaModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, name, system):
         CommandBase.__init__(self, "AddEmptySVAntennaModel")
         self.setName(name)
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def name(self):
         return self.get("Name")
 
@@ -13672,14 +13393,13 @@ class AddEmptySVAntennaModel(CommandBase):
 
 class DeleteSVAntennaModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, name, system):
         CommandBase.__init__(self, "DeleteSVAntennaModel")
         self.setName(name)
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def name(self):
         return self.get("Name")
 
@@ -13706,15 +13426,14 @@ class DeleteSVAntennaModel(CommandBase):
 
 class RenameSVAntennaModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, name, newName, system):
         CommandBase.__init__(self, "RenameSVAntennaModel")
         self.setName(name)
         self.setNewName(newName)
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def name(self):
         return self.get("Name")
 
@@ -13747,15 +13466,14 @@ class RenameSVAntennaModel(CommandBase):
 
 class CopySVAntennaModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, name, copyName, system):
         CommandBase.__init__(self, "CopySVAntennaModel")
         self.setName(name)
         self.setCopyName(copyName)
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def name(self):
         return self.get("Name")
 
@@ -13787,14 +13505,13 @@ class CopySVAntennaModel(CommandBase):
 
 class ImportSVAntennaModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, filePath, system):
         CommandBase.__init__(self, "ImportSVAntennaModel")
         self.setFilePath(filePath)
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def filePath(self):
         return self.get("FilePath")
 
@@ -13822,6 +13539,8 @@ class ImportSVAntennaModel(CommandBase):
 
 class ExportSVAntennaModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, antennaName, system, filePath, overwriting):
         CommandBase.__init__(self, "ExportSVAntennaModel")
         self.setAntennaName(antennaName)
@@ -13829,9 +13548,6 @@ class ExportSVAntennaModel(CommandBase):
         self.setFilePath(filePath)
         self.setOverwriting(overwriting)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def antennaName(self):
         return self.get("AntennaName")
 
@@ -13870,15 +13586,14 @@ class ExportSVAntennaModel(CommandBase):
 
 class SetSVAntennaModelForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, antennaModelName):
         CommandBase.__init__(self, "SetSVAntennaModelForSV")
         self.setSystem(system)
         self.setSvId(svId)
         self.setAntennaModelName(antennaModelName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -13910,14 +13625,13 @@ class SetSVAntennaModelForSV(CommandBase):
 
 class GetSVAntennaModelForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId):
         CommandBase.__init__(self, "GetSVAntennaModelForSV")
         self.setSystem(system)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -13984,14 +13698,13 @@ class GetSVAntennaModelForSVResult(CommandResult):
 
 class SetSVAntennaModelForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, antennaModelNames):
         CommandBase.__init__(self, "SetSVAntennaModelForEachSV")
         self.setSystem(system)
         self.setAntennaModelNames(antennaModelNames)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -14016,13 +13729,12 @@ class SetSVAntennaModelForEachSV(CommandBase):
 
 class GetSVAntennaModelForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system):
         CommandBase.__init__(self, "GetSVAntennaModelForEachSV")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -14078,15 +13790,14 @@ class GetSVAntennaModelForEachSVResult(CommandResult):
 
 class SetSVType(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, svType):
         CommandBase.__init__(self, "SetSVType")
         self.setSystem(system)
         self.setSvId(svId)
         self.setSvType(svType)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -14120,14 +13831,13 @@ class SetSVType(CommandBase):
 
 class GetSVType(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId):
         CommandBase.__init__(self, "GetSVType")
         self.setSystem(system)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -14199,14 +13909,13 @@ class GetSVTypeResult(CommandResult):
 
 class SetTransmittedPrnForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, signalPrnDict):
         CommandBase.__init__(self, "SetTransmittedPrnForSV")
         self.setSvId(svId)
         self.setSignalPrnDict(signalPrnDict)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -14237,14 +13946,13 @@ class SetTransmittedPrnForSV(CommandBase):
 
 class GetTransmittedPrnForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, signalArray):
         CommandBase.__init__(self, "GetTransmittedPrnForSV")
         self.setSvId(svId)
         self.setSignalArray(signalArray)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -14309,15 +14017,14 @@ class GetTransmittedPrnForSVResult(CommandResult):
 
 class SetPrnOfSVID(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal, svId, prn):
         CommandBase.__init__(self, "SetPrnOfSVID")
         self.setSignal(signal)
         self.setSvId(svId)
         self.setPrn(prn)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -14349,14 +14056,13 @@ class SetPrnOfSVID(CommandBase):
 
 class GetPrnOfSVID(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal, svId):
         CommandBase.__init__(self, "GetPrnOfSVID")
         self.setSignal(signal)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -14423,14 +14129,13 @@ class GetPrnOfSVIDResult(CommandResult):
 
 class SetPrnForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal, prn):
         CommandBase.__init__(self, "SetPrnForEachSV")
         self.setSignal(signal)
         self.setPrn(prn)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -14455,13 +14160,12 @@ class SetPrnForEachSV(CommandBase):
 
 class GetPrnForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal):
         CommandBase.__init__(self, "GetPrnForEachSV")
         self.setSignal(signal)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -14513,13 +14217,12 @@ class GetPrnForEachSVResult(CommandResult):
 
 class ResetToDefaultPrn(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system):
         CommandBase.__init__(self, "ResetToDefaultPrn")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -14538,13 +14241,12 @@ class ResetToDefaultPrn(CommandBase):
 
 class EnableTrajectorySmoothing(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "EnableTrajectorySmoothing")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -14560,12 +14262,11 @@ class EnableTrajectorySmoothing(CommandBase):
 
 class IsTrajectorySmoothingEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsTrajectorySmoothingEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsTrajectorySmoothingEnabled.
@@ -14603,13 +14304,12 @@ class IsTrajectorySmoothingEnabledResult(CommandResult):
 
 class EnableSimulationStopAtTrajectoryEnd(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "EnableSimulationStopAtTrajectoryEnd")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -14625,12 +14325,11 @@ class EnableSimulationStopAtTrajectoryEnd(CommandBase):
 
 class IsSimulationStopAtTrajectoryEndEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsSimulationStopAtTrajectoryEndEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsSimulationStopAtTrajectoryEndEnabled.
@@ -14668,13 +14367,12 @@ class IsSimulationStopAtTrajectoryEndEnabledResult(CommandResult):
 
 class ForceAttitudeToZero(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "ForceAttitudeToZero")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -14690,12 +14388,11 @@ class ForceAttitudeToZero(CommandBase):
 
 class IsAttitudeToZeroForced(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsAttitudeToZeroForced")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsAttitudeToZeroForced.
@@ -14733,13 +14430,12 @@ class IsAttitudeToZeroForcedResult(CommandResult):
 
 class SetVehicleTrajectory(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, type):
         CommandBase.__init__(self, "SetVehicleTrajectory")
         self.setType(type)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def type(self):
         return self.get("Type")
 
@@ -14755,14 +14451,13 @@ class SetVehicleTrajectory(CommandBase):
 
 class GetVehicleTrajectory(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetVehicleTrajectory")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
 
 #
 # Result of GetVehicleTrajectory.
@@ -14800,13 +14495,12 @@ class GetVehicleTrajectoryResult(CommandResult):
 
 class SetVehicleType(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, type):
         CommandBase.__init__(self, "SetVehicleType")
         self.setType(type)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def type(self):
         return self.get("Type")
 
@@ -14822,12 +14516,11 @@ class SetVehicleType(CommandBase):
 
 class GetVehicleType(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetVehicleType")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetVehicleType.
@@ -14865,12 +14558,11 @@ class GetVehicleTypeResult(CommandResult):
 
 class BeginTrackDefinition(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "BeginTrackDefinition")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Push a track ecef node. Must be called after BeginTrackDefinition and before EndTrackDefinition.
@@ -14886,6 +14578,8 @@ class BeginTrackDefinition(CommandBase):
 
 class PushTrackEcef(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, time, x, y, z):
         CommandBase.__init__(self, "PushTrackEcef")
         self.setTime(time)
@@ -14893,9 +14587,6 @@ class PushTrackEcef(CommandBase):
         self.setY(y)
         self.setZ(z)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def time(self):
         return self.get("Time")
 
@@ -14938,6 +14629,8 @@ class PushTrackEcef(CommandBase):
 
 class PushTrackEcefNed(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, time, x, y, z, yaw, pitch, roll):
         CommandBase.__init__(self, "PushTrackEcefNed")
         self.setTime(time)
@@ -14948,9 +14641,6 @@ class PushTrackEcefNed(CommandBase):
         self.setPitch(pitch)
         self.setRoll(roll)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def time(self):
         return self.get("Time")
 
@@ -15005,12 +14695,11 @@ class PushTrackEcefNed(CommandBase):
 
 class EndTrackDefinition(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "EndTrackDefinition")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # EndTrackDefinition Result with created track informations.
@@ -15048,12 +14737,11 @@ class EndTrackDefinitionResult(CommandResult):
 
 class BeginRouteDefinition(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "BeginRouteDefinition")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Push a route ecef node with speed. Must be called after BeginRouteDefinition and before EndRouteDefinition.
@@ -15069,6 +14757,8 @@ class BeginRouteDefinition(CommandBase):
 
 class PushRouteEcef(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, speed, x, y, z):
         CommandBase.__init__(self, "PushRouteEcef")
         self.setSpeed(speed)
@@ -15076,9 +14766,6 @@ class PushRouteEcef(CommandBase):
         self.setY(y)
         self.setZ(z)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def speed(self):
         return self.get("Speed")
 
@@ -15115,12 +14802,11 @@ class PushRouteEcef(CommandBase):
 
 class EndRouteDefinition(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "EndRouteDefinition")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # EndRouteDefinition Result with created route informations.
@@ -15164,6 +14850,8 @@ class EndRouteDefinitionResult(CommandResult):
 
 class SetVehicleTrajectoryFix(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, type, lat, lon, alt, yaw, pitch, roll):
         CommandBase.__init__(self, "SetVehicleTrajectoryFix")
         self.setType(type)
@@ -15174,9 +14862,6 @@ class SetVehicleTrajectoryFix(CommandBase):
         self.setPitch(pitch)
         self.setRoll(roll)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def type(self):
         return self.get("Type")
 
@@ -15228,12 +14913,11 @@ class SetVehicleTrajectoryFix(CommandBase):
 
 class GetVehicleTrajectoryFix(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetVehicleTrajectoryFix")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetVehicleTrajectoryFix.
@@ -15325,6 +15009,8 @@ class GetVehicleTrajectoryFixResult(CommandResult):
 
 class SetVehicleTrajectoryFixEcef(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, type, x, y, z, yaw, pitch, roll):
         CommandBase.__init__(self, "SetVehicleTrajectoryFixEcef")
         self.setType(type)
@@ -15335,9 +15021,6 @@ class SetVehicleTrajectoryFixEcef(CommandBase):
         self.setPitch(pitch)
         self.setRoll(roll)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def type(self):
         return self.get("Type")
 
@@ -15389,12 +15072,11 @@ class SetVehicleTrajectoryFixEcef(CommandBase):
 
 class GetVehicleTrajectoryFixEcef(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetVehicleTrajectoryFixEcef")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetVehicleTrajectoryFixEcef.
@@ -15487,6 +15169,8 @@ class GetVehicleTrajectoryFixEcefResult(CommandResult):
 
 class SetVehicleTrajectoryCircular(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, type, lat, lon, alt, radius, speed, clockwise, originAngle=None):
         CommandBase.__init__(self, "SetVehicleTrajectoryCircular")
         self.setType(type)
@@ -15498,9 +15182,6 @@ class SetVehicleTrajectoryCircular(CommandBase):
         self.setClockwise(clockwise)
         self.setOriginAngle(originAngle)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def type(self):
         return self.get("Type")
 
@@ -15558,12 +15239,11 @@ class SetVehicleTrajectoryCircular(CommandBase):
 
 class GetVehicleTrajectoryCircular(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetVehicleTrajectoryCircular")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetVehicleTrajectoryCircular.
@@ -15664,6 +15344,8 @@ class GetVehicleTrajectoryCircularResult(CommandResult):
 
 class SetVehicleTrajectoryOrbit(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(
         self,
         type,
@@ -15685,9 +15367,6 @@ class SetVehicleTrajectoryOrbit(CommandBase):
         self.setMeanAnomaly(meanAnomaly)
         self.setArgumentOfPerigee(argumentOfPerigee)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def type(self):
         return self.get("Type")
 
@@ -15745,12 +15424,11 @@ class SetVehicleTrajectoryOrbit(CommandBase):
 
 class GetVehicleTrajectoryOrbit(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetVehicleTrajectoryOrbit")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetVehicleTrajectoryOrbit.
@@ -15851,16 +15529,15 @@ class GetVehicleTrajectoryOrbitResult(CommandResult):
 
 class GetHilPort(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_IDLE
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetHilPort")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_IDLE
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Result of GetHilPort.
@@ -15909,12 +15586,11 @@ class HilExtrapolationState:
 
 class GetHilExtrapolationState(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetHilExtrapolationState")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
 
 #
 # Result of GetHilExtrapolationState.
@@ -15963,6 +15639,8 @@ class GetHilExtrapolationStateResult(CommandResult):
 
 class SetEphemerisReferenceTimeForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, time, dataSetName=None):
         CommandBase.__init__(self, "SetEphemerisReferenceTimeForSV")
         self.setSystem(system)
@@ -15970,9 +15648,6 @@ class SetEphemerisReferenceTimeForSV(CommandBase):
         self.setTime(time)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -16014,6 +15689,8 @@ class SetEphemerisReferenceTimeForSV(CommandBase):
 
 class SetEphemerisReferenceTime(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, time, dataSetName=None):
         CommandBase.__init__(self, "SetEphemerisReferenceTime")
         self.setSystem(system)
@@ -16021,9 +15698,6 @@ class SetEphemerisReferenceTime(CommandBase):
         self.setTime(time)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -16062,15 +15736,14 @@ class SetEphemerisReferenceTime(CommandBase):
 
 class GetEphemerisReferenceTimeForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, dataSetName=None):
         CommandBase.__init__(self, "GetEphemerisReferenceTimeForSV")
         self.setSystem(system)
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -16105,15 +15778,14 @@ class GetEphemerisReferenceTimeForSV(CommandBase):
 
 class GetEphemerisReferenceTime(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, dataSetName=None):
         CommandBase.__init__(self, "GetEphemerisReferenceTime")
         self.setSystem(system)
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -16207,15 +15879,14 @@ class GetEphemerisReferenceTimeForSVResult(CommandResult):
 
 class SetGlonassEphDoubleParamForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, val):
         CommandBase.__init__(self, "SetGlonassEphDoubleParamForSV")
         self.setSvId(svId)
         self.setParamName(paramName)
         self.setVal(val)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -16259,14 +15930,13 @@ class SetGlonassEphDoubleParamForSV(CommandBase):
 
 class GetGlonassEphDoubleParamForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName):
         CommandBase.__init__(self, "GetGlonassEphDoubleParamForSV")
         self.setSvId(svId)
         self.setParamName(paramName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -16333,14 +16003,13 @@ class GetGlonassEphDoubleParamForSVResult(CommandResult):
 
 class SetGlonassEphDoubleParamForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, val):
         CommandBase.__init__(self, "SetGlonassEphDoubleParamForEachSV")
         self.setParamName(paramName)
         self.setVal(val)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -16368,14 +16037,13 @@ class SetGlonassEphDoubleParamForEachSV(CommandBase):
 
 class SetGlonassDoubleParams(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, val):
         CommandBase.__init__(self, "SetGlonassDoubleParams")
         self.setParamName(paramName)
         self.setVal(val)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -16400,13 +16068,12 @@ class SetGlonassDoubleParams(CommandBase):
 
 class GetGlonassEphDoubleParamForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName):
         CommandBase.__init__(self, "GetGlonassEphDoubleParamForEachSV")
         self.setParamName(paramName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -16427,13 +16094,12 @@ class GetGlonassEphDoubleParamForEachSV(CommandBase):
 
 class GetGlonassDoubleParams(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName):
         CommandBase.__init__(self, "GetGlonassDoubleParams")
         self.setParamName(paramName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -16482,12 +16148,11 @@ class GetGlonassEphDoubleParamForEachSVResult(CommandResult):
 
 class GetGlonassFrequencyNumberForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetGlonassFrequencyNumberForEachSV")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetGlonassFrequencyNumberForEachSV
@@ -16526,14 +16191,13 @@ class GetGlonassFrequencyNumberForEachSVResult(CommandResult):
 
 class SetSbasEphemerisReferenceTimeForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, time):
         CommandBase.__init__(self, "SetSbasEphemerisReferenceTimeForSV")
         self.setSvId(svId)
         self.setTime(time)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -16558,13 +16222,12 @@ class SetSbasEphemerisReferenceTimeForSV(CommandBase):
 
 class GetSbasEphemerisReferenceTimeForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId):
         CommandBase.__init__(self, "GetSbasEphemerisReferenceTimeForSV")
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -16621,16 +16284,15 @@ class GetSbasEphemerisReferenceTimeForSVResult(CommandResult):
 
 class SetSbasEphParamsForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, svId, paramValueDict):
         CommandBase.__init__(self, "SetSbasEphParamsForSV")
         self.setSvId(svId)
         self.setParamValueDict(paramValueDict)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -16660,14 +16322,13 @@ class SetSbasEphParamsForSV(CommandBase):
 
 class GetSbasEphParamsForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramArray):
         CommandBase.__init__(self, "GetSbasEphParamsForSV")
         self.setSvId(svId)
         self.setParamArray(paramArray)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -16730,16 +16391,15 @@ class GetSbasEphParamsForSVResult(CommandResult):
 
 class SetSbasRangingHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health):
         CommandBase.__init__(self, "SetSbasRangingHealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -16765,16 +16425,15 @@ class SetSbasRangingHealthForSV(CommandBase):
 
 class SetSbasCorrectionsHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health):
         CommandBase.__init__(self, "SetSbasCorrectionsHealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -16800,16 +16459,15 @@ class SetSbasCorrectionsHealthForSV(CommandBase):
 
 class SetSbasIntegrityHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health):
         CommandBase.__init__(self, "SetSbasIntegrityHealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -16835,16 +16493,15 @@ class SetSbasIntegrityHealthForSV(CommandBase):
 
 class SetSbasReservedHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, health):
         CommandBase.__init__(self, "SetSbasReservedHealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -16870,14 +16527,13 @@ class SetSbasReservedHealthForSV(CommandBase):
 
 class SetSbasServiceHealthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, health):
         CommandBase.__init__(self, "SetSbasServiceHealthForSV")
         self.setSvId(svId)
         self.setHealth(health)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -16904,15 +16560,14 @@ class SetSbasServiceHealthForSV(CommandBase):
 
 class ResetPerturbations(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, dataSetName=None):
         CommandBase.__init__(self, "ResetPerturbations")
         self.setSystem(system)
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -16951,6 +16606,8 @@ class ResetPerturbations(CommandBase):
 
 class SetPerturbations(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, crs, crc, cis, cic, cus, cuc, dataSetName=None):
         CommandBase.__init__(self, "SetPerturbations")
         self.setSystem(system)
@@ -16963,9 +16620,6 @@ class SetPerturbations(CommandBase):
         self.setCuc(cuc)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -17034,15 +16688,14 @@ class SetPerturbations(CommandBase):
 
 class GetPerturbations(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, dataSetName=None):
         CommandBase.__init__(self, "GetPerturbations")
         self.setSystem(system)
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -17170,6 +16823,8 @@ class GetPerturbationsResult(CommandResult):
 
 class SetPerturbationsForAllSat(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, crs, crc, cis, cic, cus, cuc, dataSetName=None):
         CommandBase.__init__(self, "SetPerturbationsForAllSat")
         self.setSystem(system)
@@ -17181,9 +16836,6 @@ class SetPerturbationsForAllSat(CommandBase):
         self.setCuc(cuc)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -17246,14 +16898,13 @@ class SetPerturbationsForAllSat(CommandBase):
 
 class GetPerturbationsForAllSat(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, dataSetName=None):
         CommandBase.__init__(self, "GetPerturbationsForAllSat")
         self.setSystem(system)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -17393,6 +17044,10 @@ class GetPerturbationsForAllSatResult(CommandResult):
 
 class SetMessageModificationToGpsCNav(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -17416,11 +17071,6 @@ class SetMessageModificationToGpsCNav(CommandBase):
         self.setBitModifications(bitModifications)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -17487,13 +17137,12 @@ class SetMessageModificationToGpsCNav(CommandBase):
 
 class GetMessageModificationToGpsCNav(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToGpsCNav")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -17646,6 +17295,10 @@ class GetMessageModificationToGpsCNavResult(CommandResult):
 
 class SetMessageModificationToGpsCNav2(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -17669,11 +17322,6 @@ class SetMessageModificationToGpsCNav2(CommandBase):
         self.setBitModifications(bitModifications)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -17740,13 +17388,12 @@ class SetMessageModificationToGpsCNav2(CommandBase):
 
 class GetMessageModificationToGpsCNav2(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToGpsCNav2")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -17893,6 +17540,10 @@ class GetMessageModificationToGpsCNav2Result(CommandResult):
 
 class SetMessageModificationToGpsLNav(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -17918,11 +17569,6 @@ class SetMessageModificationToGpsLNav(CommandBase):
         self.setWordModification(wordModification)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -17995,13 +17641,12 @@ class SetMessageModificationToGpsLNav(CommandBase):
 
 class GetMessageModificationToGpsLNav(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToGpsLNav")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -18158,6 +17803,10 @@ class GetMessageModificationToGpsLNavResult(CommandResult):
 
 class SetMessageModificationToGalileoCNav(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self, signalArray, svId, startTime, stopTime, updateCRC, bitModifications, id
     ):
@@ -18170,11 +17819,6 @@ class SetMessageModificationToGalileoCNav(CommandBase):
         self.setBitModifications(bitModifications)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -18229,13 +17873,12 @@ class SetMessageModificationToGalileoCNav(CommandBase):
 
 class GetMessageModificationToGalileoCNav(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToGalileoCNav")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -18361,6 +18004,10 @@ class GetMessageModificationToGalileoCNavResult(CommandResult):
 
 class SetMessageModificationToGalileoFNav(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -18386,11 +18033,6 @@ class SetMessageModificationToGalileoFNav(CommandBase):
         self.setBitModifications(bitModifications)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -18463,13 +18105,12 @@ class SetMessageModificationToGalileoFNav(CommandBase):
 
 class GetMessageModificationToGalileoFNav(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToGalileoFNav")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -18629,6 +18270,10 @@ class GetMessageModificationToGalileoFNavResult(CommandResult):
 
 class SetMessageModificationToGalileoINav(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -18654,11 +18299,6 @@ class SetMessageModificationToGalileoINav(CommandBase):
         self.setBitModifications(bitModifications)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -18731,13 +18371,12 @@ class SetMessageModificationToGalileoINav(CommandBase):
 
 class GetMessageModificationToGalileoINav(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToGalileoINav")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -18898,6 +18537,10 @@ class GetMessageModificationToGalileoINavResult(CommandResult):
 
 class SetMessageModificationToGlonassNav(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -18921,11 +18564,6 @@ class SetMessageModificationToGlonassNav(CommandBase):
         self.setStringModification(stringModification)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -18992,13 +18630,12 @@ class SetMessageModificationToGlonassNav(CommandBase):
 
 class GetMessageModificationToGlonassNav(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToGlonassNav")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -19145,6 +18782,10 @@ class GetMessageModificationToGlonassNavResult(CommandResult):
 
 class SetMessageModificationToBeiDouD1Nav(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -19170,11 +18811,6 @@ class SetMessageModificationToBeiDouD1Nav(CommandBase):
         self.setWordModification(wordModification)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -19247,13 +18883,12 @@ class SetMessageModificationToBeiDouD1Nav(CommandBase):
 
 class GetMessageModificationToBeiDouD1Nav(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToBeiDouD1Nav")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -19409,6 +19044,10 @@ class GetMessageModificationToBeiDouD1NavResult(CommandResult):
 
 class SetMessageModificationToBeiDouD2Nav(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -19434,11 +19073,6 @@ class SetMessageModificationToBeiDouD2Nav(CommandBase):
         self.setWordModification(wordModification)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -19511,13 +19145,12 @@ class SetMessageModificationToBeiDouD2Nav(CommandBase):
 
 class GetMessageModificationToBeiDouD2Nav(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToBeiDouD2Nav")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -19679,6 +19312,10 @@ class GetMessageModificationToBeiDouD2NavResult(CommandResult):
 
 class SetMessageModificationToBeiDouCNav1(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -19702,11 +19339,6 @@ class SetMessageModificationToBeiDouCNav1(CommandBase):
         self.setBitModifications(bitModifications)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -19773,13 +19405,12 @@ class SetMessageModificationToBeiDouCNav1(CommandBase):
 
 class GetMessageModificationToBeiDouCNav1(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToBeiDouCNav1")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -19932,6 +19563,10 @@ class GetMessageModificationToBeiDouCNav1Result(CommandResult):
 
 class SetMessageModificationToBeiDouCNav2(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -19955,11 +19590,6 @@ class SetMessageModificationToBeiDouCNav2(CommandBase):
         self.setBitModifications(bitModifications)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -20026,13 +19656,12 @@ class SetMessageModificationToBeiDouCNav2(CommandBase):
 
 class GetMessageModificationToBeiDouCNav2(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToBeiDouCNav2")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -20179,6 +19808,10 @@ class GetMessageModificationToBeiDouCNav2Result(CommandResult):
 
 class SetMessageModificationToQzssLNav(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -20204,11 +19837,6 @@ class SetMessageModificationToQzssLNav(CommandBase):
         self.setWordModification(wordModification)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -20281,13 +19909,12 @@ class SetMessageModificationToQzssLNav(CommandBase):
 
 class GetMessageModificationToQzssLNav(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToQzssLNav")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -20449,6 +20076,10 @@ class GetMessageModificationToQzssLNavResult(CommandResult):
 
 class SetMessageModificationToQzssSlas(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -20472,11 +20103,6 @@ class SetMessageModificationToQzssSlas(CommandBase):
         self.setBitModifications(bitModifications)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -20543,13 +20169,12 @@ class SetMessageModificationToQzssSlas(CommandBase):
 
 class GetMessageModificationToQzssSlas(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToQzssSlas")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -20702,6 +20327,10 @@ class GetMessageModificationToQzssSlasResult(CommandResult):
 
 class SetMessageModificationToQzssCNav(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -20725,11 +20354,6 @@ class SetMessageModificationToQzssCNav(CommandBase):
         self.setBitModifications(bitModifications)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -20796,13 +20420,12 @@ class SetMessageModificationToQzssCNav(CommandBase):
 
 class GetMessageModificationToQzssCNav(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToQzssCNav")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -20955,6 +20578,10 @@ class GetMessageModificationToQzssCNavResult(CommandResult):
 
 class SetMessageModificationToQzssCNav2(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -20978,11 +20605,6 @@ class SetMessageModificationToQzssCNav2(CommandBase):
         self.setBitModifications(bitModifications)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -21049,13 +20671,12 @@ class SetMessageModificationToQzssCNav2(CommandBase):
 
 class GetMessageModificationToQzssCNav2(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToQzssCNav2")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -21209,6 +20830,10 @@ class GetMessageModificationToQzssCNav2Result(CommandResult):
 
 class SetMessageModificationToNavICNav(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -21234,11 +20859,6 @@ class SetMessageModificationToNavICNav(CommandBase):
         self.setBitModifications(bitModifications)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -21311,13 +20931,12 @@ class SetMessageModificationToNavICNav(CommandBase):
 
 class GetMessageModificationToNavICNav(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToNavICNav")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -21479,6 +21098,10 @@ class GetMessageModificationToNavICNavResult(CommandResult):
 
 class SetMessageModificationToSbasNav(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -21502,11 +21125,6 @@ class SetMessageModificationToSbasNav(CommandBase):
         self.setBitModifications(bitModifications)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -21573,13 +21191,12 @@ class SetMessageModificationToSbasNav(CommandBase):
 
 class GetMessageModificationToSbasNav(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToSbasNav")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -21731,6 +21348,10 @@ class GetMessageModificationToSbasNavResult(CommandResult):
 
 class SetMessageModificationToPulsarNav(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -21752,11 +21373,6 @@ class SetMessageModificationToPulsarNav(CommandBase):
         self.setBitModifications(bitModifications)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -21817,13 +21433,12 @@ class SetMessageModificationToPulsarNav(CommandBase):
 
 class GetMessageModificationToPulsarNav(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToPulsarNav")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -21967,6 +21582,10 @@ class GetMessageModificationToPulsarNavResult(CommandResult):
 
 class SetMessageModificationToPulsarX1(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -21990,11 +21609,6 @@ class SetMessageModificationToPulsarX1(CommandBase):
         self.setBitModifications(bitModifications)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -22061,13 +21675,12 @@ class SetMessageModificationToPulsarX1(CommandBase):
 
 class GetMessageModificationToPulsarX1(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToPulsarX1")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -22219,6 +21832,10 @@ class GetMessageModificationToPulsarX1Result(CommandResult):
 
 class SetMessageModificationToPulsarX5(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         signalArray,
@@ -22240,11 +21857,6 @@ class SetMessageModificationToPulsarX5(CommandBase):
         self.setBitModifications(bitModifications)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -22305,13 +21917,12 @@ class SetMessageModificationToPulsarX5(CommandBase):
 
 class GetMessageModificationToPulsarX5(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMessageModificationToPulsarX5")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -22422,14 +22033,13 @@ class GetMessageModificationToPulsarX5Result(CommandResult):
 
 class RemoveMessageModificationForNavMsgFamily(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, navMsgFamily, id):
         CommandBase.__init__(self, "RemoveMessageModificationForNavMsgFamily")
         self.setNavMsgFamily(navMsgFamily)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def navMsgFamily(self):
         return self.get("NavMsgFamily")
 
@@ -22454,13 +22064,12 @@ class RemoveMessageModificationForNavMsgFamily(CommandBase):
 
 class ClearAllMessageModificationsForNavMsgFamily(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, navMsgFamily):
         CommandBase.__init__(self, "ClearAllMessageModificationsForNavMsgFamily")
         self.setNavMsgFamily(navMsgFamily)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def navMsgFamily(self):
         return self.get("NavMsgFamily")
 
@@ -22480,14 +22089,13 @@ class ClearAllMessageModificationsForNavMsgFamily(CommandBase):
 
 class GetAllMessageModificationIdsForNavMsgFamily(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, navMsgFamily, svId):
         CommandBase.__init__(self, "GetAllMessageModificationIdsForNavMsgFamily")
         self.setNavMsgFamily(navMsgFamily)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def navMsgFamily(self):
         return self.get("NavMsgFamily")
 
@@ -22543,14 +22151,13 @@ class GetAllMessageModificationIdsForNavMsgFamilyResult(CommandResult):
 
 class RemoveMessageModificationForSignal(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal, id):
         CommandBase.__init__(self, "RemoveMessageModificationForSignal")
         self.setSignal(signal)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -22581,14 +22188,13 @@ class RemoveMessageModificationForSignal(CommandBase):
 
 class RemoveMessageModification(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal, id):
         CommandBase.__init__(self, "RemoveMessageModification")
         self.setSignal(signal)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -22616,13 +22222,12 @@ class RemoveMessageModification(CommandBase):
 
 class ClearAllMessageModificationsForSignal(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal):
         CommandBase.__init__(self, "ClearAllMessageModificationsForSignal")
         self.setSignal(signal)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -22646,13 +22251,12 @@ class ClearAllMessageModificationsForSignal(CommandBase):
 
 class ClearAllMessageModifications(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal):
         CommandBase.__init__(self, "ClearAllMessageModifications")
         self.setSignal(signal)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -22675,14 +22279,13 @@ class ClearAllMessageModifications(CommandBase):
 
 class GetAllMessageModificationIdsForSignal(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal, svId):
         CommandBase.__init__(self, "GetAllMessageModificationIdsForSignal")
         self.setSignal(signal)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -22739,6 +22342,10 @@ class GetAllMessageModificationIdsForSignalResult(CommandResult):
 
 class SetInterferenceAWGN(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self, startTime, stopTime, centralFreq, power, bandwidth, enabled, id, seed=None
     ):
@@ -22752,11 +22359,6 @@ class SetInterferenceAWGN(CommandBase):
         self.setId(id)
         self.setSeed(seed)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def startTime(self):
         return self.get("StartTime")
 
@@ -22826,6 +22428,10 @@ class SetInterferenceAWGN(CommandBase):
 
 class SetInterferenceBOC(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         startTime,
@@ -22851,11 +22457,6 @@ class SetInterferenceBOC(CommandBase):
         self.setEnabled(enabled)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def startTime(self):
         return self.get("StartTime")
 
@@ -22936,6 +22537,10 @@ class SetInterferenceBOC(CommandBase):
 
 class SetInterferenceBPSK(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         startTime,
@@ -22959,11 +22564,6 @@ class SetInterferenceBPSK(CommandBase):
         self.setId(id)
         self.setPrn(prn)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def startTime(self):
         return self.get("StartTime")
 
@@ -23035,6 +22635,10 @@ class SetInterferenceBPSK(CommandBase):
 
 class SetInterferenceCW(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, startTime, stopTime, centralFreq, power, enabled, id):
         CommandBase.__init__(self, "SetInterferenceCW")
         self.setStartTime(startTime)
@@ -23044,11 +22648,6 @@ class SetInterferenceCW(CommandBase):
         self.setEnabled(enabled)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def startTime(self):
         return self.get("StartTime")
 
@@ -23104,6 +22703,10 @@ class SetInterferenceCW(CommandBase):
 
 class SetInterferenceChirp(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self, startTime, stopTime, centralFreq, power, bandwidth, sweepTime, enabled, id
     ):
@@ -23117,11 +22720,6 @@ class SetInterferenceChirp(CommandBase):
         self.setEnabled(enabled)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def startTime(self):
         return self.get("StartTime")
 
@@ -23182,13 +22780,12 @@ class SetInterferenceChirp(CommandBase):
 
 class RemoveInterference(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "RemoveInterference")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -23204,12 +22801,11 @@ class RemoveInterference(CommandBase):
 
 class RemoveAllInterferences(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "RemoveAllInterferences")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Set PSR ramp event. This function lets user change the pseudorange of any satellite.
@@ -23241,6 +22837,10 @@ class RemoveAllInterferences(CommandBase):
 
 class SetPseudorangeRampForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self, system, svId, offset, startTime, holdStartTime, holdStopTime, stopTime, id
     ):
@@ -23254,131 +22854,125 @@ class SetPseudorangeRampForSV(CommandBase):
         self.setStopTime(stopTime)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
-    def system(self):
-        return self.get("System")
-
-    def setSystem(self, value)-> None:
-        return self.set("System", value)
-
-    def svId(self):
-        return self.get("SvId")
-
-    def setSvId(self, value)-> None:
-        return self.set("SvId", value)
-
-    def offset(self):
-        return self.get("Offset")
-
-    def setOffset(self, value)-> None:
-        return self.set("Offset", value)
-
-    def startTime(self):
-        return self.get("StartTime")
-
-    def setStartTime(self, value)-> None:
-        return self.set("StartTime", value)
-
-    def holdStartTime(self):
-        return self.get("HoldStartTime")
-
-    def setHoldStartTime(self, value)-> None:
-        return self.set("HoldStartTime", value)
-
-    def holdStopTime(self):
-        return self.get("HoldStopTime")
-
-    def setHoldStopTime(self, value)-> None:
-        return self.set("HoldStopTime", value)
-
-    def stopTime(self):
-        return self.get("StopTime")
-
-    def setStopTime(self, value)-> None:
-        return self.set("StopTime", value)
-
-    def id(self):
-        return self.get("Id")
-
-    def setId(self, value)-> None:
-        return self.set("Id", value)
-
-
-#
-# Get PSR ramp event. This function lets user change the pseudorange of any satellite.
-# If SV ID is set to 0, the change is applied to all satellites.
-#
-#           Hold Start Time
-#           |         Hold Stop Time
-#           |         |
-#           ...........
-#          ..         ...
-#         ..            ...
-#   .......               .........> Time
-#         |               |
-#         Start Time      Stop Time
-#
-# Name Type   Description
-# ---- ------ -----------------------------------------------------------------
-# Id   string Unique identifier automatically set by simulator if empty string.
-#             The IDs pool is common between all system.
-#
-
-
-class GetPseudorangeRampForSV(CommandBase):
-
-    def __init__(self, id):
-        CommandBase.__init__(self, "GetPseudorangeRampForSV")
-        self.setId(id)
-
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
-    def id(self):
-        return self.get("Id")
-
-    def setId(self, value)-> None:
-        return self.set("Id", value)
-
-
-#
-# Result of GetPseudorangeRampForSV.
-#
-# Name          Type   Description
-# ------------- ------ ----------------------------------------------------------------------------------
-# System        string "GPS", "GLONASS", "Galileo", "BeiDou", "SBAS", "QZSS", "NavIC" or "PULSAR"
-# SvId          int    The satellite's SV ID.
-# Offset        double Change to satellite pseudorange in meter when ramp is at maximum. Range -1e7..+1e7
-# StartTime     int    Elapsed time in seconds since start of simulation.
-# HoldStartTime int    Elapsed time in seconds since start of simulation. HoldStartTime >= StartTime
-# HoldStopTime  int    Elapsed time in seconds since start of simulation. HoldStopTime >= HoldStartTime
-# StopTime      int    Elapsed time in seconds since start of simulation. StopTime >= HoldStopTime
-# Id            string Unique identifier automatically set by simulator if empty string.
-#                      The IDs pool is common between all system.
-#
-
-
-class GetPseudorangeRampForSVResult(CommandResult):
-
-    def __init__(
-        self, system, svId, offset, startTime, holdStartTime, holdStopTime, stopTime, id
-    ):
-        CommandResult.__init__(self, "GetPseudorangeRampForSVResult")
-        self.setSystem(system)
-        self.setSvId(svId)
-        self.setOffset(offset)
-        self.setStartTime(startTime)
-        self.setHoldStartTime(holdStartTime)
-        self.setHoldStopTime(holdStopTime)
-        self.setStopTime(stopTime)
-        self.setId(id)
-
-    def isSuccess(self) -> Literal[True]:
-        return True
+    def system(self):
+        return self.get("System")
+
+    def setSystem(self, value)-> None:
+        return self.set("System", value)
+
+    def svId(self):
+        return self.get("SvId")
+
+    def setSvId(self, value)-> None:
+        return self.set("SvId", value)
+
+    def offset(self):
+        return self.get("Offset")
+
+    def setOffset(self, value)-> None:
+        return self.set("Offset", value)
+
+    def startTime(self):
+        return self.get("StartTime")
+
+    def setStartTime(self, value)-> None:
+        return self.set("StartTime", value)
+
+    def holdStartTime(self):
+        return self.get("HoldStartTime")
+
+    def setHoldStartTime(self, value)-> None:
+        return self.set("HoldStartTime", value)
+
+    def holdStopTime(self):
+        return self.get("HoldStopTime")
+
+    def setHoldStopTime(self, value)-> None:
+        return self.set("HoldStopTime", value)
+
+    def stopTime(self):
+        return self.get("StopTime")
+
+    def setStopTime(self, value)-> None:
+        return self.set("StopTime", value)
+
+    def id(self):
+        return self.get("Id")
+
+    def setId(self, value)-> None:
+        return self.set("Id", value)
+
+
+#
+# Get PSR ramp event. This function lets user change the pseudorange of any satellite.
+# If SV ID is set to 0, the change is applied to all satellites.
+#
+#           Hold Start Time
+#           |         Hold Stop Time
+#           |         |
+#           ...........
+#          ..         ...
+#         ..            ...
+#   .......               .........> Time
+#         |               |
+#         Start Time      Stop Time
+#
+# Name Type   Description
+# ---- ------ -----------------------------------------------------------------
+# Id   string Unique identifier automatically set by simulator if empty string.
+#             The IDs pool is common between all system.
+#
+
+
+class GetPseudorangeRampForSV(CommandBase):
+
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
+    def __init__(self, id):
+        CommandBase.__init__(self, "GetPseudorangeRampForSV")
+        self.setId(id)
+
+    def id(self):
+        return self.get("Id")
+
+    def setId(self, value)-> None:
+        return self.set("Id", value)
+
+
+#
+# Result of GetPseudorangeRampForSV.
+#
+# Name          Type   Description
+# ------------- ------ ----------------------------------------------------------------------------------
+# System        string "GPS", "GLONASS", "Galileo", "BeiDou", "SBAS", "QZSS", "NavIC" or "PULSAR"
+# SvId          int    The satellite's SV ID.
+# Offset        double Change to satellite pseudorange in meter when ramp is at maximum. Range -1e7..+1e7
+# StartTime     int    Elapsed time in seconds since start of simulation.
+# HoldStartTime int    Elapsed time in seconds since start of simulation. HoldStartTime >= StartTime
+# HoldStopTime  int    Elapsed time in seconds since start of simulation. HoldStopTime >= HoldStartTime
+# StopTime      int    Elapsed time in seconds since start of simulation. StopTime >= HoldStopTime
+# Id            string Unique identifier automatically set by simulator if empty string.
+#                      The IDs pool is common between all system.
+#
+
+
+class GetPseudorangeRampForSVResult(CommandResult):
+
+    def __init__(
+        self, system, svId, offset, startTime, holdStartTime, holdStopTime, stopTime, id
+    ):
+        CommandResult.__init__(self, "GetPseudorangeRampForSVResult")
+        self.setSystem(system)
+        self.setSvId(svId)
+        self.setOffset(offset)
+        self.setStartTime(startTime)
+        self.setHoldStartTime(holdStartTime)
+        self.setHoldStopTime(holdStopTime)
+        self.setStopTime(stopTime)
+        self.setId(id)
+
+    def isSuccess(self) -> Literal[True]:
+        return True
 
     def system(self):
         return self.get("System")
@@ -23441,14 +23035,13 @@ class GetPseudorangeRampForSVResult(CommandResult):
 
 class GetAllPseudorangeRampForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId):
         CommandBase.__init__(self, "GetAllPseudorangeRampForSV")
         self.setSystem(system)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -23516,14 +23109,13 @@ class GetAllPseudorangeRampForSVResult(CommandResult):
 
 class RemovePseudorangeRamp(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, id):
         CommandBase.__init__(self, "RemovePseudorangeRamp")
         self.setSystem(system)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -23549,14 +23141,13 @@ class RemovePseudorangeRamp(CommandBase):
 
 class RemoveAllPseudorangeRampForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId):
         CommandBase.__init__(self, "RemoveAllPseudorangeRampForSV")
         self.setSystem(system)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -23581,13 +23172,12 @@ class RemoveAllPseudorangeRampForSV(CommandBase):
 
 class RemoveAllPseudorangeRampForSystem(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system):
         CommandBase.__init__(self, "RemoveAllPseudorangeRampForSystem")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -23608,13 +23198,12 @@ class RemoveAllPseudorangeRampForSystem(CommandBase):
 
 class RemoveAllPseudorangeRamp(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system):
         CommandBase.__init__(self, "RemoveAllPseudorangeRamp")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -23634,14 +23223,13 @@ class RemoveAllPseudorangeRamp(CommandBase):
 
 class SetAlmanacInitialUploadTimeOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, offset):
         CommandBase.__init__(self, "SetAlmanacInitialUploadTimeOffset")
         self.setSystem(system)
         self.setOffset(offset)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -23663,12 +23251,11 @@ class SetAlmanacInitialUploadTimeOffset(CommandBase):
 
 class GetAlmanacInitialUploadTimeOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetAlmanacInitialUploadTimeOffset")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetAlmanacInitialUploadTimeOffset.
@@ -23716,14 +23303,13 @@ class GetAlmanacInitialUploadTimeOffsetResult(CommandResult):
 
 class SetAlmanacUploadTimeInterval(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, interval):
         CommandBase.__init__(self, "SetAlmanacUploadTimeInterval")
         self.setSystem(system)
         self.setInterval(interval)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -23746,12 +23332,11 @@ class SetAlmanacUploadTimeInterval(CommandBase):
 
 class GetAlmanacUploadTimeInterval(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetAlmanacUploadTimeInterval")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetAlmanacUploadTimeInterval.
@@ -23798,14 +23383,13 @@ class GetAlmanacUploadTimeIntervalResult(CommandResult):
 
 class SetEphemerisUpdateInterval(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, interval):
         CommandBase.__init__(self, "SetEphemerisUpdateInterval")
         self.setSystem(system)
         self.setInterval(interval)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -23830,13 +23414,12 @@ class SetEphemerisUpdateInterval(CommandBase):
 
 class GetEphemerisUpdateInterval(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system):
         CommandBase.__init__(self, "GetEphemerisUpdateInterval")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -23889,14 +23472,13 @@ class GetEphemerisUpdateIntervalResult(CommandResult):
 
 class SetEphemerisTocOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, offset):
         CommandBase.__init__(self, "SetEphemerisTocOffset")
         self.setSystem(system)
         self.setOffset(offset)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -23921,13 +23503,12 @@ class SetEphemerisTocOffset(CommandBase):
 
 class GetEphemerisTocOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system):
         CommandBase.__init__(self, "GetEphemerisTocOffset")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -23990,6 +23571,10 @@ class GetEphemerisTocOffsetResult(CommandResult):
 
 class SetMultipathForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self, signal, svId, powerLoss, pseudorange, doppler, carrierPhase, echo, id
     ):
@@ -24003,11 +23588,6 @@ class SetMultipathForSV(CommandBase):
         self.setEcho(echo)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def signal(self):
         return self.get("Signal")
 
@@ -24069,16 +23649,15 @@ class SetMultipathForSV(CommandBase):
 
 class EnableMultipath(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, enabled, id):
         CommandBase.__init__(self, "EnableMultipath")
         self.setEnabled(enabled)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -24103,15 +23682,14 @@ class EnableMultipath(CommandBase):
 
 class RemoveMultipath(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, id):
         CommandBase.__init__(self, "RemoveMultipath")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def id(self):
         return self.get("Id")
 
@@ -24134,14 +23712,13 @@ class RemoveMultipath(CommandBase):
 
 class RemoveAllMultipathForSignal(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal, reset):
         CommandBase.__init__(self, "RemoveAllMultipathForSignal")
         self.setSignal(signal)
         self.setReset(reset)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -24168,15 +23745,14 @@ class RemoveAllMultipathForSignal(CommandBase):
 
 class RemoveAllMultipathForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, reset):
         CommandBase.__init__(self, "RemoveAllMultipathForSV")
         self.setSystem(system)
         self.setSvId(svId)
         self.setReset(reset)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -24208,14 +23784,13 @@ class RemoveAllMultipathForSV(CommandBase):
 
 class RemoveAllMultipathForSystem(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, reset):
         CommandBase.__init__(self, "RemoveAllMultipathForSystem")
         self.setSystem(system)
         self.setReset(reset)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -24240,13 +23815,12 @@ class RemoveAllMultipathForSystem(CommandBase):
 
 class GetMultipathForID(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMultipathForID")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -24368,13 +23942,12 @@ class GetMultipathForIDResult(CommandResult):
 
 class GetAllMultipathForSystem(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system):
         CommandBase.__init__(self, "GetAllMultipathForSystem")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -24394,14 +23967,13 @@ class GetAllMultipathForSystem(CommandBase):
 
 class GetAllMultipathForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId):
         CommandBase.__init__(self, "GetAllMultipathForSV")
         self.setSystem(system)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -24429,13 +24001,12 @@ class GetAllMultipathForSV(CommandBase):
 
 class GetAllMultipathForSignal(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal):
         CommandBase.__init__(self, "GetAllMultipathForSignal")
         self.setSignal(signal)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -24481,17 +24052,16 @@ class GetAllMultipathForResult(CommandResult):
 
 class EnableLosForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, system, svId, enabled):
         CommandBase.__init__(self, "EnableLosForSV")
         self.setSystem(system)
         self.setSvId(svId)
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def system(self):
         return self.get("System")
 
@@ -24523,14 +24093,13 @@ class EnableLosForSV(CommandBase):
 
 class IsLosEnabledForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId):
         CommandBase.__init__(self, "IsLosEnabledForSV")
         self.setSystem(system)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -24596,15 +24165,14 @@ class IsLosEnabledForSVResult(CommandResult):
 
 class ClearAllLOSForSystem(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, system):
         CommandBase.__init__(self, "ClearAllLOSForSystem")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def system(self):
         return self.get("System")
 
@@ -24624,16 +24192,15 @@ class ClearAllLOSForSystem(CommandBase):
 
 class EnableLosForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, system, enabled):
         CommandBase.__init__(self, "EnableLosForEachSV")
         self.setSystem(system)
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def system(self):
         return self.get("System")
 
@@ -24658,13 +24225,12 @@ class EnableLosForEachSV(CommandBase):
 
 class IsLOSEnabledForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system):
         CommandBase.__init__(self, "IsLOSEnabledForEachSV")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -24717,14 +24283,13 @@ class IsLOSEnabledForEachSVResult(CommandResult):
 
 class EnablePlugin(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id, enabled):
         CommandBase.__init__(self, "EnablePlugin")
         self.setId(id)
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -24749,13 +24314,12 @@ class EnablePlugin(CommandBase):
 
 class IsPluginEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "IsPluginEnabled")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -24804,12 +24368,11 @@ class IsPluginEnabledResult(CommandResult):
 
 class GetPlugins(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetPlugins")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetPlugins.
@@ -24847,13 +24410,12 @@ class GetPluginsResult(CommandResult):
 
 class SetDefaultIntTxPersistence(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, defaultValue):
         CommandBase.__init__(self, "SetDefaultIntTxPersistence")
         self.setDefaultValue(defaultValue)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def defaultValue(self):
         return self.get("DefaultValue")
 
@@ -24869,12 +24431,11 @@ class SetDefaultIntTxPersistence(CommandBase):
 
 class GetDefaultIntTxPersistence(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetDefaultIntTxPersistence")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetDefaultIntTxPersistence.
@@ -24909,12 +24470,11 @@ class GetDefaultIntTxPersistenceResult(CommandResult):
 
 class GetAllIntTxID(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetAllIntTxID")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetAllIntTxID.
@@ -24959,6 +24519,10 @@ class GetAllIntTxIDResult(CommandResult):
 
 class AddIntTx(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, usualName, enabled, group, dynamic, power, id):
         CommandBase.__init__(self, "AddIntTx")
         self.setUsualName(usualName)
@@ -24968,11 +24532,6 @@ class AddIntTx(CommandBase):
         self.setPower(power)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def usualName(self):
         return self.get("UsualName")
 
@@ -25021,13 +24580,12 @@ class AddIntTx(CommandBase):
 
 class GetIntTx(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetIntTx")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -25112,16 +24670,15 @@ class GetIntTxResult(CommandResult):
 
 class RenameIntTx(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, usualName, id):
         CommandBase.__init__(self, "RenameIntTx")
         self.setUsualName(usualName)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def usualName(self):
         return self.get("UsualName")
 
@@ -25147,16 +24704,15 @@ class RenameIntTx(CommandBase):
 
 class ChangeIntTxColor(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, color, id):
         CommandBase.__init__(self, "ChangeIntTxColor")
         self.setColor(color)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def color(self):
         return self.get("Color")
 
@@ -25181,13 +24737,12 @@ class ChangeIntTxColor(CommandBase):
 
 class GetIntTxColor(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetIntTxColor")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -25240,16 +24795,15 @@ class GetIntTxColorResult(CommandResult):
 
 class EnableIntTx(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, enabled, id):
         CommandBase.__init__(self, "EnableIntTx")
         self.setEnabled(enabled)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -25275,16 +24829,15 @@ class EnableIntTx(CommandBase):
 
 class SetIntTxGroup(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, group, id):
         CommandBase.__init__(self, "SetIntTxGroup")
         self.setGroup(group)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def group(self):
         return self.get("Group")
 
@@ -25310,16 +24863,15 @@ class SetIntTxGroup(CommandBase):
 
 class SetIntTxRefPower(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, power, id):
         CommandBase.__init__(self, "SetIntTxRefPower")
         self.setPower(power)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def power(self):
         return self.get("Power")
 
@@ -25345,16 +24897,15 @@ class SetIntTxRefPower(CommandBase):
 
 class SetIntTxPersistence(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, persistence, id):
         CommandBase.__init__(self, "SetIntTxPersistence")
         self.setPersistence(persistence)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def persistence(self):
         return self.get("Persistence")
 
@@ -25379,13 +24930,12 @@ class SetIntTxPersistence(CommandBase):
 
 class GetIntTxPersistence(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetIntTxPersistence")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -25439,17 +24989,16 @@ class GetIntTxPersistenceResult(CommandResult):
 
 class SetIntTxSignalManualPropagationLoss(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, propagationLoss, transmitterId, signalId):
         CommandBase.__init__(self, "SetIntTxSignalManualPropagationLoss")
         self.setPropagationLoss(propagationLoss)
         self.setTransmitterId(transmitterId)
         self.setSignalId(signalId)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def propagationLoss(self):
         return self.get("PropagationLoss")
 
@@ -25481,16 +25030,15 @@ class SetIntTxSignalManualPropagationLoss(CommandBase):
 
 class SetIntTxUseManualPropagationLoss(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, manual, id):
         CommandBase.__init__(self, "SetIntTxUseManualPropagationLoss")
         self.setManual(manual)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def manual(self):
         return self.get("Manual")
 
@@ -25516,16 +25064,15 @@ class SetIntTxUseManualPropagationLoss(CommandBase):
 
 class SetIntTxIgnorePropagationLoss(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, ignore, id):
         CommandBase.__init__(self, "SetIntTxIgnorePropagationLoss")
         self.setIgnore(ignore)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def ignore(self):
         return self.get("Ignore")
 
@@ -25551,16 +25098,15 @@ class SetIntTxIgnorePropagationLoss(CommandBase):
 
 class SetIntTxIgnoreRxAntennaPatterns(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, ignore, id):
         CommandBase.__init__(self, "SetIntTxIgnoreRxAntennaPatterns")
         self.setIgnore(ignore)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def ignore(self):
         return self.get("Ignore")
 
@@ -25588,16 +25134,15 @@ class SetIntTxIgnoreRxAntennaPatterns(CommandBase):
 
 class SetIntTxIgnoreVehicleAntennaPattern(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, ignore, id):
         CommandBase.__init__(self, "SetIntTxIgnoreVehicleAntennaPattern")
         self.setIgnore(ignore)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def ignore(self):
         return self.get("Ignore")
 
@@ -25623,16 +25168,15 @@ class SetIntTxIgnoreVehicleAntennaPattern(CommandBase):
 
 class SetIntTxHiddenOnMap(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, hiddenOnMap, id):
         CommandBase.__init__(self, "SetIntTxHiddenOnMap")
         self.setHiddenOnMap(hiddenOnMap)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def hiddenOnMap(self):
         return self.get("HiddenOnMap")
 
@@ -25657,13 +25201,12 @@ class SetIntTxHiddenOnMap(CommandBase):
 
 class GetIntTxHiddenOnMap(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetIntTxHiddenOnMap")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -25716,16 +25259,15 @@ class GetIntTxHiddenOnMapResult(CommandResult):
 
 class SetIntTxIgnoreRxAntennaGainPattern(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, ignore, id):
         CommandBase.__init__(self, "SetIntTxIgnoreRxAntennaGainPattern")
         self.setIgnore(ignore)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def ignore(self):
         return self.get("Ignore")
 
@@ -25750,13 +25292,12 @@ class SetIntTxIgnoreRxAntennaGainPattern(CommandBase):
 
 class IsIntTxIgnoreRxAntennaGainPattern(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "IsIntTxIgnoreRxAntennaGainPattern")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -25809,16 +25350,15 @@ class IsIntTxIgnoreRxAntennaGainPatternResult(CommandResult):
 
 class SetIntTxIgnoreRxAntennaPhasePattern(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, ignore, id):
         CommandBase.__init__(self, "SetIntTxIgnoreRxAntennaPhasePattern")
         self.setIgnore(ignore)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def ignore(self):
         return self.get("Ignore")
 
@@ -25843,13 +25383,12 @@ class SetIntTxIgnoreRxAntennaPhasePattern(CommandBase):
 
 class IsIntTxIgnoreRxAntennaPhasePattern(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "IsIntTxIgnoreRxAntennaPhasePattern")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -25901,15 +25440,14 @@ class IsIntTxIgnoreRxAntennaPhasePatternResult(CommandResult):
 
 class SetIntTxNone(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, id):
         CommandBase.__init__(self, "SetIntTxNone")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def id(self):
         return self.get("Id")
 
@@ -25934,6 +25472,10 @@ class SetIntTxNone(CommandBase):
 
 class SetIntTxFix(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, lat, lon, alt, yaw, pitch, roll, id):
         CommandBase.__init__(self, "SetIntTxFix")
         self.setLat(lat)
@@ -25944,11 +25486,6 @@ class SetIntTxFix(CommandBase):
         self.setRoll(roll)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def lat(self):
         return self.get("Lat")
 
@@ -26003,13 +25540,12 @@ class SetIntTxFix(CommandBase):
 
 class GetIntTxFix(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetIntTxFix")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -26107,6 +25643,10 @@ class GetIntTxFixResult(CommandResult):
 
 class SetIntTxFixEcef(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, x, y, z, yaw, pitch, roll, id):
         CommandBase.__init__(self, "SetIntTxFixEcef")
         self.setX(x)
@@ -26117,11 +25657,6 @@ class SetIntTxFixEcef(CommandBase):
         self.setRoll(roll)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def x(self):
         return self.get("X")
 
@@ -26176,13 +25711,12 @@ class SetIntTxFixEcef(CommandBase):
 
 class GetIntTxFixEcef(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetIntTxFixEcef")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -26281,6 +25815,10 @@ class GetIntTxFixEcefResult(CommandResult):
 
 class SetIntTxCircular(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, lat, lon, alt, radius, speed, clockwise, id, originAngle=None):
         CommandBase.__init__(self, "SetIntTxCircular")
         self.setLat(lat)
@@ -26292,11 +25830,6 @@ class SetIntTxCircular(CommandBase):
         self.setId(id)
         self.setOriginAngle(originAngle)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def lat(self):
         return self.get("Lat")
 
@@ -26357,13 +25890,12 @@ class SetIntTxCircular(CommandBase):
 
 class GetIntTxCircular(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetIntTxCircular")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -26463,15 +25995,14 @@ class GetIntTxCircularResult(CommandResult):
 
 class SetIntTxHil(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, id):
         CommandBase.__init__(self, "SetIntTxHil")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def id(self):
         return self.get("Id")
 
@@ -26493,13 +26024,12 @@ class SetIntTxHil(CommandBase):
 
 class BeginIntTxTrackDefinition(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "BeginIntTxTrackDefinition")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -26522,6 +26052,8 @@ class BeginIntTxTrackDefinition(CommandBase):
 
 class PushIntTxTrackEcef(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, time, x, y, z, id):
         CommandBase.__init__(self, "PushIntTxTrackEcef")
         self.setTime(time)
@@ -26530,9 +26062,6 @@ class PushIntTxTrackEcef(CommandBase):
         self.setZ(z)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def time(self):
         return self.get("Time")
 
@@ -26582,6 +26111,8 @@ class PushIntTxTrackEcef(CommandBase):
 
 class PushIntTxTrackEcefNed(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, time, x, y, z, yaw, pitch, roll, id):
         CommandBase.__init__(self, "PushIntTxTrackEcefNed")
         self.setTime(time)
@@ -26593,9 +26124,6 @@ class PushIntTxTrackEcefNed(CommandBase):
         self.setRoll(roll)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def time(self):
         return self.get("Time")
 
@@ -26659,13 +26187,12 @@ class PushIntTxTrackEcefNed(CommandBase):
 
 class EndIntTxTrackDefinition(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "EndIntTxTrackDefinition")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -26718,14 +26245,13 @@ class EndIntTxTrackDefinitionResult(CommandResult):
 
 class ImportNmeaIntTxTrack(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, path, id):
         CommandBase.__init__(self, "ImportNmeaIntTxTrack")
         self.setPath(path)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def path(self):
         return self.get("Path")
 
@@ -26751,14 +26277,13 @@ class ImportNmeaIntTxTrack(CommandBase):
 
 class EnableIntTxTrajectorySmoothing(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled, id):
         CommandBase.__init__(self, "EnableIntTxTrajectorySmoothing")
         self.setEnabled(enabled)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -26783,13 +26308,12 @@ class EnableIntTxTrajectorySmoothing(CommandBase):
 
 class IsIntTxTrajectorySmoothingEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "IsIntTxTrajectorySmoothingEnabled")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -26842,14 +26366,13 @@ class IsIntTxTrajectorySmoothingEnabledResult(CommandResult):
 
 class ForceIntTxAttitudeToZero(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled, id):
         CommandBase.__init__(self, "ForceIntTxAttitudeToZero")
         self.setEnabled(enabled)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -26874,13 +26397,12 @@ class ForceIntTxAttitudeToZero(CommandBase):
 
 class IsIntTxAttitudeToZeroForced(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "IsIntTxAttitudeToZeroForced")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -26933,14 +26455,13 @@ class IsIntTxAttitudeToZeroForcedResult(CommandResult):
 
 class SetIntTxVehicleType(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, type, id):
         CommandBase.__init__(self, "SetIntTxVehicleType")
         self.setType(type)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def type(self):
         return self.get("Type")
 
@@ -26965,13 +26486,12 @@ class SetIntTxVehicleType(CommandBase):
 
 class GetIntTxVehicleType(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetIntTxVehicleType")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -27023,13 +26543,12 @@ class GetIntTxVehicleTypeResult(CommandResult):
 
 class GetIntTxTrajectory(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetIntTxTrajectory")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -27083,17 +26602,16 @@ class GetIntTxTrajectoryResult(CommandResult):
 
 class SetIntTxAntenna(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, gain, type, id):
         CommandBase.__init__(self, "SetIntTxAntenna")
         self.setGain(gain)
         self.setType(type)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def gain(self):
         return self.get("Gain")
 
@@ -27124,13 +26642,12 @@ class SetIntTxAntenna(CommandBase):
 
 class GetIntTxAntenna(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetIntTxAntenna")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -27202,6 +26719,10 @@ class GetIntTxAntennaResult(CommandResult):
 
 class SetIntTxAntennaOffset(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, x, y, z, yaw, pitch, roll, id):
         CommandBase.__init__(self, "SetIntTxAntennaOffset")
         self.setX(x)
@@ -27212,11 +26733,6 @@ class SetIntTxAntennaOffset(CommandBase):
         self.setRoll(roll)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def x(self):
         return self.get("X")
 
@@ -27277,13 +26793,12 @@ class SetIntTxAntennaOffset(CommandBase):
 
 class GetIntTxAntennaOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetIntTxAntennaOffset")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -27376,15 +26891,14 @@ class GetIntTxAntennaOffsetResult(CommandResult):
 
 class RemoveIntTx(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, id):
         CommandBase.__init__(self, "RemoveIntTx")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def id(self):
         return self.get("Id")
 
@@ -27400,14 +26914,13 @@ class RemoveIntTx(CommandBase):
 
 class RemoveAllIntTx(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "RemoveAllIntTx")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
 
 #
 # Get all signal ID for this interference transmitters.
@@ -27420,13 +26933,12 @@ class RemoveAllIntTx(CommandBase):
 
 class GetAllSignalsFromIntTx(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetAllSignalsFromIntTx")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -27479,14 +26991,13 @@ class GetAllSignalsFromIntTxResult(CommandResult):
 
 class GetSignalFromIntTx(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, idTransmitter, signalType):
         CommandBase.__init__(self, "GetSignalFromIntTx")
         self.setIdTransmitter(idTransmitter)
         self.setSignalType(signalType)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def idTransmitter(self):
         return self.get("IdTransmitter")
 
@@ -27561,6 +27072,10 @@ class GetSignalFromIntTxResult(CommandResult):
 
 class SetIntTxCW(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         enabled,
@@ -27580,11 +27095,6 @@ class SetIntTxCW(CommandBase):
         self.setInitialPhaseOffset(initialPhaseOffset)
         self.setGroup(group)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -27640,14 +27150,13 @@ class SetIntTxCW(CommandBase):
 
 class GetIntTxCW(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, transmitterId, signalId):
         CommandBase.__init__(self, "GetIntTxCW")
         self.setTransmitterId(transmitterId)
         self.setSignalId(signalId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def transmitterId(self):
         return self.get("TransmitterId")
 
@@ -27764,6 +27273,10 @@ class GetIntTxCWResult(CommandResult):
 
 class SetIntTxChirp(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         enabled,
@@ -27785,11 +27298,6 @@ class SetIntTxChirp(CommandBase):
         self.setSignalId(signalId)
         self.setGroup(group)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -27851,14 +27359,13 @@ class SetIntTxChirp(CommandBase):
 
 class GetIntTxChirp(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, transmitterId, signalId):
         CommandBase.__init__(self, "GetIntTxChirp")
         self.setTransmitterId(transmitterId)
         self.setSignalId(signalId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def transmitterId(self):
         return self.get("TransmitterId")
 
@@ -27981,6 +27488,10 @@ class GetIntTxChirpResult(CommandResult):
 
 class SetIntTxPulse(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         enabled,
@@ -28002,11 +27513,6 @@ class SetIntTxPulse(CommandBase):
         self.setSignalId(signalId)
         self.setGroup(group)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -28068,14 +27574,13 @@ class SetIntTxPulse(CommandBase):
 
 class GetIntTxPulse(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, transmitterId, signalId):
         CommandBase.__init__(self, "GetIntTxPulse")
         self.setTransmitterId(transmitterId)
         self.setSignalId(signalId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def transmitterId(self):
         return self.get("TransmitterId")
 
@@ -28199,6 +27704,10 @@ class GetIntTxPulseResult(CommandResult):
 
 class SetIntTxBPSK(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         enabled,
@@ -28222,11 +27731,6 @@ class SetIntTxBPSK(CommandBase):
         self.setGroup(group)
         self.setPrn(prn)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -28294,14 +27798,13 @@ class SetIntTxBPSK(CommandBase):
 
 class GetIntTxBPSK(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, transmitterId, signalId):
         CommandBase.__init__(self, "GetIntTxBPSK")
         self.setTransmitterId(transmitterId)
         self.setSignalId(signalId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def transmitterId(self):
         return self.get("TransmitterId")
 
@@ -28435,6 +27938,10 @@ class GetIntTxBPSKResult(CommandResult):
 
 class SetIntTxBOC(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         enabled,
@@ -28460,11 +27967,6 @@ class SetIntTxBOC(CommandBase):
         self.setSignalId(signalId)
         self.setGroup(group)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -28538,14 +28040,13 @@ class SetIntTxBOC(CommandBase):
 
 class GetIntTxBOC(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, transmitterId, signalId):
         CommandBase.__init__(self, "GetIntTxBOC")
         self.setTransmitterId(transmitterId)
         self.setSignalId(signalId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def transmitterId(self):
         return self.get("TransmitterId")
 
@@ -28686,6 +28187,10 @@ class GetIntTxBOCResult(CommandResult):
 
 class SetIntTxAWGN(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self,
         enabled,
@@ -28707,11 +28212,6 @@ class SetIntTxAWGN(CommandBase):
         self.setSeed(seed)
         self.setGroup(group)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -28773,14 +28273,13 @@ class SetIntTxAWGN(CommandBase):
 
 class GetIntTxAWGN(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, transmitterId, signalId):
         CommandBase.__init__(self, "GetIntTxAWGN")
         self.setTransmitterId(transmitterId)
         self.setSignalId(signalId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def transmitterId(self):
         return self.get("TransmitterId")
 
@@ -28902,6 +28401,10 @@ class GetIntTxAWGNResult(CommandResult):
 
 class SetIntTxIqFile(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(
         self, enabled, centralFreq, power, path, transmitterId, signalId, group=None
     ):
@@ -28914,11 +28417,6 @@ class SetIntTxIqFile(CommandBase):
         self.setSignalId(signalId)
         self.setGroup(group)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -28974,14 +28472,13 @@ class SetIntTxIqFile(CommandBase):
 
 class GetIntTxIqFile(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, transmitterId, signalId):
         CommandBase.__init__(self, "GetIntTxIqFile")
         self.setTransmitterId(transmitterId)
         self.setSignalId(signalId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def transmitterId(self):
         return self.get("TransmitterId")
 
@@ -29083,17 +28580,16 @@ class GetIntTxIqFileResult(CommandResult):
 
 class EnableIntTxSignal(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, enabled, transmitterId, signalId):
         CommandBase.__init__(self, "EnableIntTxSignal")
         self.setEnabled(enabled)
         self.setTransmitterId(transmitterId)
         self.setSignalId(signalId)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -29125,16 +28621,15 @@ class EnableIntTxSignal(CommandBase):
 
 class RemoveSignalFromIntTx(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, transmitterId, signalId):
         CommandBase.__init__(self, "RemoveSignalFromIntTx")
         self.setTransmitterId(transmitterId)
         self.setSignalId(signalId)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def transmitterId(self):
         return self.get("TransmitterId")
 
@@ -29159,15 +28654,14 @@ class RemoveSignalFromIntTx(CommandBase):
 
 class RemoveAllSignalsFromIntTx(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, transmitterId):
         CommandBase.__init__(self, "RemoveAllSignalsFromIntTx")
         self.setTransmitterId(transmitterId)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def transmitterId(self):
         return self.get("TransmitterId")
 
@@ -29186,15 +28680,14 @@ class RemoveAllSignalsFromIntTx(CommandBase):
 
 class SetStreamingBuffer(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, size):
         CommandBase.__init__(self, "SetStreamingBuffer")
         self.setSize(size)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def size(self):
         return self.get("Size")
 
@@ -29210,16 +28703,15 @@ class SetStreamingBuffer(CommandBase):
 
 class GetStreamingBuffer(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_IDLE
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetStreamingBuffer")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_IDLE
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Result of GetStreamingBuffer.
@@ -29257,15 +28749,14 @@ class GetStreamingBufferResult(CommandResult):
 
 class SetEngineLatency(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, latency):
         CommandBase.__init__(self, "SetEngineLatency")
         self.setLatency(latency)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def latency(self):
         return self.get("Latency")
 
@@ -29281,16 +28772,15 @@ class SetEngineLatency(CommandBase):
 
 class GetEngineLatency(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_IDLE
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetEngineLatency")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_IDLE
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Result of GetEngineLatency.
@@ -29328,13 +28818,12 @@ class GetEngineLatencyResult(CommandResult):
 
 class SetHilTjoin(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, hilTjoin):
         CommandBase.__init__(self, "SetHilTjoin")
         self.setHilTjoin(hilTjoin)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def hilTjoin(self):
         return self.get("HilTjoin")
 
@@ -29353,15 +28842,14 @@ class SetHilTjoin(CommandBase):
 
 class SetSyncServer(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, port):
         CommandBase.__init__(self, "SetSyncServer")
         self.setPort(port)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def port(self):
         return self.get("Port")
 
@@ -29381,16 +28869,15 @@ class SetSyncServer(CommandBase):
 
 class SetSyncClient(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, host, port):
         CommandBase.__init__(self, "SetSyncClient")
         self.setHost(host)
         self.setPort(port)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def host(self):
         return self.get("Host")
 
@@ -29416,13 +28903,12 @@ class SetSyncClient(CommandBase):
 
 class SetSyncTime(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, time):
         CommandBase.__init__(self, "SetSyncTime")
         self.setTime(time)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def time(self):
         return self.get("Time")
 
@@ -29439,14 +28925,13 @@ class SetSyncTime(CommandBase):
 
 class GetSyncTime(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetSyncTime")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Result of GetSyncTime.
@@ -29486,13 +28971,12 @@ class GetSyncTimeResult(CommandResult):
 
 class SetSyncTimeMainInstance(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, time):
         CommandBase.__init__(self, "SetSyncTimeMainInstance")
         self.setTime(time)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def time(self):
         return self.get("Time")
 
@@ -29515,13 +28999,12 @@ class SetSyncTimeMainInstance(CommandBase):
 
 class SetSyncTimeMaster(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, time):
         CommandBase.__init__(self, "SetSyncTimeMaster")
         self.setTime(time)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def time(self):
         return self.get("Time")
 
@@ -29539,14 +29022,13 @@ class SetSyncTimeMaster(CommandBase):
 
 class GetSyncTimeMainInstance(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetSyncTimeMainInstance")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Please note the command GetSyncTimeMaster is deprecated since 23.11. You may use GetSyncTimeMainInstance.
@@ -29560,14 +29042,13 @@ class GetSyncTimeMainInstance(CommandBase):
 
 class GetSyncTimeMaster(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetSyncTimeMaster")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Result of GetSyncTimeMainInstance.
@@ -29605,17 +29086,16 @@ class GetSyncTimeMainInstanceResult(CommandResult):
 
 class StopWhenCommandFail(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_IDLE
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "StopWhenCommandFail")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_IDLE
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -29631,14 +29111,13 @@ class StopWhenCommandFail(CommandBase):
 
 class IsSimStopWhenCommandFailEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsSimStopWhenCommandFailEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Result of IsSimStopWhenCommandFailEnabled.
@@ -29676,17 +29155,16 @@ class IsSimStopWhenCommandFailEnabledResult(CommandResult):
 
 class StopMainInstanceWhenWorkerInstanceStop(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_IDLE
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "StopMainInstanceWhenWorkerInstanceStop")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_IDLE
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -29702,14 +29180,13 @@ class StopMainInstanceWhenWorkerInstanceStop(CommandBase):
 
 class IsStopMainInstanceWhenWorkerInstanceStop(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsStopMainInstanceWhenWorkerInstanceStop")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Result of IsStopMainInstanceWhenWorkerInstanceStop.
@@ -29747,15 +29224,14 @@ class IsStopMainInstanceWhenWorkerInstanceStopResult(CommandResult):
 
 class ShowMapAnalysis(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, show):
         CommandBase.__init__(self, "ShowMapAnalysis")
         self.setShow(show)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def show(self):
         return self.get("Show")
 
@@ -29771,12 +29247,11 @@ class ShowMapAnalysis(CommandBase):
 
 class IsMapAnalysisEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsMapAnalysisEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsMapAnalysisEnabled.
@@ -29814,15 +29289,14 @@ class IsMapAnalysisEnabledResult(CommandResult):
 
 class SetSpectrumVisible(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, visible):
         CommandBase.__init__(self, "SetSpectrumVisible")
         self.setVisible(visible)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def visible(self):
         return self.get("Visible")
 
@@ -29838,12 +29312,11 @@ class SetSpectrumVisible(CommandBase):
 
 class IsSpectrumVisible(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsSpectrumVisible")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsSpectrumVisible.
@@ -29878,16 +29351,15 @@ class IsSpectrumVisibleResult(CommandResult):
 
 class GetSimulatorState(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_IDLE
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetSimulatorState")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_IDLE
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Wait until simulator has reached the specified substate unless simulator goes to error state or specified failure substate. Will return a SimulatorStateResult.
@@ -29917,18 +29389,17 @@ class GetSimulatorState(CommandBase):
 
 class WaitSimulatorState(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_IDLE
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, state, failureState):
         CommandBase.__init__(self, "WaitSimulatorState")
         self.setState(state)
         self.setFailureState(failureState)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_IDLE
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def state(self):
         return self.get("State")
 
@@ -29950,16 +29421,15 @@ class WaitSimulatorState(CommandBase):
 
 class AbortWaitSimulatorState(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_IDLE
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "AbortWaitSimulatorState")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_IDLE
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Simulator State Result.
@@ -30035,16 +29505,15 @@ class SimulatorStateResult(CommandResult):
 
 class BeginVehicleInfo(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_IDLE
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "BeginVehicleInfo")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_IDLE
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # End receiving simulated vehicle informations.
@@ -30054,16 +29523,15 @@ class BeginVehicleInfo(CommandBase):
 
 class EndVehicleInfo(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_IDLE
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "EndVehicleInfo")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_IDLE
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Insert message to sequence.
@@ -30078,15 +29546,14 @@ class EndVehicleInfo(CommandBase):
 
 class MessageSequenceInsert(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal, index, type):
         CommandBase.__init__(self, "MessageSequenceInsert")
         self.setSignal(signal)
         self.setIndex(index)
         self.setType(type)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -30118,14 +29585,13 @@ class MessageSequenceInsert(CommandBase):
 
 class MessageSequenceRemove(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal, index):
         CommandBase.__init__(self, "MessageSequenceRemove")
         self.setSignal(signal)
         self.setIndex(index)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -30152,15 +29618,14 @@ class MessageSequenceRemove(CommandBase):
 
 class MessageSequenceSwap(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal, indexI, indexJ):
         CommandBase.__init__(self, "MessageSequenceSwap")
         self.setSignal(signal)
         self.setIndexI(indexI)
         self.setIndexJ(indexJ)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -30193,14 +29658,13 @@ class MessageSequenceSwap(CommandBase):
 
 class MessageSequenceImport(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal, filename):
         CommandBase.__init__(self, "MessageSequenceImport")
         self.setSignal(signal)
         self.setFilename(filename)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -30227,15 +29691,14 @@ class MessageSequenceImport(CommandBase):
 
 class ExportMessageSequenceToCSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal, path, overwriting):
         CommandBase.__init__(self, "ExportMessageSequenceToCSV")
         self.setSignal(signal)
         self.setPath(path)
         self.setOverwriting(overwriting)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -30266,13 +29729,12 @@ class ExportMessageSequenceToCSV(CommandBase):
 
 class GetMessageSequence(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal):
         CommandBase.__init__(self, "GetMessageSequence")
         self.setSignal(signal)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -30325,14 +29787,13 @@ class GetMessageSequenceResult(CommandResult):
 
 class SetGalileoFnavSatelliteK(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, prn, k):
         CommandBase.__init__(self, "SetGalileoFnavSatelliteK")
         self.setPrn(prn)
         self.setK(k)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def prn(self):
         return self.get("Prn")
 
@@ -30357,13 +29818,12 @@ class SetGalileoFnavSatelliteK(CommandBase):
 
 class GetGalileoFnavSatelliteK(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, prn):
         CommandBase.__init__(self, "GetGalileoFnavSatelliteK")
         self.setPrn(prn)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def prn(self):
         return self.get("Prn")
 
@@ -30422,6 +29882,8 @@ class GetGalileoFnavSatelliteKResult(CommandResult):
 
 class CalibFunction(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self, svId, signal, enableSV, enableDoppler, phaseOffet):
         CommandBase.__init__(self, "CalibFunction")
         self.setSvId(svId)
@@ -30430,9 +29892,6 @@ class CalibFunction(CommandBase):
         self.setEnableDoppler(enableDoppler)
         self.setPhaseOffet(phaseOffet)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
     def svId(self):
         return self.get("SvId")
 
@@ -30472,16 +29931,15 @@ class CalibFunction(CommandBase):
 
 class ClearStatusLog(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_IDLE
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "ClearStatusLog")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_IDLE
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # A log record level.
@@ -30525,16 +29983,15 @@ class LogRecord:
 
 class GetStatusLog(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_IDLE
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetStatusLog")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_IDLE
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Result of GetStatusLog.
@@ -30572,17 +30029,16 @@ class GetStatusLogResult(CommandResult):
 
 class CommandGroup(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_IDLE
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, commands):
         CommandBase.__init__(self, "CommandGroup")
         self.setCommands(commands)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_IDLE
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def commands(self):
         return self.get("Commands")
 
@@ -30601,15 +30057,14 @@ class CommandGroup(CommandBase):
 
 class GetVisibleSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, system):
         CommandBase.__init__(self, "GetVisibleSV")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def system(self):
         return self.get("System")
 
@@ -30658,12 +30113,11 @@ class GetVisibleSVResult(CommandResult):
 
 class ArmPPS(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "ArmPPS")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Ask Skydel to reset its PPS counter.
@@ -30673,12 +30127,11 @@ class ArmPPS(CommandBase):
 
 class WaitAndResetPPS(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "WaitAndResetPPS")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
 
 #
 # Start the simulation at the given PPS count.
@@ -30691,13 +30144,12 @@ class WaitAndResetPPS(CommandBase):
 
 class StartPPS(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self, msec):
         CommandBase.__init__(self, "StartPPS")
         self.setMsec(msec)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
     def msec(self):
         return self.get("Msec")
 
@@ -30718,15 +30170,14 @@ class StartPPS(CommandBase):
 
 class EnableSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, enabled):
         CommandBase.__init__(self, "EnableSV")
         self.setSystem(system)
         self.setSvId(svId)
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -30758,14 +30209,13 @@ class EnableSV(CommandBase):
 
 class IsSVEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId):
         CommandBase.__init__(self, "IsSVEnabled")
         self.setSystem(system)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -30832,14 +30282,13 @@ class IsSVEnabledResult(CommandResult):
 
 class EnableEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, enabled):
         CommandBase.__init__(self, "EnableEachSV")
         self.setSystem(system)
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -30864,13 +30313,12 @@ class EnableEachSV(CommandBase):
 
 class IsEachSVEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system):
         CommandBase.__init__(self, "IsEachSVEnabled")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -30922,13 +30370,12 @@ class IsEachSVEnabledResult(CommandResult):
 
 class EnableCnav2Pages(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, messages):
         CommandBase.__init__(self, "EnableCnav2Pages")
         self.setMessages(messages)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def messages(self):
         return self.get("Messages")
 
@@ -30944,12 +30391,11 @@ class EnableCnav2Pages(CommandBase):
 
 class GetCnav2PagesEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetCnav2PagesEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetCnav2PagesEnabled.
@@ -30987,15 +30433,14 @@ class GetCnav2PagesEnabledResult(CommandResult):
 
 class EnableSbasMessages(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, messages):
         CommandBase.__init__(self, "EnableSbasMessages")
         self.setMessages(messages)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def messages(self):
         return self.get("Messages")
 
@@ -31011,14 +30456,13 @@ class EnableSbasMessages(CommandBase):
 
 class GetSbasMessagesEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetSbasMessagesEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Result of GetSbasMessagesEnabled.
@@ -31057,16 +30501,15 @@ class GetSbasMessagesEnabledResult(CommandResult):
 
 class SetSbasMessageUpdateInterval(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, message, updateInterval):
         CommandBase.__init__(self, "SetSbasMessageUpdateInterval")
         self.setMessage(message)
         self.setUpdateInterval(updateInterval)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def message(self):
         return self.get("Message")
 
@@ -31091,15 +30534,14 @@ class SetSbasMessageUpdateInterval(CommandBase):
 
 class GetSbasMessageUpdateInterval(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, message):
         CommandBase.__init__(self, "GetSbasMessageUpdateInterval")
         self.setMessage(message)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def message(self):
         return self.get("Message")
 
@@ -31152,16 +30594,15 @@ class GetSbasMessageUpdateIntervalResult(CommandResult):
 
 class ExportSbasMessageSequence(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, path, overwriting):
         CommandBase.__init__(self, "ExportSbasMessageSequence")
         self.setPath(path)
         self.setOverwriting(overwriting)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def path(self):
         return self.get("Path")
 
@@ -31186,13 +30627,12 @@ class ExportSbasMessageSequence(CommandBase):
 
 class SetSbasMonitoredSystems(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, systems):
         CommandBase.__init__(self, "SetSbasMonitoredSystems")
         self.setSystems(systems)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def systems(self):
         return self.get("Systems")
 
@@ -31208,12 +30648,11 @@ class SetSbasMonitoredSystems(CommandBase):
 
 class GetSbasMonitoredSystems(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetSbasMonitoredSystems")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetSbasMonitoredSystems.
@@ -31253,17 +30692,16 @@ class GetSbasMonitoredSystemsResult(CommandResult):
 
 class SetUdreiForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, system, svId, udrei):
         CommandBase.__init__(self, "SetUdreiForSV")
         self.setSystem(system)
         self.setSvId(svId)
         self.setUdrei(udrei)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def system(self):
         return self.get("System")
 
@@ -31295,14 +30733,13 @@ class SetUdreiForSV(CommandBase):
 
 class GetUdreiForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId):
         CommandBase.__init__(self, "GetUdreiForSV")
         self.setSystem(system)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -31369,16 +30806,15 @@ class GetUdreiForSVResult(CommandResult):
 
 class SetUdreiForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, system, udreis):
         CommandBase.__init__(self, "SetUdreiForEachSV")
         self.setSystem(system)
         self.setUdreis(udreis)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def system(self):
         return self.get("System")
 
@@ -31403,13 +30839,12 @@ class SetUdreiForEachSV(CommandBase):
 
 class GetUdreiForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system):
         CommandBase.__init__(self, "GetUdreiForEachSV")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -31483,12 +30918,11 @@ class GNSSBand:
 
 class BroadcastConfig(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "BroadcastConfig")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Cancel the current configuration broadcast if any.
@@ -31498,12 +30932,11 @@ class BroadcastConfig(CommandBase):
 
 class CancelBroadcastConfig(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "CancelBroadcastConfig")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Set whether the main instance should send its configuration to every worker instance when simulation start.
@@ -31516,13 +30949,12 @@ class CancelBroadcastConfig(CommandBase):
 
 class SetConfigBroadcastOnStart(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, broadcastOnStart):
         CommandBase.__init__(self, "SetConfigBroadcastOnStart")
         self.setBroadcastOnStart(broadcastOnStart)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def broadcastOnStart(self):
         return self.get("BroadcastOnStart")
 
@@ -31538,12 +30970,11 @@ class SetConfigBroadcastOnStart(CommandBase):
 
 class GetConfigBroadcastOnStart(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetConfigBroadcastOnStart")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetConfigBroadcastOnStart.
@@ -31595,13 +31026,12 @@ class ConfigFilter:
 
 class SetConfigBroadcastFilter(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, filter):
         CommandBase.__init__(self, "SetConfigBroadcastFilter")
         self.setFilter(filter)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def filter(self):
         return self.get("Filter")
 
@@ -31617,12 +31047,11 @@ class SetConfigBroadcastFilter(CommandBase):
 
 class GetConfigBroadcastFilter(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetConfigBroadcastFilter")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetConfigBroadcastFilter.
@@ -31663,6 +31092,8 @@ class GetConfigBroadcastFilterResult(CommandResult):
 
 class SetPseudorangeNoiseOffsetForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, enabled, offset):
         CommandBase.__init__(self, "SetPseudorangeNoiseOffsetForSV")
         self.setSystem(system)
@@ -31670,9 +31101,6 @@ class SetPseudorangeNoiseOffsetForSV(CommandBase):
         self.setEnabled(enabled)
         self.setOffset(offset)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -31710,14 +31138,13 @@ class SetPseudorangeNoiseOffsetForSV(CommandBase):
 
 class GetPseudorangeNoiseOffsetForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId):
         CommandBase.__init__(self, "GetPseudorangeNoiseOffsetForSV")
         self.setSystem(system)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -31793,15 +31220,14 @@ class GetPseudorangeNoiseOffsetForSVResult(CommandResult):
 
 class SetPseudorangeNoiseOffsetForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, enabled, offset):
         CommandBase.__init__(self, "SetPseudorangeNoiseOffsetForEachSV")
         self.setSystem(system)
         self.setEnabled(enabled)
         self.setOffset(offset)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -31836,15 +31262,14 @@ class SetPseudorangeNoiseOffsetForEachSV(CommandBase):
 
 class SetAllSatellitesPseudorangeNoiseOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, enabled, offset):
         CommandBase.__init__(self, "SetAllSatellitesPseudorangeNoiseOffset")
         self.setSystem(system)
         self.setEnabled(enabled)
         self.setOffset(offset)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -31875,13 +31300,12 @@ class SetAllSatellitesPseudorangeNoiseOffset(CommandBase):
 
 class GetPseudorangeNoiseOffsetForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system):
         CommandBase.__init__(self, "GetPseudorangeNoiseOffsetForEachSV")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -31902,13 +31326,12 @@ class GetPseudorangeNoiseOffsetForEachSV(CommandBase):
 
 class GetAllSatellitesPseudorangeNoiseOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system):
         CommandBase.__init__(self, "GetAllSatellitesPseudorangeNoiseOffset")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -31974,6 +31397,8 @@ class GetPseudorangeNoiseOffsetForEachSVResult(CommandResult):
 
 class SetPseudorangeNoiseSineWaveForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, sineWave, enabled, amplitude, period, offset):
         CommandBase.__init__(self, "SetPseudorangeNoiseSineWaveForSV")
         self.setSystem(system)
@@ -31984,9 +31409,6 @@ class SetPseudorangeNoiseSineWaveForSV(CommandBase):
         self.setPeriod(period)
         self.setOffset(offset)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -32043,15 +31465,14 @@ class SetPseudorangeNoiseSineWaveForSV(CommandBase):
 
 class GetPseudorangeNoiseSineWaveForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, sineWave):
         CommandBase.__init__(self, "GetPseudorangeNoiseSineWaveForSV")
         self.setSystem(system)
         self.setSvId(svId)
         self.setSineWave(sineWave)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -32160,6 +31581,8 @@ class GetPseudorangeNoiseSineWaveForSVResult(CommandResult):
 
 class SetPseudorangeNoiseSineWaveForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, sineWave, enabled, amplitude, period, offset):
         CommandBase.__init__(self, "SetPseudorangeNoiseSineWaveForEachSV")
         self.setSystem(system)
@@ -32169,9 +31592,6 @@ class SetPseudorangeNoiseSineWaveForEachSV(CommandBase):
         self.setPeriod(period)
         self.setOffset(offset)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -32227,6 +31647,8 @@ class SetPseudorangeNoiseSineWaveForEachSV(CommandBase):
 
 class SetAllSatellitesPseudorangeNoiseSineWave(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, sineWave, enabled, amplitude, period, offset):
         CommandBase.__init__(self, "SetAllSatellitesPseudorangeNoiseSineWave")
         self.setSystem(system)
@@ -32236,9 +31658,6 @@ class SetAllSatellitesPseudorangeNoiseSineWave(CommandBase):
         self.setPeriod(period)
         self.setOffset(offset)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -32288,14 +31707,13 @@ class SetAllSatellitesPseudorangeNoiseSineWave(CommandBase):
 
 class GetPseudorangeNoiseSineWaveForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, sineWave):
         CommandBase.__init__(self, "GetPseudorangeNoiseSineWaveForEachSV")
         self.setSystem(system)
         self.setSineWave(sineWave)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -32323,14 +31741,13 @@ class GetPseudorangeNoiseSineWaveForEachSV(CommandBase):
 
 class GetAllSatellitesPseudorangeNoiseSineWave(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, sineWave):
         CommandBase.__init__(self, "GetAllSatellitesPseudorangeNoiseSineWave")
         self.setSystem(system)
         self.setSineWave(sineWave)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -32426,6 +31843,8 @@ class GetPseudorangeNoiseSineWaveForEachSVResult(CommandResult):
 
 class SetPseudorangeNoiseGaussMarkovForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, process, enabled, sigma, time, seed):
         CommandBase.__init__(self, "SetPseudorangeNoiseGaussMarkovForSV")
         self.setSystem(system)
@@ -32436,9 +31855,6 @@ class SetPseudorangeNoiseGaussMarkovForSV(CommandBase):
         self.setTime(time)
         self.setSeed(seed)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -32495,15 +31911,14 @@ class SetPseudorangeNoiseGaussMarkovForSV(CommandBase):
 
 class GetPseudorangeNoiseGaussMarkovForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, process):
         CommandBase.__init__(self, "GetPseudorangeNoiseGaussMarkovForSV")
         self.setSystem(system)
         self.setSvId(svId)
         self.setProcess(process)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -32612,6 +32027,8 @@ class GetPseudorangeNoiseGaussMarkovForSVResult(CommandResult):
 
 class SetPseudorangeNoiseGaussMarkovForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, process, enabled, sigma, time, seed):
         CommandBase.__init__(self, "SetPseudorangeNoiseGaussMarkovForEachSV")
         self.setSystem(system)
@@ -32621,9 +32038,6 @@ class SetPseudorangeNoiseGaussMarkovForEachSV(CommandBase):
         self.setTime(time)
         self.setSeed(seed)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -32679,6 +32093,8 @@ class SetPseudorangeNoiseGaussMarkovForEachSV(CommandBase):
 
 class SetAllSatellitesPseudorangeNoiseGaussMarkov(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, process, enabled, sigma, time, seed):
         CommandBase.__init__(self, "SetAllSatellitesPseudorangeNoiseGaussMarkov")
         self.setSystem(system)
@@ -32688,9 +32104,6 @@ class SetAllSatellitesPseudorangeNoiseGaussMarkov(CommandBase):
         self.setTime(time)
         self.setSeed(seed)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -32740,14 +32153,13 @@ class SetAllSatellitesPseudorangeNoiseGaussMarkov(CommandBase):
 
 class GetPseudorangeNoiseGaussMarkovForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, process):
         CommandBase.__init__(self, "GetPseudorangeNoiseGaussMarkovForEachSV")
         self.setSystem(system)
         self.setProcess(process)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -32775,14 +32187,13 @@ class GetPseudorangeNoiseGaussMarkovForEachSV(CommandBase):
 
 class GetAllSatellitesPseudorangeNoiseGaussMarkov(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, process):
         CommandBase.__init__(self, "GetAllSatellitesPseudorangeNoiseGaussMarkov")
         self.setSystem(system)
         self.setProcess(process)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -32872,13 +32283,12 @@ class GetPseudorangeNoiseGaussMarkovForEachSVResult(CommandResult):
 
 class RandomizePseudorangeNoiseGaussMarkovSeedsForAllSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system):
         CommandBase.__init__(self, "RandomizePseudorangeNoiseGaussMarkovSeedsForAllSV")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -32899,15 +32309,14 @@ class RandomizePseudorangeNoiseGaussMarkovSeedsForAllSV(CommandBase):
 
 class RandomizeSeedsForAllSatellitesPseudorangeNoiseGaussMarkov(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system):
         CommandBase.__init__(
             self, "RandomizeSeedsForAllSatellitesPseudorangeNoiseGaussMarkov"
         )
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -32949,6 +32358,8 @@ class RIC:
 
 class SetEphemerisErrorForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, orbit, deltaAf0, deltaAf1):
         CommandBase.__init__(self, "SetEphemerisErrorForSV")
         self.setSystem(system)
@@ -32957,9 +32368,6 @@ class SetEphemerisErrorForSV(CommandBase):
         self.setDeltaAf0(deltaAf0)
         self.setDeltaAf1(deltaAf1)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -33003,14 +32411,13 @@ class SetEphemerisErrorForSV(CommandBase):
 
 class GetEphemerisErrorForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId):
         CommandBase.__init__(self, "GetEphemerisErrorForSV")
         self.setSystem(system)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -33092,13 +32499,12 @@ class GetEphemerisErrorForSVResult(CommandResult):
 
 class SetUsingVelocityInSbasMessage25(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, useVelocity):
         CommandBase.__init__(self, "SetUsingVelocityInSbasMessage25")
         self.setUseVelocity(useVelocity)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def useVelocity(self):
         return self.get("UseVelocity")
 
@@ -33114,12 +32520,11 @@ class SetUsingVelocityInSbasMessage25(CommandBase):
 
 class IsUsingVelocityInSbasMessage25(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsUsingVelocityInSbasMessage25")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsUsingVelocityInSbasMessage25.
@@ -33157,15 +32562,14 @@ class IsUsingVelocityInSbasMessage25Result(CommandResult):
 
 class SetTransmitMessage2InSbasMessage0(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, transmitMessage2):
         CommandBase.__init__(self, "SetTransmitMessage2InSbasMessage0")
         self.setTransmitMessage2(transmitMessage2)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def transmitMessage2(self):
         return self.get("TransmitMessage2")
 
@@ -33181,12 +32585,11 @@ class SetTransmitMessage2InSbasMessage0(CommandBase):
 
 class IsTransmitMessage2InSbasMessage0(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsTransmitMessage2InSbasMessage0")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsTransmitMessage2InSbasMessage0.
@@ -33228,6 +32631,8 @@ class IsTransmitMessage2InSbasMessage0Result(CommandResult):
 
 class ForceSVGeo(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, isGeo, longitude, dataSetName=None):
         CommandBase.__init__(self, "ForceSVGeo")
         self.setSystem(system)
@@ -33236,9 +32641,6 @@ class ForceSVGeo(CommandBase):
         self.setLongitude(longitude)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -33283,15 +32685,14 @@ class ForceSVGeo(CommandBase):
 
 class IsSVForcedGeo(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, dataSetName=None):
         CommandBase.__init__(self, "IsSVForcedGeo")
         self.setSystem(system)
         self.setSvId(svId)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -33382,17 +32783,16 @@ class IsSVForcedGeoResult(CommandResult):
 
 class EnableSbasFastCorrectionsFor(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, system, isEnabled, errorType=None):
         CommandBase.__init__(self, "EnableSbasFastCorrectionsFor")
         self.setSystem(system)
         self.setIsEnabled(isEnabled)
         self.setErrorType(errorType)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def system(self):
         return self.get("System")
 
@@ -33425,16 +32825,15 @@ class EnableSbasFastCorrectionsFor(CommandBase):
 
 class IsSbasFastCorrectionsEnabledFor(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, system, errorType=None):
         CommandBase.__init__(self, "IsSbasFastCorrectionsEnabledFor")
         self.setSystem(system)
         self.setErrorType(errorType)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def system(self):
         return self.get("System")
 
@@ -33501,15 +32900,14 @@ class IsSbasFastCorrectionsEnabledForResult(CommandResult):
 
 class ApplyDelayInSbas(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, isEnabled):
         CommandBase.__init__(self, "ApplyDelayInSbas")
         self.setIsEnabled(isEnabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def isEnabled(self):
         return self.get("IsEnabled")
 
@@ -33525,14 +32923,13 @@ class ApplyDelayInSbas(CommandBase):
 
 class IsDelayAppliedInSbas(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsDelayAppliedInSbas")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Result of IsDelayAppliedInSbas.
@@ -33570,13 +32967,12 @@ class IsDelayAppliedInSbasResult(CommandResult):
 
 class EnableIonoOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, isEnabled):
         CommandBase.__init__(self, "EnableIonoOffset")
         self.setIsEnabled(isEnabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def isEnabled(self):
         return self.get("IsEnabled")
 
@@ -33592,12 +32988,11 @@ class EnableIonoOffset(CommandBase):
 
 class IsIonoOffsetEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsIonoOffsetEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsIonoOffsetEnabled.
@@ -33636,16 +33031,15 @@ class IsIonoOffsetEnabledResult(CommandResult):
 
 class EnableSbasLongTermCorrectionsFor(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, system, isEnabled):
         CommandBase.__init__(self, "EnableSbasLongTermCorrectionsFor")
         self.setSystem(system)
         self.setIsEnabled(isEnabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def system(self):
         return self.get("System")
 
@@ -33670,15 +33064,14 @@ class EnableSbasLongTermCorrectionsFor(CommandBase):
 
 class IsSbasLongTermCorrectionsEnabledFor(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, system):
         CommandBase.__init__(self, "IsSbasLongTermCorrectionsEnabledFor")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def system(self):
         return self.get("System")
 
@@ -33732,17 +33125,16 @@ class IsSbasLongTermCorrectionsEnabledForResult(CommandResult):
 
 class SetGpsUraIndexForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, svId, urai, dataSetName=None):
         CommandBase.__init__(self, "SetGpsUraIndexForSV")
         self.setSvId(svId)
         self.setUrai(urai)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -33775,17 +33167,16 @@ class SetGpsUraIndexForSV(CommandBase):
 
 class SetBeiDouUraIndexForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, svId, urai, dataSetName=None):
         CommandBase.__init__(self, "SetBeiDouUraIndexForSV")
         self.setSvId(svId)
         self.setUrai(urai)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -33818,17 +33209,16 @@ class SetBeiDouUraIndexForSV(CommandBase):
 
 class SetQzssUraIndexForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, svId, urai, dataSetName=None):
         CommandBase.__init__(self, "SetQzssUraIndexForSV")
         self.setSvId(svId)
         self.setUrai(urai)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -33863,17 +33253,16 @@ class SetQzssUraIndexForSV(CommandBase):
 
 class SetQzssUraIndex(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, svId, urai, dataSetName=None):
         CommandBase.__init__(self, "SetQzssUraIndex")
         self.setSvId(svId)
         self.setUrai(urai)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -33906,17 +33295,16 @@ class SetQzssUraIndex(CommandBase):
 
 class SetNavICUraIndexForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, svId, urai, dataSetName=None):
         CommandBase.__init__(self, "SetNavICUraIndexForSV")
         self.setSvId(svId)
         self.setUrai(urai)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -33951,17 +33339,16 @@ class SetNavICUraIndexForSV(CommandBase):
 
 class SetNavICUraIndex(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, svId, urai, dataSetName=None):
         CommandBase.__init__(self, "SetNavICUraIndex")
         self.setSvId(svId)
         self.setUrai(urai)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -33994,17 +33381,16 @@ class SetNavICUraIndex(CommandBase):
 
 class SetSbasUraIndexForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, svId, urai, dataSetName=None):
         CommandBase.__init__(self, "SetSbasUraIndexForSV")
         self.setSvId(svId)
         self.setUrai(urai)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -34037,17 +33423,16 @@ class SetSbasUraIndexForSV(CommandBase):
 
 class SetGalileoSisaE1E5aIndexForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, svId, sisai, dataSetName=None):
         CommandBase.__init__(self, "SetGalileoSisaE1E5aIndexForSV")
         self.setSvId(svId)
         self.setSisai(sisai)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -34080,17 +33465,16 @@ class SetGalileoSisaE1E5aIndexForSV(CommandBase):
 
 class SetGalileoSisaE1E5bIndexForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, svId, sisai, dataSetName=None):
         CommandBase.__init__(self, "SetGalileoSisaE1E5bIndexForSV")
         self.setSvId(svId)
         self.setSisai(sisai)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -34125,6 +33509,8 @@ class SetGalileoSisaE1E5bIndexForSV(CommandBase):
 
 class SetPilotCW(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self, enabled, outputIdx, centralFreqOffset, power, pilotId):
         CommandBase.__init__(self, "SetPilotCW")
         self.setEnabled(enabled)
@@ -34133,9 +33519,6 @@ class SetPilotCW(CommandBase):
         self.setPower(power)
         self.setPilotId(pilotId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -34184,6 +33567,8 @@ class SetPilotCW(CommandBase):
 
 class SetPilotPRN(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(
         self, enabled, outputIdx, centralFreqOffset, power, prn, type, pilotId
     ):
@@ -34196,9 +33581,6 @@ class SetPilotPRN(CommandBase):
         self.setType(type)
         self.setPilotId(pilotId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -34256,6 +33638,8 @@ class SetPilotPRN(CommandBase):
 
 class CalibratePilotOutput(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self, outputIdx, power, time, carrierPhase):
         CommandBase.__init__(self, "CalibratePilotOutput")
         self.setOutputIdx(outputIdx)
@@ -34263,9 +33647,6 @@ class CalibratePilotOutput(CommandBase):
         self.setTime(time)
         self.setCarrierPhase(carrierPhase)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
     def outputIdx(self):
         return self.get("OutputIdx")
 
@@ -34299,12 +33680,11 @@ class CalibratePilotOutput(CommandBase):
 
 class RemoveAllPilots(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "RemoveAllPilots")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
 
 #
 # Change modulation offsets of one RF output
@@ -34321,6 +33701,8 @@ class RemoveAllPilots(CommandBase):
 
 class SetRFOutputOffsets(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self, outputIdx, powerOffset, timeOffset, phaseOffset, phaseStep=None):
         CommandBase.__init__(self, "SetRFOutputOffsets")
         self.setOutputIdx(outputIdx)
@@ -34329,9 +33711,6 @@ class SetRFOutputOffsets(CommandBase):
         self.setPhaseOffset(phaseOffset)
         self.setPhaseStep(phaseStep)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
     def outputIdx(self):
         return self.get("OutputIdx")
 
@@ -34374,12 +33753,11 @@ class SetRFOutputOffsets(CommandBase):
 
 class IsTrajectoryCompleted(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsTrajectoryCompleted")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
 
 #
 # Result of IsTrajectoryCompleted.
@@ -34419,15 +33797,14 @@ class IsTrajectoryCompletedResult(CommandResult):
 
 class SetIonoGridError(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, band, point, error):
         CommandBase.__init__(self, "SetIonoGridError")
         self.setBand(band)
         self.setPoint(point)
         self.setError(error)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def band(self):
         return self.get("Band")
 
@@ -34459,14 +33836,13 @@ class SetIonoGridError(CommandBase):
 
 class GetIonoGridError(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, band, point):
         CommandBase.__init__(self, "GetIonoGridError")
         self.setBand(band)
         self.setPoint(point)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def band(self):
         return self.get("Band")
 
@@ -34535,6 +33911,8 @@ class GetIonoGridErrorResult(CommandResult):
 
 class SetIonoGridGIVEI(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, band, point, giveI, serviceProvider=None):
         CommandBase.__init__(self, "SetIonoGridGIVEI")
         self.setBand(band)
@@ -34542,9 +33920,6 @@ class SetIonoGridGIVEI(CommandBase):
         self.setGiveI(giveI)
         self.setServiceProvider(serviceProvider)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def band(self):
         return self.get("Band")
 
@@ -34583,15 +33958,14 @@ class SetIonoGridGIVEI(CommandBase):
 
 class GetIonoGridGIVEI(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, band, point, serviceProvider=None):
         CommandBase.__init__(self, "GetIonoGridGIVEI")
         self.setBand(band)
         self.setPoint(point)
         self.setServiceProvider(serviceProvider)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def band(self):
         return self.get("Band")
 
@@ -34671,13 +34045,12 @@ class GetIonoGridGIVEIResult(CommandResult):
 
 class SetIonoGridErrorAll(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, grid):
         CommandBase.__init__(self, "SetIonoGridErrorAll")
         self.setGrid(grid)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def grid(self):
         return self.get("Grid")
 
@@ -34693,12 +34066,11 @@ class SetIonoGridErrorAll(CommandBase):
 
 class GetIonoGridErrorAll(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetIonoGridErrorAll")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetIonoGridErrorAll.
@@ -34737,14 +34109,13 @@ class GetIonoGridErrorAllResult(CommandResult):
 
 class SetIonoGridGIVEIAll(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, grid, serviceProvider=None):
         CommandBase.__init__(self, "SetIonoGridGIVEIAll")
         self.setGrid(grid)
         self.setServiceProvider(serviceProvider)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def grid(self):
         return self.get("Grid")
 
@@ -34769,13 +34140,12 @@ class SetIonoGridGIVEIAll(CommandBase):
 
 class GetIonoGridGIVEIAll(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, serviceProvider=None):
         CommandBase.__init__(self, "GetIonoGridGIVEIAll")
         self.setServiceProvider(serviceProvider)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def serviceProvider(self):
         return self.get("ServiceProvider")
 
@@ -34830,6 +34200,8 @@ class GetIonoGridGIVEIAllResult(CommandResult):
 
 class SetIonoGridMask(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, serviceProvider, band, point, flag):
         CommandBase.__init__(self, "SetIonoGridMask")
         self.setServiceProvider(serviceProvider)
@@ -34837,9 +34209,6 @@ class SetIonoGridMask(CommandBase):
         self.setPoint(point)
         self.setFlag(flag)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def serviceProvider(self):
         return self.get("ServiceProvider")
 
@@ -34878,15 +34247,14 @@ class SetIonoGridMask(CommandBase):
 
 class GetIonoGridMask(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, serviceProvider, band, point):
         CommandBase.__init__(self, "GetIonoGridMask")
         self.setServiceProvider(serviceProvider)
         self.setBand(band)
         self.setPoint(point)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def serviceProvider(self):
         return self.get("ServiceProvider")
 
@@ -34967,14 +34335,13 @@ class GetIonoGridMaskResult(CommandResult):
 
 class SetIonoGridMaskAll(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, serviceProvider, grid):
         CommandBase.__init__(self, "SetIonoGridMaskAll")
         self.setServiceProvider(serviceProvider)
         self.setGrid(grid)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def serviceProvider(self):
         return self.get("ServiceProvider")
 
@@ -34999,13 +34366,12 @@ class SetIonoGridMaskAll(CommandBase):
 
 class GetIonoGridMaskAll(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, serviceProvider):
         CommandBase.__init__(self, "GetIonoGridMaskAll")
         self.setServiceProvider(serviceProvider)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def serviceProvider(self):
         return self.get("ServiceProvider")
 
@@ -35058,14 +34424,13 @@ class GetIonoGridMaskAllResult(CommandResult):
 
 class ImportIonoGridErrors(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, overwriting, path):
         CommandBase.__init__(self, "ImportIonoGridErrors")
         self.setOverwriting(overwriting)
         self.setPath(path)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def overwriting(self):
         return self.get("Overwriting")
 
@@ -35092,15 +34457,14 @@ class ImportIonoGridErrors(CommandBase):
 
 class ImportIonoGridGIVEI(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, overwriting, path, serviceProvider=None):
         CommandBase.__init__(self, "ImportIonoGridGIVEI")
         self.setOverwriting(overwriting)
         self.setPath(path)
         self.setServiceProvider(serviceProvider)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def overwriting(self):
         return self.get("Overwriting")
 
@@ -35133,15 +34497,14 @@ class ImportIonoGridGIVEI(CommandBase):
 
 class ImportIonoGridMask(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, serviceProvider, overwriting, path):
         CommandBase.__init__(self, "ImportIonoGridMask")
         self.setServiceProvider(serviceProvider)
         self.setOverwriting(overwriting)
         self.setPath(path)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def serviceProvider(self):
         return self.get("ServiceProvider")
 
@@ -35173,14 +34536,13 @@ class ImportIonoGridMask(CommandBase):
 
 class ExportIonoGridErrors(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, overwriting, path):
         CommandBase.__init__(self, "ExportIonoGridErrors")
         self.setOverwriting(overwriting)
         self.setPath(path)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def overwriting(self):
         return self.get("Overwriting")
 
@@ -35207,15 +34569,14 @@ class ExportIonoGridErrors(CommandBase):
 
 class ExportIonoGridGIVEI(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, overwriting, path, serviceProvider=None):
         CommandBase.__init__(self, "ExportIonoGridGIVEI")
         self.setOverwriting(overwriting)
         self.setPath(path)
         self.setServiceProvider(serviceProvider)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def overwriting(self):
         return self.get("Overwriting")
 
@@ -35248,15 +34609,14 @@ class ExportIonoGridGIVEI(CommandBase):
 
 class ExportIonoGridMask(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, serviceProvider, overwriting, path):
         CommandBase.__init__(self, "ExportIonoGridMask")
         self.setServiceProvider(serviceProvider)
         self.setOverwriting(overwriting)
         self.setPath(path)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def serviceProvider(self):
         return self.get("ServiceProvider")
 
@@ -35284,14 +34644,13 @@ class ExportIonoGridMask(CommandBase):
 
 class GetConfigPaths(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetConfigPaths")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Result of GetConfigPaths.
@@ -35329,13 +34688,12 @@ class GetConfigPathsResult(CommandResult):
 
 class SetPps0GpsTime(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self, gpsTime):
         CommandBase.__init__(self, "SetPps0GpsTime")
         self.setGpsTime(gpsTime)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
     def gpsTime(self):
         return self.get("GpsTime")
 
@@ -35354,15 +34712,14 @@ class SetPps0GpsTime(CommandBase):
 
 class GetOfficialLeapSecond(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, date):
         CommandBase.__init__(self, "GetOfficialLeapSecond")
         self.setDate(date)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def date(self):
         return self.get("Date")
 
@@ -35403,14 +34760,13 @@ class GetOfficialLeapSecondResult(CommandResult):
 
 class GetLastLeapSecondDate(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetLastLeapSecondDate")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Result of GetLastLeapSecondDate.
@@ -35449,14 +34805,13 @@ class GetLastLeapSecondDateResult(CommandResult):
 
 class ChangeCustomSignalColor(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, color, id):
         CommandBase.__init__(self, "ChangeCustomSignalColor")
         self.setColor(color)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def color(self):
         return self.get("Color")
 
@@ -35478,14 +34833,13 @@ class ChangeCustomSignalColor(CommandBase):
 
 class GetAllSpoofTxID(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetAllSpoofTxID")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Result of GetAllSpoofTxID.
@@ -35529,6 +34883,8 @@ class GetAllSpoofTxIDResult(CommandResult):
 
 class AddSpoofTx(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, usualName, enabled, address, instanceId, id):
         CommandBase.__init__(self, "AddSpoofTx")
         self.setUsualName(usualName)
@@ -35537,9 +34893,6 @@ class AddSpoofTx(CommandBase):
         self.setInstanceId(instanceId)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def usualName(self):
         return self.get("UsualName")
 
@@ -35584,13 +34937,12 @@ class AddSpoofTx(CommandBase):
 
 class GetSpoofTx(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetSpoofTx")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -35667,13 +35019,12 @@ class GetSpoofTxResult(CommandResult):
 
 class RemoveSpoofTx(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "RemoveSpoofTx")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -35693,14 +35044,13 @@ class RemoveSpoofTx(CommandBase):
 
 class RenameSpoofTx(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, usualName, id):
         CommandBase.__init__(self, "RenameSpoofTx")
         self.setUsualName(usualName)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def usualName(self):
         return self.get("UsualName")
 
@@ -35726,14 +35076,13 @@ class RenameSpoofTx(CommandBase):
 
 class ChangeSpoofTxColor(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, color, id):
         CommandBase.__init__(self, "ChangeSpoofTxColor")
         self.setColor(color)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def color(self):
         return self.get("Color")
 
@@ -35758,13 +35107,12 @@ class ChangeSpoofTxColor(CommandBase):
 
 class GetSpoofTxColor(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetSpoofTxColor")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -35817,16 +35165,15 @@ class GetSpoofTxColorResult(CommandResult):
 
 class EnableSpoofTx(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, enabled, id):
         CommandBase.__init__(self, "EnableSpoofTx")
         self.setEnabled(enabled)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -35853,17 +35200,16 @@ class EnableSpoofTx(CommandBase):
 
 class SetSpoofSignalManualPropagationLoss(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, propagationLoss, transmitterId, signalId):
         CommandBase.__init__(self, "SetSpoofSignalManualPropagationLoss")
         self.setPropagationLoss(propagationLoss)
         self.setTransmitterId(transmitterId)
         self.setSignalId(signalId)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def propagationLoss(self):
         return self.get("PropagationLoss")
 
@@ -35895,16 +35241,15 @@ class SetSpoofSignalManualPropagationLoss(CommandBase):
 
 class SetSpoofTxUseManualPropagationLoss(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, manual, id):
         CommandBase.__init__(self, "SetSpoofTxUseManualPropagationLoss")
         self.setManual(manual)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def manual(self):
         return self.get("Manual")
 
@@ -35930,16 +35275,15 @@ class SetSpoofTxUseManualPropagationLoss(CommandBase):
 
 class SetSpoofTxIgnorePropagationLoss(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, ignore, id):
         CommandBase.__init__(self, "SetSpoofTxIgnorePropagationLoss")
         self.setIgnore(ignore)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def ignore(self):
         return self.get("Ignore")
 
@@ -35965,16 +35309,15 @@ class SetSpoofTxIgnorePropagationLoss(CommandBase):
 
 class SetSpoofTxIgnoreRxAntennaPatterns(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, ignore, id):
         CommandBase.__init__(self, "SetSpoofTxIgnoreRxAntennaPatterns")
         self.setIgnore(ignore)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def ignore(self):
         return self.get("Ignore")
 
@@ -36000,16 +35343,15 @@ class SetSpoofTxIgnoreRxAntennaPatterns(CommandBase):
 
 class SetSpoofTxIgnoreRxAntennaGainPattern(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, ignore, id):
         CommandBase.__init__(self, "SetSpoofTxIgnoreRxAntennaGainPattern")
         self.setIgnore(ignore)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def ignore(self):
         return self.get("Ignore")
 
@@ -36034,13 +35376,12 @@ class SetSpoofTxIgnoreRxAntennaGainPattern(CommandBase):
 
 class IsSpoofTxIgnoreRxAntennaGainPattern(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "IsSpoofTxIgnoreRxAntennaGainPattern")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -36093,16 +35434,15 @@ class IsSpoofTxIgnoreRxAntennaGainPatternResult(CommandResult):
 
 class SetSpoofTxIgnoreRxAntennaPhasePattern(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, ignore, id):
         CommandBase.__init__(self, "SetSpoofTxIgnoreRxAntennaPhasePattern")
         self.setIgnore(ignore)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def ignore(self):
         return self.get("Ignore")
 
@@ -36127,13 +35467,12 @@ class SetSpoofTxIgnoreRxAntennaPhasePattern(CommandBase):
 
 class IsSpoofTxIgnoreRxAntennaPhasePattern(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "IsSpoofTxIgnoreRxAntennaPhasePattern")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -36191,6 +35530,8 @@ class IsSpoofTxIgnoreRxAntennaPhasePatternResult(CommandResult):
 
 class SetSpoofTxFix(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, lat, lon, alt, yaw, pitch, roll, id):
         CommandBase.__init__(self, "SetSpoofTxFix")
         self.setLat(lat)
@@ -36201,9 +35542,6 @@ class SetSpoofTxFix(CommandBase):
         self.setRoll(roll)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def lat(self):
         return self.get("Lat")
 
@@ -36258,13 +35596,12 @@ class SetSpoofTxFix(CommandBase):
 
 class GetSpoofTxFix(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetSpoofTxFix")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -36362,6 +35699,8 @@ class GetSpoofTxFixResult(CommandResult):
 
 class SetSpoofTxFixEcef(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, x, y, z, yaw, pitch, roll, id):
         CommandBase.__init__(self, "SetSpoofTxFixEcef")
         self.setX(x)
@@ -36372,9 +35711,6 @@ class SetSpoofTxFixEcef(CommandBase):
         self.setRoll(roll)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def x(self):
         return self.get("X")
 
@@ -36429,13 +35765,12 @@ class SetSpoofTxFixEcef(CommandBase):
 
 class GetSpoofTxFixEcef(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetSpoofTxFixEcef")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -36534,6 +35869,8 @@ class GetSpoofTxFixEcefResult(CommandResult):
 
 class SetSpoofTxCircular(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, lat, lon, alt, radius, speed, clockwise, id, originAngle=None):
         CommandBase.__init__(self, "SetSpoofTxCircular")
         self.setLat(lat)
@@ -36545,9 +35882,6 @@ class SetSpoofTxCircular(CommandBase):
         self.setId(id)
         self.setOriginAngle(originAngle)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def lat(self):
         return self.get("Lat")
 
@@ -36608,13 +35942,12 @@ class SetSpoofTxCircular(CommandBase):
 
 class GetSpoofTxCircular(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetSpoofTxCircular")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -36714,13 +36047,12 @@ class GetSpoofTxCircularResult(CommandResult):
 
 class SetSpoofTxHil(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "SetSpoofTxHil")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -36739,13 +36071,12 @@ class SetSpoofTxHil(CommandBase):
 
 class GetSpoofTxTrajectory(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetSpoofTxTrajectory")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -36800,13 +36131,12 @@ class GetSpoofTxTrajectoryResult(CommandResult):
 
 class BeginSpoofTxTrackDefinition(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "BeginSpoofTxTrackDefinition")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -36829,6 +36159,8 @@ class BeginSpoofTxTrackDefinition(CommandBase):
 
 class PushSpoofTxTrackEcef(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, time, x, y, z, id):
         CommandBase.__init__(self, "PushSpoofTxTrackEcef")
         self.setTime(time)
@@ -36837,9 +36169,6 @@ class PushSpoofTxTrackEcef(CommandBase):
         self.setZ(z)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def time(self):
         return self.get("Time")
 
@@ -36889,6 +36218,8 @@ class PushSpoofTxTrackEcef(CommandBase):
 
 class PushSpoofTxTrackEcefNed(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, time, x, y, z, yaw, pitch, roll, id):
         CommandBase.__init__(self, "PushSpoofTxTrackEcefNed")
         self.setTime(time)
@@ -36900,9 +36231,6 @@ class PushSpoofTxTrackEcefNed(CommandBase):
         self.setRoll(roll)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def time(self):
         return self.get("Time")
 
@@ -36966,13 +36294,12 @@ class PushSpoofTxTrackEcefNed(CommandBase):
 
 class EndSpoofTxTrackDefinition(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "EndSpoofTxTrackDefinition")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -37025,14 +36352,13 @@ class EndSpoofTxTrackDefinitionResult(CommandResult):
 
 class ImportNmeaSpoofTxTrack(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, path, id):
         CommandBase.__init__(self, "ImportNmeaSpoofTxTrack")
         self.setPath(path)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def path(self):
         return self.get("Path")
 
@@ -37058,14 +36384,13 @@ class ImportNmeaSpoofTxTrack(CommandBase):
 
 class EnableSpoofTxTrajectorySmoothing(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled, id):
         CommandBase.__init__(self, "EnableSpoofTxTrajectorySmoothing")
         self.setEnabled(enabled)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -37090,13 +36415,12 @@ class EnableSpoofTxTrajectorySmoothing(CommandBase):
 
 class IsSpoofTxTrajectorySmoothingEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "IsSpoofTxTrajectorySmoothingEnabled")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -37149,14 +36473,13 @@ class IsSpoofTxTrajectorySmoothingEnabledResult(CommandResult):
 
 class ForceSpoofTxAttitudeToZero(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled, id):
         CommandBase.__init__(self, "ForceSpoofTxAttitudeToZero")
         self.setEnabled(enabled)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -37181,13 +36504,12 @@ class ForceSpoofTxAttitudeToZero(CommandBase):
 
 class IsSpoofTxAttitudeToZeroForced(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "IsSpoofTxAttitudeToZeroForced")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -37240,14 +36562,13 @@ class IsSpoofTxAttitudeToZeroForcedResult(CommandResult):
 
 class SetSpoofTxVehicleType(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, type, id):
         CommandBase.__init__(self, "SetSpoofTxVehicleType")
         self.setType(type)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def type(self):
         return self.get("Type")
 
@@ -37272,13 +36593,12 @@ class SetSpoofTxVehicleType(CommandBase):
 
 class GetSpoofTxVehicleType(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetSpoofTxVehicleType")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -37332,15 +36652,14 @@ class GetSpoofTxVehicleTypeResult(CommandResult):
 
 class SetSpoofTxAntenna(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, gain, type, id):
         CommandBase.__init__(self, "SetSpoofTxAntenna")
         self.setGain(gain)
         self.setType(type)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def gain(self):
         return self.get("Gain")
 
@@ -37371,13 +36690,12 @@ class SetSpoofTxAntenna(CommandBase):
 
 class GetSpoofTxAntenna(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetSpoofTxAntenna")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -37449,6 +36767,8 @@ class GetSpoofTxAntennaResult(CommandResult):
 
 class SetSpoofTxAntennaOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, x, y, z, yaw, pitch, roll, id):
         CommandBase.__init__(self, "SetSpoofTxAntennaOffset")
         self.setX(x)
@@ -37459,9 +36779,6 @@ class SetSpoofTxAntennaOffset(CommandBase):
         self.setRoll(roll)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def x(self):
         return self.get("X")
 
@@ -37522,13 +36839,12 @@ class SetSpoofTxAntennaOffset(CommandBase):
 
 class GetSpoofTxAntennaOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetSpoofTxAntennaOffset")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -37623,15 +36939,14 @@ class GetSpoofTxAntennaOffsetResult(CommandResult):
 
 class SetSpoofTxRemoteAddress(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, address, instanceId, id):
         CommandBase.__init__(self, "SetSpoofTxRemoteAddress")
         self.setAddress(address)
         self.setInstanceId(instanceId)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def address(self):
         return self.get("Address")
 
@@ -37663,13 +36978,12 @@ class SetSpoofTxRemoteAddress(CommandBase):
 
 class GetSpoofTxRemoteAddress(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetSpoofTxRemoteAddress")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -37730,16 +37044,15 @@ class GetSpoofTxRemoteAddressResult(CommandResult):
 
 class SetSpoofTxRefPower(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, power, id):
         CommandBase.__init__(self, "SetSpoofTxRefPower")
         self.setPower(power)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def power(self):
         return self.get("Power")
 
@@ -37765,14 +37078,13 @@ class SetSpoofTxRefPower(CommandBase):
 
 class ClearSpoofTxGpuIdx(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signalId, id):
         CommandBase.__init__(self, "ClearSpoofTxGpuIdx")
         self.setSignalId(signalId)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signalId(self):
         return self.get("SignalId")
 
@@ -37799,15 +37111,14 @@ class ClearSpoofTxGpuIdx(CommandBase):
 
 class SetSpoofTxGpuIdx(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, gpuIdx, signalId, id):
         CommandBase.__init__(self, "SetSpoofTxGpuIdx")
         self.setGpuIdx(gpuIdx)
         self.setSignalId(signalId)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def gpuIdx(self):
         return self.get("GpuIdx")
 
@@ -37838,15 +37149,14 @@ class SetSpoofTxGpuIdx(CommandBase):
 
 class SetExternalChannelsPath(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, path):
         CommandBase.__init__(self, "SetExternalChannelsPath")
         self.setPath(path)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def path(self):
         return self.get("Path")
 
@@ -37866,14 +37176,13 @@ class SetExternalChannelsPath(CommandBase):
 
 class GetSVIDsOfPrn(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signal, prn):
         CommandBase.__init__(self, "GetSVIDsOfPrn")
         self.setSignal(signal)
         self.setPrn(prn)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signal(self):
         return self.get("Signal")
 
@@ -37944,6 +37253,8 @@ class GetSVIDsOfPrnResult(CommandResult):
 
 class SetQzssL1SAugmentation(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, prn, augmentIOD, augmentPRC, prc, id):
         CommandBase.__init__(self, "SetQzssL1SAugmentation")
         self.setSystem(system)
@@ -37953,9 +37264,6 @@ class SetQzssL1SAugmentation(CommandBase):
         self.setPrc(prc)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -38004,13 +37312,12 @@ class SetQzssL1SAugmentation(CommandBase):
 
 class GetQzssL1SAugmentation(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetQzssL1SAugmentation")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -38094,13 +37401,12 @@ class GetQzssL1SAugmentationResult(CommandResult):
 
 class RemoveQzssL1SAugmentation(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "RemoveQzssL1SAugmentation")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -38116,12 +37422,11 @@ class RemoveQzssL1SAugmentation(CommandBase):
 
 class ClearQzssL1SAugmentations(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "ClearQzssL1SAugmentations")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Get all QZSS L1S augmentation's IDs.
@@ -38131,12 +37436,11 @@ class ClearQzssL1SAugmentations(CommandBase):
 
 class GetQzssL1SAugmentations(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetQzssL1SAugmentations")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetQzssL1SAugmentations.
@@ -38174,13 +37478,12 @@ class GetQzssL1SAugmentationsResult(CommandResult):
 
 class SetWavefrontJamCalibrationState(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self, state):
         CommandBase.__init__(self, "SetWavefrontJamCalibrationState")
         self.setState(state)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
     def state(self):
         return self.get("State")
 
@@ -38202,6 +37505,8 @@ class SetWavefrontJamCalibrationState(CommandBase):
 
 class AddDataSet(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, path, rollover=None, dataSetName=None):
         CommandBase.__init__(self, "AddDataSet")
         self.setSystem(system)
@@ -38209,9 +37514,6 @@ class AddDataSet(CommandBase):
         self.setRollover(rollover)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -38250,15 +37552,14 @@ class AddDataSet(CommandBase):
 
 class SetDataSetAssignation(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, dataSetType, dataSetName):
         CommandBase.__init__(self, "SetDataSetAssignation")
         self.setSystem(system)
         self.setDataSetType(dataSetType)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -38290,14 +37591,13 @@ class SetDataSetAssignation(CommandBase):
 
 class GetDataSetAssignation(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, dataSetType):
         CommandBase.__init__(self, "GetDataSetAssignation")
         self.setSystem(system)
         self.setDataSetType(dataSetType)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -38365,15 +37665,14 @@ class GetDataSetAssignationResult(CommandResult):
 
 class RenameDataSet(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, dataSetName, newDataSetName):
         CommandBase.__init__(self, "RenameDataSet")
         self.setSystem(system)
         self.setDataSetName(dataSetName)
         self.setNewDataSetName(newDataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -38405,14 +37704,13 @@ class RenameDataSet(CommandBase):
 
 class DeleteDataSet(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, dataSetName):
         CommandBase.__init__(self, "DeleteDataSet")
         self.setSystem(system)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -38438,16 +37736,15 @@ class DeleteDataSet(CommandBase):
 
 class SetActiveDataSet(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, system, dataSetName):
         CommandBase.__init__(self, "SetActiveDataSet")
         self.setSystem(system)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def system(self):
         return self.get("System")
 
@@ -38472,15 +37769,14 @@ class SetActiveDataSet(CommandBase):
 
 class GetActiveDataSet(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, system):
         CommandBase.__init__(self, "GetActiveDataSet")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def system(self):
         return self.get("System")
 
@@ -38534,15 +37830,14 @@ class GetActiveDataSetResult(CommandResult):
 
 class DuplicateDataSet(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, dataSetName, newDataSetName=None):
         CommandBase.__init__(self, "DuplicateDataSet")
         self.setSystem(system)
         self.setDataSetName(dataSetName)
         self.setNewDataSetName(newDataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -38590,15 +37885,14 @@ class ElevationAzimuth:
 
 class GetElevationAzimuthForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, system):
         CommandBase.__init__(self, "GetElevationAzimuthForEachSV")
         self.setSystem(system)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def system(self):
         return self.get("System")
 
@@ -38651,16 +37945,15 @@ class GetElevationAzimuthForEachSVResult(CommandResult):
 
 class GetElevationAzimuthForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, system, svId):
         CommandBase.__init__(self, "GetElevationAzimuthForSV")
         self.setSystem(system)
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def system(self):
         return self.get("System")
 
@@ -38755,6 +38048,8 @@ class SbasServiceMessageRegion:
 
 class SetSbasServiceMessageRegionGroup(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, serviceProvider, deltaUdrei, priorityCode, regions, id):
         CommandBase.__init__(self, "SetSbasServiceMessageRegionGroup")
         self.setServiceProvider(serviceProvider)
@@ -38763,9 +38058,6 @@ class SetSbasServiceMessageRegionGroup(CommandBase):
         self.setRegions(regions)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def serviceProvider(self):
         return self.get("ServiceProvider")
 
@@ -38809,14 +38101,13 @@ class SetSbasServiceMessageRegionGroup(CommandBase):
 
 class GetSbasServiceMessageRegionGroup(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, serviceProvider, id):
         CommandBase.__init__(self, "GetSbasServiceMessageRegionGroup")
         self.setServiceProvider(serviceProvider)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def serviceProvider(self):
         return self.get("ServiceProvider")
 
@@ -38899,14 +38190,13 @@ class GetSbasServiceMessageRegionGroupResult(CommandResult):
 
 class SetSbasDeltaUdreiOutsideOfRegions(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, serviceProvider, deltaUdrei):
         CommandBase.__init__(self, "SetSbasDeltaUdreiOutsideOfRegions")
         self.setServiceProvider(serviceProvider)
         self.setDeltaUdrei(deltaUdrei)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def serviceProvider(self):
         return self.get("ServiceProvider")
 
@@ -38931,13 +38221,12 @@ class SetSbasDeltaUdreiOutsideOfRegions(CommandBase):
 
 class GetSbasDeltaUdreiOutsideOfRegions(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, serviceProvider):
         CommandBase.__init__(self, "GetSbasDeltaUdreiOutsideOfRegions")
         self.setServiceProvider(serviceProvider)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def serviceProvider(self):
         return self.get("ServiceProvider")
 
@@ -38990,14 +38279,13 @@ class GetSbasDeltaUdreiOutsideOfRegionsResult(CommandResult):
 
 class RemoveSbasServiceMessageRegionGroup(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, serviceProvider, id):
         CommandBase.__init__(self, "RemoveSbasServiceMessageRegionGroup")
         self.setServiceProvider(serviceProvider)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def serviceProvider(self):
         return self.get("ServiceProvider")
 
@@ -39022,13 +38310,12 @@ class RemoveSbasServiceMessageRegionGroup(CommandBase):
 
 class ClearAllSbasServiceMessageRegionGroup(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, serviceProvider):
         CommandBase.__init__(self, "ClearAllSbasServiceMessageRegionGroup")
         self.setServiceProvider(serviceProvider)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def serviceProvider(self):
         return self.get("ServiceProvider")
 
@@ -39049,15 +38336,14 @@ class ClearAllSbasServiceMessageRegionGroup(CommandBase):
 
 class SwapSbasServiceMessageRegionGroup(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, serviceProvider, firstId, secondId):
         CommandBase.__init__(self, "SwapSbasServiceMessageRegionGroup")
         self.setServiceProvider(serviceProvider)
         self.setFirstId(firstId)
         self.setSecondId(secondId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def serviceProvider(self):
         return self.get("ServiceProvider")
 
@@ -39086,12 +38372,11 @@ class SwapSbasServiceMessageRegionGroup(CommandBase):
 
 class GetComputerSystemTimeSinceEpochAtPps0(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetComputerSystemTimeSinceEpochAtPps0")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
 
 #
 # Result of GetComputerSystemTimeSinceEpochAtPps0.
@@ -39133,6 +38418,8 @@ class GetComputerSystemTimeSinceEpochAtPps0Result(CommandResult):
 
 class SetRawDataLoggingInterval(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, days, hours, minutes, seconds, milliseconds):
         CommandBase.__init__(self, "SetRawDataLoggingInterval")
         self.setDays(days)
@@ -39141,9 +38428,6 @@ class SetRawDataLoggingInterval(CommandBase):
         self.setSeconds(seconds)
         self.setMilliseconds(milliseconds)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def days(self):
         return self.get("Days")
 
@@ -39183,12 +38467,11 @@ class SetRawDataLoggingInterval(CommandBase):
 
 class GetRawDataLoggingInterval(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetRawDataLoggingInterval")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetRawDataLoggingInterval.
@@ -39258,17 +38541,16 @@ class RawDataLoggingIntervalResult(CommandResult):
 
 class SetStatusLogMaxEntriesCountMode(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_IDLE
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, mode):
         CommandBase.__init__(self, "SetStatusLogMaxEntriesCountMode")
         self.setMode(mode)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_IDLE
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def mode(self):
         return self.get("Mode")
 
@@ -39287,17 +38569,16 @@ class SetStatusLogMaxEntriesCountMode(CommandBase):
 
 class SetStatusLogMaxEntriesCount(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_IDLE
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, maxCount):
         CommandBase.__init__(self, "SetStatusLogMaxEntriesCount")
         self.setMaxCount(maxCount)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_IDLE
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def maxCount(self):
         return self.get("MaxCount")
 
@@ -39328,13 +38609,12 @@ class SVDataUpdateMode:
 
 class SetSVDataUpdateMode(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, mode):
         CommandBase.__init__(self, "SetSVDataUpdateMode")
         self.setMode(mode)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def mode(self):
         return self.get("Mode")
 
@@ -39350,12 +38630,11 @@ class SetSVDataUpdateMode(CommandBase):
 
 class GetSVDataUpdateMode(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetSVDataUpdateMode")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetSVDataUpdateMode.
@@ -39441,6 +38720,8 @@ class GetSVDataUpdateModeResult(CommandResult):
 
 class PushDynamicSVData(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self, system, svId, toc, parametersDict, dataSetTypes=None):
         CommandBase.__init__(self, "PushDynamicSVData")
         self.setSystem(system)
@@ -39449,9 +38730,6 @@ class PushDynamicSVData(CommandBase):
         self.setParametersDict(parametersDict)
         self.setDataSetTypes(dataSetTypes)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
     def system(self):
         return self.get("System")
 
@@ -39533,15 +38811,14 @@ class AlmanacSVData:
 
 class PushDynamicAlmanacData(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_SIMULATING
+
     def __init__(self, system, toa, almanac):
         CommandBase.__init__(self, "PushDynamicAlmanacData")
         self.setSystem(system)
         self.setToa(toa)
         self.setAlmanac(almanac)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_SIMULATING
-
     def system(self):
         return self.get("System")
 
@@ -39573,13 +38850,12 @@ class PushDynamicAlmanacData(CommandBase):
 
 class EnableAlmanacExtrapolationFromEphemeris(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "EnableAlmanacExtrapolationFromEphemeris")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -39595,12 +38871,11 @@ class EnableAlmanacExtrapolationFromEphemeris(CommandBase):
 
 class IsAlmanacExtrapolationFromEphemerisEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsAlmanacExtrapolationFromEphemerisEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsAlmanacExtrapolationFromEphemerisEnabled.
@@ -39649,16 +38924,15 @@ class EncryptionSignalType:
 
 class SetEncryptionLibraryPath(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, type, path):
         CommandBase.__init__(self, "SetEncryptionLibraryPath")
         self.setType(type)
         self.setPath(path)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def type(self):
         return self.get("Type")
 
@@ -39683,15 +38957,14 @@ class SetEncryptionLibraryPath(CommandBase):
 
 class GetEncryptionLibraryPath(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, type):
         CommandBase.__init__(self, "GetEncryptionLibraryPath")
         self.setType(type)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def type(self):
         return self.get("Type")
 
@@ -39743,15 +39016,14 @@ class GetEncryptionLibraryPathResult(CommandResult):
 
 class TestEncryptionLibrary(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, type):
         CommandBase.__init__(self, "TestEncryptionLibrary")
         self.setType(type)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def type(self):
         return self.get("Type")
 
@@ -39774,15 +39046,14 @@ class TestEncryptionLibrary(CommandBase):
 
 class ExecuteGpuBenchmark(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, durationMs, systemSvCountDict, echoCount):
         CommandBase.__init__(self, "ExecuteGpuBenchmark")
         self.setDurationMs(durationMs)
         self.setSystemSvCountDict(systemSvCountDict)
         self.setEchoCount(echoCount)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def durationMs(self):
         return self.get("DurationMs")
 
@@ -39856,14 +39127,13 @@ class SignalWithComponent:
 
 class SetInterModulation(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signalArray, coefficient):
         CommandBase.__init__(self, "SetInterModulation")
         self.setSignalArray(signalArray)
         self.setCoefficient(coefficient)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -39888,13 +39158,12 @@ class SetInterModulation(CommandBase):
 
 class GetInterModulation(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, signalArray):
         CommandBase.__init__(self, "GetInterModulation")
         self.setSignalArray(signalArray)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def signalArray(self):
         return self.get("SignalArray")
 
@@ -39951,6 +39220,8 @@ class GetInterModulationResult(CommandResult):
 
 class SetWFElement(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(
         self,
         element,
@@ -39968,9 +39239,6 @@ class SetWFElement(CommandBase):
         self.setIsGaussianNoiseEnabled(isGaussianNoiseEnabled)
         self.setGaussianNoisePowerDensityOffset(gaussianNoisePowerDensityOffset)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def element(self):
         return self.get("Element")
 
@@ -40019,13 +39287,12 @@ class SetWFElement(CommandBase):
 
 class GetWFElement(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, element):
         CommandBase.__init__(self, "GetWFElement")
         self.setElement(element)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def element(self):
         return self.get("Element")
 
@@ -40114,12 +39381,11 @@ class GetWFElementResult(CommandResult):
 
 class RemoveWFElement(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "RemoveWFElement")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Import Wavefront Antenna settings from an XML file.
@@ -40132,13 +39398,12 @@ class RemoveWFElement(CommandBase):
 
 class ImportWFAntenna(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, filePath):
         CommandBase.__init__(self, "ImportWFAntenna")
         self.setFilePath(filePath)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def filePath(self):
         return self.get("FilePath")
 
@@ -40158,14 +39423,13 @@ class ImportWFAntenna(CommandBase):
 
 class ExportWFAntenna(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, filePath, overwriteFile):
         CommandBase.__init__(self, "ExportWFAntenna")
         self.setFilePath(filePath)
         self.setOverwriteFile(overwriteFile)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def filePath(self):
         return self.get("FilePath")
 
@@ -40191,16 +39455,15 @@ class ExportWFAntenna(CommandBase):
 
 class SetN310LocalOscillatorSource(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, isExternal, id):
         CommandBase.__init__(self, "SetN310LocalOscillatorSource")
         self.setIsExternal(isExternal)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def isExternal(self):
         return self.get("IsExternal")
 
@@ -40225,13 +39488,12 @@ class SetN310LocalOscillatorSource(CommandBase):
 
 class GetN310LocalOscillatorSource(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetN310LocalOscillatorSource")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -40340,6 +39602,8 @@ class GetN310LocalOscillatorSourceResult(CommandResult):
 
 class SetConstellationParameterForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetConstellationParameterForSV")
         self.setSystem(system)
@@ -40348,9 +39612,6 @@ class SetConstellationParameterForSV(CommandBase):
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -40449,6 +39710,8 @@ class SetConstellationParameterForSV(CommandBase):
 
 class GetConstellationParameterForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, svId, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetConstellationParameterForSV")
         self.setSystem(system)
@@ -40456,9 +39719,6 @@ class GetConstellationParameterForSV(CommandBase):
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -40555,6 +39815,8 @@ class GetConstellationParameterForSVResult(CommandResult):
 
 class SetConstellationParameterForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetConstellationParameterForEachSV")
         self.setSystem(system)
@@ -40562,9 +39824,6 @@ class SetConstellationParameterForEachSV(CommandBase):
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -40603,15 +39862,14 @@ class SetConstellationParameterForEachSV(CommandBase):
 
 class GetConstellationParameterForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, system, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetConstellationParameterForEachSV")
         self.setSystem(system)
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def system(self):
         return self.get("System")
 
@@ -40691,13 +39949,12 @@ class GetConstellationParameterForEachSVResult(CommandResult):
 
 class EnableDektecAdjustedNoise(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enable):
         CommandBase.__init__(self, "EnableDektecAdjustedNoise")
         self.setEnable(enable)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enable(self):
         return self.get("Enable")
 
@@ -40713,12 +39970,11 @@ class EnableDektecAdjustedNoise(CommandBase):
 
 class IsDektecAdjustedNoiseEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsDektecAdjustedNoiseEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsDektecAdjustedNoiseEnabled.
@@ -40753,14 +40009,13 @@ class IsDektecAdjustedNoiseEnabledResult(CommandResult):
 
 class GetCurrentConfigPath(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetCurrentConfigPath")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Result of GetCurrentConfigPath.
@@ -40800,15 +40055,14 @@ class GetCurrentConfigPathResult(CommandResult):
 
 class SetGaussianNoisePowerDensityOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id, outputIdx, powerDensityOffset):
         CommandBase.__init__(self, "SetGaussianNoisePowerDensityOffset")
         self.setId(id)
         self.setOutputIdx(outputIdx)
         self.setPowerDensityOffset(powerDensityOffset)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -40840,14 +40094,13 @@ class SetGaussianNoisePowerDensityOffset(CommandBase):
 
 class GetGaussianNoisePowerDensityOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id, outputIdx):
         CommandBase.__init__(self, "GetGaussianNoisePowerDensityOffset")
         self.setId(id)
         self.setOutputIdx(outputIdx)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -40914,16 +40167,15 @@ class GetGaussianNoisePowerDensityOffsetResult(CommandResult):
 
 class EnableOsnmaForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, enabled):
         CommandBase.__init__(self, "EnableOsnmaForSV")
         self.setSvId(svId)
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -40948,13 +40200,12 @@ class EnableOsnmaForSV(CommandBase):
 
 class IsOsnmaEnabledForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId):
         CommandBase.__init__(self, "IsOsnmaEnabledForSV")
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -41006,15 +40257,14 @@ class IsOsnmaEnabledForSVResult(CommandResult):
 
 class EnableOsnmaForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "EnableOsnmaForEachSV")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -41030,12 +40280,11 @@ class EnableOsnmaForEachSV(CommandBase):
 
 class IsOsnmaEnabledForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsOsnmaEnabledForEachSV")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsOsnmaEnabledForEachSV.
@@ -41074,16 +40323,15 @@ class IsOsnmaEnabledForEachSVResult(CommandResult):
 
 class SetCrossAuthenticatedSatellitesForSV(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, svId, svIdList):
         CommandBase.__init__(self, "SetCrossAuthenticatedSatellitesForSV")
         self.setSvId(svId)
         self.setSvIdList(svIdList)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_SIMULATING | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def svId(self):
         return self.get("SvId")
 
@@ -41108,13 +40356,12 @@ class SetCrossAuthenticatedSatellitesForSV(CommandBase):
 
 class GetCrossAuthenticatedSatellitesForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId):
         CommandBase.__init__(self, "GetCrossAuthenticatedSatellitesForSV")
         self.setSvId(svId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -41172,6 +40419,8 @@ class GetCrossAuthenticatedSatellitesForSVResult(CommandResult):
 
 class SetMerkleTreeParameters(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(
         self, id, keyType, hashFunction, beginApplicability, endApplicability=None
     ):
@@ -41182,9 +40431,6 @@ class SetMerkleTreeParameters(CommandBase):
         self.setBeginApplicability(beginApplicability)
         self.setEndApplicability(endApplicability)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -41227,13 +40473,12 @@ class SetMerkleTreeParameters(CommandBase):
 
 class GetMerkleTreeParameters(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "GetMerkleTreeParameters")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -41309,12 +40554,11 @@ class GetMerkleTreeParametersResult(CommandResult):
 
 class GetAllMerkleTreeID(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetAllMerkleTreeID")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetAllMerkleTreeID.
@@ -41352,13 +40596,12 @@ class GetAllMerkleTreeIDResult(CommandResult):
 
 class RemoveMerkleTree(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id):
         CommandBase.__init__(self, "RemoveMerkleTree")
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -41380,6 +40623,8 @@ class RemoveMerkleTree(CommandBase):
 
 class ExportMerkleTree(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id, publicKeyIndexes, filePath, overwriteFile):
         CommandBase.__init__(self, "ExportMerkleTree")
         self.setId(id)
@@ -41387,9 +40632,6 @@ class ExportMerkleTree(CommandBase):
         self.setFilePath(filePath)
         self.setOverwriteFile(overwriteFile)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -41427,14 +40669,13 @@ class ExportMerkleTree(CommandBase):
 
 class GetMerkleTreeXML(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id, publicKeyIndexes):
         CommandBase.__init__(self, "GetMerkleTreeXML")
         self.setId(id)
         self.setPublicKeyIndexes(publicKeyIndexes)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -41500,13 +40741,12 @@ class GetMerkleTreeXMLResult(CommandResult):
 
 class SetOsnmaTagSize(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, tagSize):
         CommandBase.__init__(self, "SetOsnmaTagSize")
         self.setTagSize(tagSize)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def tagSize(self):
         return self.get("TagSize")
 
@@ -41522,12 +40762,11 @@ class SetOsnmaTagSize(CommandBase):
 
 class GetOsnmaTagSize(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetOsnmaTagSize")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetOsnmaTagSize.
@@ -41566,13 +40805,12 @@ class GetOsnmaTagSizeResult(CommandResult):
 
 class SetOsnmaTeslaKeySize(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, keySize):
         CommandBase.__init__(self, "SetOsnmaTeslaKeySize")
         self.setKeySize(keySize)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def keySize(self):
         return self.get("KeySize")
 
@@ -41588,12 +40826,11 @@ class SetOsnmaTeslaKeySize(CommandBase):
 
 class GetOsnmaTeslaKeySize(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetOsnmaTeslaKeySize")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetOsnmaTeslaKeySize.
@@ -41632,13 +40869,12 @@ class GetOsnmaTeslaKeySizeResult(CommandResult):
 
 class SetOsnmaTeslaHashFunction(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, hashFunction):
         CommandBase.__init__(self, "SetOsnmaTeslaHashFunction")
         self.setHashFunction(hashFunction)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def hashFunction(self):
         return self.get("HashFunction")
 
@@ -41654,12 +40890,11 @@ class SetOsnmaTeslaHashFunction(CommandBase):
 
 class GetOsnmaTeslaHashFunction(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetOsnmaTeslaHashFunction")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetOsnmaTeslaHashFunction.
@@ -41698,13 +40933,12 @@ class GetOsnmaTeslaHashFunctionResult(CommandResult):
 
 class SetOsnmaMacFunction(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, macFunction):
         CommandBase.__init__(self, "SetOsnmaMacFunction")
         self.setMacFunction(macFunction)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def macFunction(self):
         return self.get("MacFunction")
 
@@ -41720,12 +40954,11 @@ class SetOsnmaMacFunction(CommandBase):
 
 class GetOsnmaMacFunction(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetOsnmaMacFunction")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetOsnmaMacFunction.
@@ -41765,13 +40998,12 @@ class GetOsnmaMacFunctionResult(CommandResult):
 
 class SetOsnmaMacLtId(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, macLtId):
         CommandBase.__init__(self, "SetOsnmaMacLtId")
         self.setMacLtId(macLtId)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def macLtId(self):
         return self.get("MacLtId")
 
@@ -41787,12 +41019,11 @@ class SetOsnmaMacLtId(CommandBase):
 
 class GetOsnmaMacLtId(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetOsnmaMacLtId")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetOsnmaMacLtId.
@@ -41844,16 +41075,15 @@ class PropagationModelType:
 
 class SetPropagationModelParameters(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, model, paramValueDict):
         CommandBase.__init__(self, "SetPropagationModelParameters")
         self.setModel(model)
         self.setParamValueDict(paramValueDict)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def model(self):
         return self.get("Model")
 
@@ -41879,16 +41109,15 @@ class SetPropagationModelParameters(CommandBase):
 
 class GetPropagationModelParameters(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, model, paramArray):
         CommandBase.__init__(self, "GetPropagationModelParameters")
         self.setModel(model)
         self.setParamArray(paramArray)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def model(self):
         return self.get("Model")
 
@@ -41946,15 +41175,14 @@ class GetPropagationModelParametersResult(CommandResult):
 
 class SetCurrentPropagationModel(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, model):
         CommandBase.__init__(self, "SetCurrentPropagationModel")
         self.setModel(model)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def model(self):
         return self.get("Model")
 
@@ -41970,14 +41198,13 @@ class SetCurrentPropagationModel(CommandBase):
 
 class GetCurrentPropagationModel(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetCurrentPropagationModel")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
 
 #
 # Result of GetCurrentPropagationModel.
@@ -42015,15 +41242,14 @@ class GetCurrentPropagationModelResult(CommandResult):
 
 class EnableAutomaticGpuAllocation(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "EnableAutomaticGpuAllocation")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -42039,14 +41265,13 @@ class EnableAutomaticGpuAllocation(CommandBase):
 
 class IsAutomaticGpuAllocationEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsAutomaticGpuAllocationEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG | ExecutePermission.EXECUTE_IF_IDLE
-        )
-
 
 #
 # Result of IsAutomaticGpuAllocationEnabled.
@@ -42084,13 +41309,12 @@ class IsAutomaticGpuAllocationEnabledResult(CommandResult):
 
 class SetDynamicRangeOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, offset):
         CommandBase.__init__(self, "SetDynamicRangeOffset")
         self.setOffset(offset)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def offset(self):
         return self.get("Offset")
 
@@ -42106,12 +41330,11 @@ class SetDynamicRangeOffset(CommandBase):
 
 class GetDynamicRangeOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetDynamicRangeOffset")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of GetDynamicRangeOffset.
@@ -42149,13 +41372,12 @@ class GetDynamicRangeOffsetResult(CommandResult):
 
 class EnableEarthMask(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "EnableEarthMask")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -42171,12 +41393,11 @@ class EnableEarthMask(CommandBase):
 
 class IsEarthMaskEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsEarthMaskEnabled")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
 
 #
 # Result of IsEarthMaskEnabled.
@@ -42216,15 +41437,14 @@ class IsEarthMaskEnabledResult(CommandResult):
 
 class SetGaussianNoiseSeed(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id, outputIdx, seed):
         CommandBase.__init__(self, "SetGaussianNoiseSeed")
         self.setId(id)
         self.setOutputIdx(outputIdx)
         self.setSeed(seed)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -42256,14 +41476,13 @@ class SetGaussianNoiseSeed(CommandBase):
 
 class GetGaussianNoiseSeed(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, id, outputIdx):
         CommandBase.__init__(self, "GetGaussianNoiseSeed")
         self.setId(id)
         self.setOutputIdx(outputIdx)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def id(self):
         return self.get("Id")
 
@@ -42332,6 +41551,8 @@ class GetGaussianNoiseSeedResult(CommandResult):
 
 class ChangeModulationTargetIQPlayback(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, output, files, gain, id):
         CommandBase.__init__(self, "ChangeModulationTargetIQPlayback")
         self.setOutput(output)
@@ -42339,9 +41560,6 @@ class ChangeModulationTargetIQPlayback(CommandBase):
         self.setGain(gain)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def output(self):
         return self.get("Output")
 
@@ -42379,14 +41597,13 @@ class ChangeModulationTargetIQPlayback(CommandBase):
 
 class GetModulationTargetIQPlayback(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, output, id):
         CommandBase.__init__(self, "GetModulationTargetIQPlayback")
         self.setOutput(output)
         self.setId(id)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def output(self):
         return self.get("Output")
 
@@ -42459,14 +41676,13 @@ class GetModulationTargetIQPlaybackResult(CommandResult):
 
 class GetMasterStatus(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetMasterStatus")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def deprecated(self):
         return "Please note the command GetMasterStatus is deprecated since 23.11. You may use GetMainInstanceStatus."
 
@@ -42522,14 +41738,13 @@ class GetMasterStatusResult(CommandResult):
 
 class GetSlaveStatus(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetSlaveStatus")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def deprecated(self):
         return "Please note the command GetSlaveStatus is deprecated since 23.11. You may use GetWorkerInstanceStatus."
 
@@ -42596,17 +41811,16 @@ class GetSlaveStatusResult(CommandResult):
 
 class StopMasterWhenSlaveStop(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_NO_CONFIG
+        | ExecutePermission.EXECUTE_IF_IDLE
+        | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self, enabled):
         CommandBase.__init__(self, "StopMasterWhenSlaveStop")
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_NO_CONFIG
-            | ExecutePermission.EXECUTE_IF_IDLE
-            | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def enabled(self):
         return self.get("Enabled")
 
@@ -42627,14 +41841,13 @@ class StopMasterWhenSlaveStop(CommandBase):
 
 class IsStopMasterWhenSlaveStop(CommandBase):
 
+    EXECUTE_PERMISSION = (
+        ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
+    )
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "IsStopMasterWhenSlaveStop")
 
-    def executePermission(self) -> ExecutePermission:
-        return (
-            ExecutePermission.EXECUTE_IF_IDLE | ExecutePermission.EXECUTE_IF_SIMULATING
-        )
-
     def deprecated(self):
         return "Please note the command IsStopMasterWhenSlaveStop is deprecated since 23.11. You may use IsStopMainInstanceWhenWorkerInstanceStop."
 
@@ -42710,6 +41923,8 @@ class IsStopMasterWhenSlaveStopResult(CommandResult):
 
 class SetGpsEphDoubleParamForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetGpsEphDoubleParamForSV")
         self.setSvId(svId)
@@ -42717,9 +41932,6 @@ class SetGpsEphDoubleParamForSV(CommandBase):
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -42793,15 +42005,14 @@ class SetGpsEphDoubleParamForSV(CommandBase):
 
 class GetGpsEphDoubleParamForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetGpsEphDoubleParamForSV")
         self.setSvId(svId)
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -42915,6 +42126,8 @@ class GetGpsEphDoubleParamForSVResult(CommandResult):
 
 class SetGalileoEphDoubleParamForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetGalileoEphDoubleParamForSV")
         self.setSvId(svId)
@@ -42922,9 +42135,6 @@ class SetGalileoEphDoubleParamForSV(CommandBase):
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -42994,15 +42204,14 @@ class SetGalileoEphDoubleParamForSV(CommandBase):
 
 class GetGalileoEphDoubleParamForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetGalileoEphDoubleParamForSV")
         self.setSvId(svId)
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -43117,6 +42326,8 @@ class GetGalileoEphDoubleParamForSVResult(CommandResult):
 
 class SetBeiDouEphDoubleParamForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetBeiDouEphDoubleParamForSV")
         self.setSvId(svId)
@@ -43124,9 +42335,6 @@ class SetBeiDouEphDoubleParamForSV(CommandBase):
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -43197,15 +42405,14 @@ class SetBeiDouEphDoubleParamForSV(CommandBase):
 
 class GetBeiDouEphDoubleParamForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetBeiDouEphDoubleParamForSV")
         self.setSvId(svId)
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -43295,6 +42502,8 @@ class GetBeiDouEphDoubleParamForSVResult(CommandResult):
 
 class SetQzssEphDoubleParamForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetQzssEphDoubleParamForSV")
         self.setSvId(svId)
@@ -43302,9 +42511,6 @@ class SetQzssEphDoubleParamForSV(CommandBase):
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -43353,6 +42559,8 @@ class SetQzssEphDoubleParamForSV(CommandBase):
 
 class SetQzssEphemerisDoubleParam(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetQzssEphemerisDoubleParam")
         self.setSvId(svId)
@@ -43360,9 +42568,6 @@ class SetQzssEphemerisDoubleParam(CommandBase):
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -43408,15 +42613,14 @@ class SetQzssEphemerisDoubleParam(CommandBase):
 
 class GetQzssEphDoubleParamForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetQzssEphDoubleParamForSV")
         self.setSvId(svId)
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -43458,15 +42662,14 @@ class GetQzssEphDoubleParamForSV(CommandBase):
 
 class GetQzssEphemerisDoubleParam(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetQzssEphemerisDoubleParam")
         self.setSvId(svId)
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -43580,6 +42783,8 @@ class GetQzssEphDoubleParamForSVResult(CommandResult):
 
 class SetNavICEphDoubleParamForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetNavICEphDoubleParamForSV")
         self.setSvId(svId)
@@ -43587,9 +42792,6 @@ class SetNavICEphDoubleParamForSV(CommandBase):
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -43660,6 +42862,8 @@ class SetNavICEphDoubleParamForSV(CommandBase):
 
 class SetNavICEphemerisDoubleParam(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetNavICEphemerisDoubleParam")
         self.setSvId(svId)
@@ -43667,9 +42871,6 @@ class SetNavICEphemerisDoubleParam(CommandBase):
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -43737,15 +42938,14 @@ class SetNavICEphemerisDoubleParam(CommandBase):
 
 class GetNavICEphDoubleParamForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetNavICEphDoubleParamForSV")
         self.setSvId(svId)
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -43809,15 +43009,14 @@ class GetNavICEphDoubleParamForSV(CommandBase):
 
 class GetNavICEphemerisDoubleParam(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetNavICEphemerisDoubleParam")
         self.setSvId(svId)
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -43904,15 +43103,14 @@ class GetNavICEphDoubleParamForSVResult(CommandResult):
 
 class SetGpsEphDoubleParamForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetGpsEphDoubleParamForEachSV")
         self.setParamName(paramName)
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -43952,15 +43150,14 @@ class SetGpsEphDoubleParamForEachSV(CommandBase):
 
 class SetGpsEphemerisDoubleParams(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetGpsEphemerisDoubleParams")
         self.setParamName(paramName)
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -43997,14 +43194,13 @@ class SetGpsEphemerisDoubleParams(CommandBase):
 
 class GetGpsEphDoubleParamForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetGpsEphDoubleParamForEachSV")
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -44037,14 +43233,13 @@ class GetGpsEphDoubleParamForEachSV(CommandBase):
 
 class GetGpsEphemerisDoubleParams(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetGpsEphemerisDoubleParams")
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -44117,15 +43312,14 @@ class GetGpsEphDoubleParamForEachSVResult(CommandResult):
 
 class SetGalileoEphDoubleParamForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetGalileoEphDoubleParamForEachSV")
         self.setParamName(paramName)
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -44165,15 +43359,14 @@ class SetGalileoEphDoubleParamForEachSV(CommandBase):
 
 class SetGalileoEphemerisDoubleParams(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetGalileoEphemerisDoubleParams")
         self.setParamName(paramName)
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -44210,14 +43403,13 @@ class SetGalileoEphemerisDoubleParams(CommandBase):
 
 class GetGalileoEphDoubleParamForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetGalileoEphDoubleParamForEachSV")
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -44250,14 +43442,13 @@ class GetGalileoEphDoubleParamForEachSV(CommandBase):
 
 class GetGalileoEphemerisDoubleParams(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetGalileoEphemerisDoubleParams")
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -44330,15 +43521,14 @@ class GetGalileoEphDoubleParamForEachSVResult(CommandResult):
 
 class SetBeiDouEphDoubleParamForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetBeiDouEphDoubleParamForEachSV")
         self.setParamName(paramName)
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -44378,15 +43568,14 @@ class SetBeiDouEphDoubleParamForEachSV(CommandBase):
 
 class SetBeiDouEphemerisDoubleParams(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetBeiDouEphemerisDoubleParams")
         self.setParamName(paramName)
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -44423,14 +43612,13 @@ class SetBeiDouEphemerisDoubleParams(CommandBase):
 
 class GetBeiDouEphDoubleParamForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetBeiDouEphDoubleParamForEachSV")
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -44463,14 +43651,13 @@ class GetBeiDouEphDoubleParamForEachSV(CommandBase):
 
 class GetBeiDouEphemerisDoubleParams(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetBeiDouEphemerisDoubleParams")
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -44543,15 +43730,14 @@ class GetBeiDouEphDoubleParamForEachSVResult(CommandResult):
 
 class SetQzssEphDoubleParamForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetQzssEphDoubleParamForEachSV")
         self.setParamName(paramName)
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -44591,15 +43777,14 @@ class SetQzssEphDoubleParamForEachSV(CommandBase):
 
 class SetQzssEphemerisDoubleParams(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetQzssEphemerisDoubleParams")
         self.setParamName(paramName)
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -44636,14 +43821,13 @@ class SetQzssEphemerisDoubleParams(CommandBase):
 
 class GetQzssEphDoubleParamForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetQzssEphDoubleParamForEachSV")
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -44676,14 +43860,13 @@ class GetQzssEphDoubleParamForEachSV(CommandBase):
 
 class GetQzssEphemerisDoubleParams(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetQzssEphemerisDoubleParams")
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -44756,15 +43939,14 @@ class GetQzssEphDoubleParamForEachSVResult(CommandResult):
 
 class SetNavICEphDoubleParamForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetNavICEphDoubleParamForEachSV")
         self.setParamName(paramName)
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -44804,15 +43986,14 @@ class SetNavICEphDoubleParamForEachSV(CommandBase):
 
 class SetNavICEphemerisDoubleParams(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetNavICEphemerisDoubleParams")
         self.setParamName(paramName)
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -44849,14 +44030,13 @@ class SetNavICEphemerisDoubleParams(CommandBase):
 
 class GetNavICEphDoubleParamForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetNavICEphDoubleParamForEachSV")
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -44889,14 +44069,13 @@ class GetNavICEphDoubleParamForEachSV(CommandBase):
 
 class GetNavICEphemerisDoubleParams(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetNavICEphemerisDoubleParams")
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -44978,6 +44157,8 @@ class GetNavICEphDoubleParamForEachSVResult(CommandResult):
 
 class SetGpsEphBoolParamForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetGpsEphBoolParamForSV")
         self.setSvId(svId)
@@ -44985,9 +44166,6 @@ class SetGpsEphBoolParamForSV(CommandBase):
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -45039,15 +44217,14 @@ class SetGpsEphBoolParamForSV(CommandBase):
 
 class GetGpsEphBoolParamForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetGpsEphBoolParamForSV")
         self.setSvId(svId)
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -45134,15 +44311,14 @@ class GetGpsEphBoolParamForSVResult(CommandResult):
 
 class SetGpsEphBoolParamForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetGpsEphBoolParamForEachSV")
         self.setParamName(paramName)
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -45182,15 +44358,14 @@ class SetGpsEphBoolParamForEachSV(CommandBase):
 
 class SetGpsEphemerisBoolParams(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetGpsEphemerisBoolParams")
         self.setParamName(paramName)
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -45227,14 +44402,13 @@ class SetGpsEphemerisBoolParams(CommandBase):
 
 class GetGpsEphBoolParamForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetGpsEphBoolParamForEachSV")
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -45267,14 +44441,13 @@ class GetGpsEphBoolParamForEachSV(CommandBase):
 
 class GetGpsEphemerisBoolParams(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetGpsEphemerisBoolParams")
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -45352,6 +44525,8 @@ class GetGpsEphBoolParamForEachSVResult(CommandResult):
 
 class SetBeiDouEphBoolParamForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetBeiDouEphBoolParamForSV")
         self.setSvId(svId)
@@ -45359,9 +44534,6 @@ class SetBeiDouEphBoolParamForSV(CommandBase):
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -45409,15 +44581,14 @@ class SetBeiDouEphBoolParamForSV(CommandBase):
 
 class GetBeiDouEphBoolParamForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetBeiDouEphBoolParamForSV")
         self.setSvId(svId)
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -45504,15 +44675,14 @@ class GetBeiDouEphBoolParamForSVResult(CommandResult):
 
 class SetBeiDouEphBoolParamForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetBeiDouEphBoolParamForEachSV")
         self.setParamName(paramName)
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -45552,15 +44722,14 @@ class SetBeiDouEphBoolParamForEachSV(CommandBase):
 
 class SetBeiDouEphemerisBoolParams(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetBeiDouEphemerisBoolParams")
         self.setParamName(paramName)
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -45597,14 +44766,13 @@ class SetBeiDouEphemerisBoolParams(CommandBase):
 
 class GetBeiDouEphBoolParamForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetBeiDouEphBoolParamForEachSV")
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -45637,14 +44805,13 @@ class GetBeiDouEphBoolParamForEachSV(CommandBase):
 
 class GetBeiDouEphemerisBoolParams(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetBeiDouEphemerisBoolParams")
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -45726,6 +44893,8 @@ class GetBeiDouEphBoolParamForEachSVResult(CommandResult):
 
 class SetQzssEphBoolParamForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetQzssEphBoolParamForSV")
         self.setSvId(svId)
@@ -45733,9 +44902,6 @@ class SetQzssEphBoolParamForSV(CommandBase):
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -45790,6 +44956,8 @@ class SetQzssEphBoolParamForSV(CommandBase):
 
 class SetQzssEphemerisBoolParam(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetQzssEphemerisBoolParam")
         self.setSvId(svId)
@@ -45797,9 +44965,6 @@ class SetQzssEphemerisBoolParam(CommandBase):
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -45851,15 +45016,14 @@ class SetQzssEphemerisBoolParam(CommandBase):
 
 class GetQzssEphBoolParamForSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetQzssEphBoolParamForSV")
         self.setSvId(svId)
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -45907,15 +45071,14 @@ class GetQzssEphBoolParamForSV(CommandBase):
 
 class GetQzssEphemerisBoolParam(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, svId, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetQzssEphemerisBoolParam")
         self.setSvId(svId)
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def svId(self):
         return self.get("SvId")
 
@@ -46002,15 +45165,14 @@ class GetQzssEphBoolParamForSVResult(CommandResult):
 
 class SetQzssEphBoolParamForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetQzssEphBoolParamForEachSV")
         self.setParamName(paramName)
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -46050,15 +45212,14 @@ class SetQzssEphBoolParamForEachSV(CommandBase):
 
 class SetQzssEphemerisBoolParams(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, val, dataSetName=None):
         CommandBase.__init__(self, "SetQzssEphemerisBoolParams")
         self.setParamName(paramName)
         self.setVal(val)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -46095,14 +45256,13 @@ class SetQzssEphemerisBoolParams(CommandBase):
 
 class GetQzssEphBoolParamForEachSV(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetQzssEphBoolParamForEachSV")
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -46135,14 +45295,13 @@ class GetQzssEphBoolParamForEachSV(CommandBase):
 
 class GetQzssEphemerisBoolParams(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, paramName, dataSetName=None):
         CommandBase.__init__(self, "GetQzssEphemerisBoolParams")
         self.setParamName(paramName)
         self.setDataSetName(dataSetName)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def paramName(self):
         return self.get("ParamName")
 
@@ -46219,6 +45378,8 @@ class GetQzssEphBoolParamForEachSVResult(CommandResult):
 
 class SetWFAntennaElementOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, x, y, z, yaw, pitch, roll, element):
         CommandBase.__init__(self, "SetWFAntennaElementOffset")
         self.setX(x)
@@ -46229,9 +45390,6 @@ class SetWFAntennaElementOffset(CommandBase):
         self.setRoll(roll)
         self.setElement(element)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def x(self):
         return self.get("X")
 
@@ -46291,13 +45449,12 @@ class SetWFAntennaElementOffset(CommandBase):
 
 class GetWFAntennaElementOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, element):
         CommandBase.__init__(self, "GetWFAntennaElementOffset")
         self.setElement(element)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def element(self):
         return self.get("Element")
 
@@ -46395,14 +45552,13 @@ class GetWFAntennaElementOffsetResult(CommandResult):
 
 class SetWFAntennaElementPhasePatternOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, phaseOffset, element):
         CommandBase.__init__(self, "SetWFAntennaElementPhasePatternOffset")
         self.setPhaseOffset(phaseOffset)
         self.setElement(element)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def phaseOffset(self):
         return self.get("PhaseOffset")
 
@@ -46432,13 +45588,12 @@ class SetWFAntennaElementPhasePatternOffset(CommandBase):
 
 class GetWFAntennaElementPhasePatternOffset(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, element):
         CommandBase.__init__(self, "GetWFAntennaElementPhasePatternOffset")
         self.setElement(element)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def element(self):
         return self.get("Element")
 
@@ -46496,14 +45651,13 @@ class GetWFAntennaElementPhasePatternOffsetResult(CommandResult):
 
 class SetWFAntennaElementModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, antennaModelName, element):
         CommandBase.__init__(self, "SetWFAntennaElementModel")
         self.setAntennaModelName(antennaModelName)
         self.setElement(element)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def antennaModelName(self):
         return self.get("AntennaModelName")
 
@@ -46533,13 +45687,12 @@ class SetWFAntennaElementModel(CommandBase):
 
 class GetWFAntennaElementModel(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, element):
         CommandBase.__init__(self, "GetWFAntennaElementModel")
         self.setElement(element)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def element(self):
         return self.get("Element")
 
@@ -46597,14 +45750,13 @@ class GetWFAntennaElementModelResult(CommandResult):
 
 class SetWFAntennaElementEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, element, enabled):
         CommandBase.__init__(self, "SetWFAntennaElementEnabled")
         self.setElement(element)
         self.setEnabled(enabled)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def element(self):
         return self.get("Element")
 
@@ -46634,13 +45786,12 @@ class SetWFAntennaElementEnabled(CommandBase):
 
 class IsWFAntennaElementEnabled(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, element):
         CommandBase.__init__(self, "IsWFAntennaElementEnabled")
         self.setElement(element)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def element(self):
         return self.get("Element")
 
@@ -46697,13 +45848,12 @@ class IsWFAntennaElementEnabledResult(CommandResult):
 
 class SetWFAntennaGain(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self, gain):
         CommandBase.__init__(self, "SetWFAntennaGain")
         self.setGain(gain)
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def gain(self):
         return self.get("Gain")
 
@@ -46724,12 +45874,11 @@ class SetWFAntennaGain(CommandBase):
 
 class GetWFAntennaGain(CommandBase):
 
+    EXECUTE_PERMISSION = ExecutePermission.EXECUTE_IF_IDLE
+
     def __init__(self) -> None:
         CommandBase.__init__(self, "GetWFAntennaGain")
 
-    def executePermission(self) -> ExecutePermission:
-        return ExecutePermission.EXECUTE_IF_IDLE
-
     def deprecated(self):
         return "Please note the command GetWFAntennaGain is deprecated since 25.4. You may use GetWFElement."
 
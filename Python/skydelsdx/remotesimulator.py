@@ -67,9 +67,10 @@ class RemoteSimulator:
         self._checkConnect()
         if self.verbose:
             print("Commands Client Disconnecting")
-        del self.client
+        self.client.close()
         self.client = None
-        del self.hil
+        if self.hil is not None:
+            self.hil.close()
         self.hil = None
 
     def setVerbose(self, verbose: bool) -> None:
@@ -6,7 +6,13 @@ ESMAJ = 6378137.0  # Semi-major axis of Earth, meters
 EFLAT = 0.00335281066474
 ESMIN = ESMAJ * (1.0 - EFLAT)
 EECC_SQUARED = ((ESMAJ * ESMAJ) - (ESMIN * ESMIN)) / (ESMAJ * ESMAJ)
-Pi = 3.1415926535898  # Pi used in the GPS coordinate
+_ONE_MINUS_EECC_SQUARED = 1.0 - EECC_SQUARED
+Pi = math.pi
+
+# Ellipsoid terms used by Lla.toEcef
+_ONE_MINUS_EFLAT_SQUARED = (1.0 - EFLAT) * (1.0 - EFLAT)
+_EX2 = (2.0 - EFLAT) * EFLAT / _ONE_MINUS_EFLAT_SQUARED
+_C_SMA = ESMAJ * math.sqrt(1.0 + _EX2)
 
 
 def toRadian(degree: float) -> float:
@@ -20,6 +26,8 @@ def toDegree(radian: float) -> float:
 class Lla:
     """A geodetic (Latitude Longitude Altitude, LLA) coordinate."""
 
+    __slots__ = ("lat", "lon", "alt")
+
     def __init__(self, lat: float, lon: float, alt: float = 0) -> None:
         """
         Parameters
@@ -59,14 +67,11 @@ class Lla:
             The converted coordinates in ECEF format.
         """
         cos_lat = math.cos(self.lat)
-        tmp = (1 - EFLAT) * (1 - EFLAT)
-        ex2 = (2 - EFLAT) * EFLAT / tmp
-        c = ESMAJ * math.sqrt(1 + ex2)
-        n = c / math.sqrt(1 + ex2 * cos_lat * cos_lat)
+        n = _C_SMA / math.sqrt(1.0 + _EX2 * cos_lat * cos_lat)
         return Ecef(
             (n + self.alt) * cos_lat * math.cos(self.lon),
             (n + self.alt) * cos_lat * math.sin(self.lon),
-            (tmp * n + self.alt) * math.sin(self.lat),
+            (_ONE_MINUS_EFLAT_SQUARED * n + self.alt) * math.sin(self.lat),
         )
 
     def toEnu(self, origin: "Lla"):
@@ -89,15 +94,19 @@ class Lla:
         return Lla(self.lat + other.lat, self.lon + other.lon, self.alt + other.alt)
 
     def __eq__(self, other):
+        if not isinstance(other, Lla):
+            return NotImplemented
         return self.lat == other.lat and self.lon == other.lon and self.alt == other.alt
 
-    def __ne__(self, other):
-        return not (self == other)
+    def __hash__(self):
+        return hash((self.lat, self.lon, self.alt))
 
 
 class Enu:
     """An ENU (East, North, Up) coordinate."""
 
+    __slots__ = ("east", "north", "up")
+
     def __init__(self, east: float, north: float, up: float = 0):
         """
         Parameters
@@ -172,19 +181,23 @@ class Enu:
         return Enu(self.east + other.east, self.north + other.north, self.up + other.up)
 
     def __eq__(self, other):
+        if not isinstance(other, Enu):
+            return NotImplemented
         return (
             self.east == other.east
             and self.north == other.north
             and self.up == other.up
         )
 
-    def __ne__(self, other):
-        return not (self == other)
+    def __hash__(self):
+        return hash((self.east, self.north, self.up))
 
 
 class Ecef:
     """An ECEF (Earth Centered-Earth Fixed) coordinate."""
 
+    __slots__ = ("x", "y", "z")
+
     def __init__(self, x: float, y: float, z: float) -> None:
         self.x = x
         self.y = y
@@ -198,16 +211,25 @@ class Ecef:
         Lla
             The converted coordinates in LLA format.
         """
-        dist_to_z = math.sqrt(self.x * self.x + self.y * self.y)
-        lat = math.atan2(self.z, (1 - EECC_SQUARED) * dist_to_z)
-        for i in range(1, 5):
-            sin_lat = math.sin(lat)
-            radius_p = ESMAJ / math.sqrt(1.0 - EECC_SQUARED * sin_lat * sin_lat)
-            lat = math.atan2(self.z + EECC_SQUARED * radius_p * sin_lat, dist_to_z)
-        lon = math.atan2(self.y, self.x)
-        if toDegree(lat) < -85 or toDegree(lat) > 85:
-            L = self.z + EECC_SQUARED * radius_p * math.sin(lat)
-            alt = L / math.sin(lat) - radius_p
+        # Local names avoid global lookups in the iterations below
+        sin = math.sin
+        sqrt = math.sqrt
+        atan2 = math.atan2
+        ecc2 = EECC_SQUARED
+        x, y, z = self.x, self.y, self.z
+
+        dist_to_z = sqrt(x * x + y * y)
+        lat = atan2(z, _ONE_MINUS_EECC_SQUARED * dist_to_z)
+        for _ in range(4):
+            sin_lat = sin(lat)
+            radius_p = ESMAJ / sqrt(1.0 - ecc2 * sin_lat * sin_lat)
+            lat = atan2(z + ecc2 * radius_p * sin_lat, dist_to_z)
+        lon = atan2(y, x)
+        lat_deg = toDegree(lat)
+        if lat_deg < -85 or lat_deg > 85:
+            sin_lat = sin(lat)
+            L = z + ecc2 * radius_p * sin_lat
+            alt = L / sin_lat - radius_p
         else:
             alt = dist_to_z / math.cos(lat) - radius_p
         return Lla(lat, lon, alt)
@@ -219,13 +241,17 @@ class Ecef:
         return Lla(self.x + other.x, self.y + other.y, self.z + other.z)
 
     def __eq__(self, other):
+        if not isinstance(other, Ecef):
+            return NotImplemented
         return self.x == other.x and self.y == other.y and self.z == other.z
 
-    def __ne__(self, other):
-        return not (self == other)
+    def __hash__(self):
+        return hash((self.x, self.y, self.z))
 
 
 class Attitude:
+    __slots__ = ("yaw", "pitch", "roll")
+
     def __init__(self, yaw: float, pitch: float, roll: float) -> None:
         """
         Parameters
@@ -254,14 +280,16 @@ class Attitude:
         )
 
     def __eq__(self, other):
+        if not isinstance(other, Attitude):
+            return NotImplemented
         return (
             self.yaw == other.yaw
             and self.pitch == other.pitch
             and self.roll == other.roll
         )
 
-    def __ne__(self, other):
-        return not (self == other)
+    def __hash__(self):
+        return hash((self.yaw, self.pitch, self.roll))
 
     def yawDeg(self):
         return toDegree(self.yaw)
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+
+import math
+
+from .units import (
+    _C_SMA,
+    _EX2,
+    _ONE_MINUS_EECC_SQUARED,
+    _ONE_MINUS_EFLAT_SQUARED,
+    EECC_SQUARED,
+    ESMAJ,
+    Pi,
+)
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+def _batchKernel(signature: str):
+    # Without numba the conversions run as plain Python loops
+    if njit is None:
+        return lambda func: func
+    return njit(signature, parallel=True, fastmath=True, cache=True)
+
+
+_BATCH_SIGNATURE = "void(f8[::1], f8[::1], f8[::1], f8[::1], f8[::1], f8[::1])"
+
+
+def _checkLengths(*arrays) -> None:
+    # The compiled kernels don't check bounds, mismatched arrays would corrupt memory
+    length = len(arrays[0])
+    if any(len(array) != length for array in arrays):
+        raise ValueError("All coordinate arrays must have the same length.")
+
+
+@_batchKernel(_BATCH_SIGNATURE)
+def _llaToEcefKernel(lat, lon, alt, x, y, z):
+    for i in prange(len(lat)):
+        cos_lat = math.cos(lat[i])
+        n = _C_SMA / math.sqrt(1.0 + _EX2 * cos_lat * cos_lat)
+        x[i] = (n + alt[i]) * cos_lat * math.cos(lon[i])
+        y[i] = (n + alt[i]) * cos_lat * math.sin(lon[i])
+        z[i] = (_ONE_MINUS_EFLAT_SQUARED * n + alt[i]) * math.sin(lat[i])
+
+
+@_batchKernel(_BATCH_SIGNATURE)
+def _ecefToLlaKernel(x, y, z, lat, lon, alt):
+    for i in prange(len(x)):
+        dist_to_z = math.sqrt(x[i] * x[i] + y[i] * y[i])
+        lat_i = math.atan2(z[i], _ONE_MINUS_EECC_SQUARED * dist_to_z)
+        radius_p = ESMAJ
+        for _ in range(4):
+            sin_lat = math.sin(lat_i)
+            radius_p = ESMAJ / math.sqrt(1.0 - EECC_SQUARED * sin_lat * sin_lat)
+            lat_i = math.atan2(z[i] + EECC_SQUARED * radius_p * sin_lat, dist_to_z)
+        lat_deg = lat_i / Pi * 180.0
+        if lat_deg < -85 or lat_deg > 85:
+            sin_lat = math.sin(lat_i)
+            alt[i] = (z[i] + EECC_SQUARED * radius_p * sin_lat) / sin_lat - radius_p
+        else:
+            alt[i] = dist_to_z / math.cos(lat_i) - radius_p
+        lat[i] = lat_i
+        lon[i] = math.atan2(y[i], x[i])
+
+
+def llaToEcefBatch(lat, lon, alt, x, y, z) -> None:
+    """Convert LLA coordinate points into ECEF coordinate points, see Lla.toEcef.
+
+    When numba is installed, the conversion is compiled and runs in parallel. All
+    arguments must then be contiguous float64 NumPy arrays.
+
+    Parameters
+    ----------
+    lat, lon, alt : array of float
+        Latitudes and longitudes in radians, altitudes in meters
+    x, y, z : array of float
+        Output ECEF coordinates in meters
+
+    Raises
+    ------
+    ValueError
+        If the arrays don't all have the same length.
+    """
+    _checkLengths(lat, lon, alt, x, y, z)
+    _llaToEcefKernel(lat, lon, alt, x, y, z)
+
+
+def ecefToLlaBatch(x, y, z, lat, lon, alt) -> None:
+    """Convert ECEF coordinate points into LLA coordinate points, see Ecef.toLla.
+
+    When numba is installed, the conversion is compiled and runs in parallel. All
+    arguments must then be contiguous float64 NumPy arrays.
+
+    Parameters
+    ----------
+    x, y, z : array of float
+        ECEF coordinates in meters
+    lat, lon, alt : array of float
+        Output latitudes and longitudes in radians, altitudes in meters
+
+    Raises
+    ------
+    ValueError
+        If the arrays don't all have the same length.
+    """
+    _checkLengths(x, y, z, lat, lon, alt)
+    _ecefToLlaKernel(x, y, z, lat, lon, alt)